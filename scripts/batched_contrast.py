@@ -0,0 +1,146 @@
+"""Measure TEXT_PAIRS and COMPOSITED_PAIRS for many themes at once, with NumPy.
+
+The scalar audit in brand_themes works row by row: every pair converts its two
+tokens, every recipe blends its wash over its base and its foreground over
+that, and each one ends in a contrast ratio. That is fine for the two live
+themes and slow for a few hundred. Here each theme's tokens are packed into
+one row of a (themes, tokens, 3) HSL array, and the conversion to RGB, the
+blends and the contrast ratios are whole-array operations over every theme
+and every row at once.
+
+The arithmetic mirrors brand_themes operation for operation (the same
+expressions in the same order, round-half-even like round(), sRGB
+linearization of whole channels through a table built by srgb_lin itself, and
+the libm power for blended channels and for channels off the table), so the ratios are identical to the
+scalar path, not merely close. Tokens a theme
+does not define are NaN; brand_themes still decides which rows are reported
+and which are unknown tokens, so only the numbers come from here.
+
+NumPy is optional: brand_themes imports this module only for audit(...,
+batched=True) and audit-brand-themes.py --batched.
+"""
+
+from itertools import repeat
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+
+from brand_themes import COMPOSITED_PAIRS, TEXT_PAIRS, Theme, srgb_lin
+
+# Linear-light value of each 8-bit channel, exactly as srgb_lin computes it.
+_LINEAR = np.array([srgb_lin(c) for c in range(256)])
+
+
+def _token_index(themes: Sequence[Theme], pairs, recipes) -> Dict[str, int]:
+    index = {}
+    for theme in themes:
+        for token in theme.tokens:
+            index.setdefault(token, len(index))
+    for fg, bg, *_ in pairs:
+        index.setdefault(fg, len(index))
+        index.setdefault(bg, len(index))
+    for fg, _, wash, _, base, *_ in recipes:
+        for token in (fg, wash, base):
+            if token is not None:
+                index.setdefault(token, len(index))
+    return index
+
+
+def hsl_array(themes: Sequence[Theme], index: Dict[str, int]) -> np.ndarray:
+    """(themes, tokens, 3) HSL values; NaN where a theme does not define a color token."""
+    hsl = np.full((len(themes), len(index), 3), np.nan)
+    for row, theme in enumerate(themes):
+        for token, value in theme.tokens.items():
+            if token in theme:
+                hsl[row, index[token]] = value
+    return hsl
+
+
+def hsl_to_rgb(hsl: np.ndarray) -> np.ndarray:
+    """brand_themes.hsl_to_rgb over the last axis; 0-255 integer values as floats, NaN stays NaN."""
+    h, s, ll = hsl[..., 0], hsl[..., 1] / 100, hsl[..., 2] / 100
+    c = (1 - np.abs(2 * ll - 1)) * s
+    x = c * (1 - np.abs((h / 60) % 2 - 1))
+    m = ll - c / 2
+    zero = np.zeros_like(c)
+    sextant = [h < 60, h < 120, h < 180, h < 240, h < 300]
+    r = np.select(sextant, [c, x, zero, zero, x], c)
+    g = np.select(sextant, [x, c, c, x, zero], zero)
+    b = np.select(sextant, [zero, zero, x, c, c], x)
+    return np.rint(np.stack([(r + m) * 255, (g + m) * 255, (b + m) * 255], axis=-1))
+
+
+def _linear(channels: np.ndarray) -> np.ndarray:
+    c = channels / 255
+    # NumPy's vectorized power can differ from libm's in the last bit, which is
+    # enough to make a ratio differ from the scalar audit's, so the one power
+    # per channel is taken with float.__pow__ over the flattened array. Its
+    # base is clamped at 0: channels far enough below 0 (from an out-of-range
+    # saturation) take the linear branch anyway, and a negative base would
+    # make pow return a complex number.
+    curve = np.maximum((c + 0.055) / 1.055, 0).ravel().tolist()
+    curve = np.fromiter(map(pow, curve, repeat(2.4)), dtype=float, count=len(curve)).reshape(c.shape)
+    return np.where(c <= 0.04045, c / 12.92, curve)
+
+
+def _weigh(lin: np.ndarray) -> np.ndarray:
+    return 0.2126 * lin[..., 0] + 0.7152 * lin[..., 1] + 0.0722 * lin[..., 2]
+
+
+def token_luminance(rgb: np.ndarray) -> np.ndarray:
+    """Relative luminance of whole-channel colors, through the srgb_lin table.
+
+    Channels outside 0-255 (a token with a saturation or lightness beyond
+    100%) are off the table and linearized like blended ones.
+    """
+    defined = ~np.isnan(rgb)
+    tabled = defined & (rgb >= 0) & (rgb <= 255)
+    lin = _LINEAR[np.where(tabled, rgb, 0).astype(np.intp)]
+    outside = defined & ~tabled
+    if outside.any():
+        lin[outside] = _linear(rgb[outside])
+    return np.where(defined.all(axis=-1), _weigh(lin), np.nan)
+
+
+def luminance(rgb: np.ndarray) -> np.ndarray:
+    """Relative luminance of blended (fractional) colors."""
+    return _weigh(_linear(rgb))
+
+
+def contrast_ratio(l1: np.ndarray, l2: np.ndarray) -> np.ndarray:
+    return (np.maximum(l1, l2) + 0.05) / (np.minimum(l1, l2) + 0.05)
+
+
+def blend(over: np.ndarray, alpha: np.ndarray, base: np.ndarray) -> np.ndarray:
+    alpha = alpha[..., None]
+    return alpha * over + (1 - alpha) * base
+
+
+def contrast_tables(
+    themes: Sequence[Theme], pairs=TEXT_PAIRS, recipes=COMPOSITED_PAIRS,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """(themes, pairs) and (themes, recipes) contrast ratios, NaN where a token is missing.
+
+    Every recipe is measured in every theme; check_composited only reads the
+    ones for the theme's own mode.
+    """
+    index = _token_index(themes, pairs, recipes)
+    rgb = hsl_to_rgb(hsl_array(themes, index))
+    lum = token_luminance(rgb)
+
+    fg = [index[fg] for fg, *_ in pairs]
+    bg = [index[bg] for _, bg, *_ in pairs]
+    pair_ratios = contrast_ratio(lum[:, fg], lum[:, bg])
+
+    fg = [index[row[0]] for row in recipes]
+    fg_alpha = np.array([row[1] for row in recipes], dtype=float)
+    wash = [index[row[2]] if row[2] is not None else 0 for row in recipes]
+    washed = np.array([row[2] is not None for row in recipes])
+    wash_alpha = np.array([row[3] for row in recipes], dtype=float)
+    base = rgb[:, [index[row[4]] for row in recipes]]
+
+    surface = np.where(washed[:, None], blend(rgb[:, wash], wash_alpha, base), base)
+    ink = np.where((fg_alpha == 1)[:, None], rgb[:, fg], blend(rgb[:, fg], fg_alpha, surface))
+    recipe_ratios = contrast_ratio(luminance(ink), luminance(surface))
+    return pair_ratios, recipe_ratios
+
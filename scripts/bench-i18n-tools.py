@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Benchmark scan-hardcoded-strings.py and generate-sweep-report.py on synthetic corpora.
+Fails when throughput or peak memory regresses past the baseline.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from svelte_corpus import CorpusSpec, generate
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPTS_DIR.parent
+SCANNER = SCRIPTS_DIR / 'scan-hardcoded-strings.py'
+SWEEP_REPORT = SCRIPTS_DIR / 'generate-sweep-report.py'
+
+# Throughput and memory depend on the machine, so the default baseline is a
+# per-checkout file (gitignored) rather than a number everyone shares.
+DEFAULT_BASELINE = REPO_ROOT / '.i18n-bench-baseline.json'
+DEFAULT_THRESHOLD = 0.25
+# ru_maxrss is in kilobytes on Linux and in bytes on macOS.
+_RSS_UNIT = 1 if sys.platform == 'darwin' else 1024
+
+
+def corpus_dir(spec: CorpusSpec) -> Path:
+    """Where the corpus for `spec` lives; one directory per distinct spec, so runs reuse it."""
+    digest = hashlib.sha1(json.dumps(asdict(spec), sort_keys=True).encode()).hexdigest()[:10]
+    return Path(tempfile.gettempdir()) / 'i18n-bench' / f'{spec.scale:g}x-{digest}'
+
+
+def run_measured(command: List[str], cwd: Path) -> Tuple[float, int]:
+    """Run `command` to completion; return (wall seconds, peak RSS in bytes).
+
+    The child is reaped with os.wait4 so its resource usage is its own, not
+    the running maximum over every child this process has waited for.
+    """
+    started = time.perf_counter()
+    proc = subprocess.Popen(command, cwd=cwd, stdout=subprocess.DEVNULL)
+    _, status, usage = os.wait4(proc.pid, 0)
+    elapsed = time.perf_counter() - started
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, command)
+    return elapsed, usage.ru_maxrss * _RSS_UNIT
+
+
+def tree_size(root: Path, pattern: str) -> Tuple[int, int]:
+    """(file count, total bytes) of the files under `root` matching `pattern`."""
+    files = total = 0
+    for path in root.rglob(pattern):
+        files += 1
+        total += path.stat().st_size
+    return files, total
+
+
+def metrics(files: int, size: int, seconds: float, peak_rss: int, spec: CorpusSpec) -> dict:
+    return {
+        'files': files,
+        'bytes': size,
+        'seconds': round(seconds, 4),
+        'files_per_s': round(files / seconds, 1),
+        'mb_per_s': round(size / seconds / 1e6, 3),
+        'peak_rss_mb': round(peak_rss / 1e6, 1),
+        'corpus': asdict(spec),
+    }
+
+
+def bench_scale(spec: CorpusSpec, repeat: int = 3, jobs: int = 1) -> Dict[str, dict]:
+    """Benchmark both tools on the corpus for `spec`; keyed 'scanner@<scale>x' / 'sweep-report@<scale>x'.
+
+    Each tool runs `repeat` times; the fastest time and the largest peak RSS
+    are kept. The scanner runs with --no-cache so every run reads every file,
+    and with --no-history so repeated runs do not grow a history database.
+    Its MB/s is over the .svelte sources; the sweep report's is over the
+    i18n-scan-results.json it reads.
+    """
+    root = generate(spec, corpus_dir(spec))
+    scan = [
+        sys.executable, str(SCANNER), '--root', str(root), '--no-cache', '--no-history', '--jobs', str(jobs),
+    ]
+    report = [sys.executable, str(SWEEP_REPORT), '--root', str(root)]
+
+    results = {}
+    for name, command, measure_input in [
+        ('scanner', scan, lambda: tree_size(root / 'src', '*.svelte')),
+        ('sweep-report', report, lambda: (spec.files, (root / 'i18n-scan-results.json').stat().st_size)),
+    ]:
+        runs = [run_measured(command, root) for _ in range(repeat)]
+        seconds = min(elapsed for elapsed, _ in runs)
+        peak_rss = max(rss for _, rss in runs)
+        files, size = measure_input()
+        results[f'{name}@{spec.scale:g}x'] = metrics(files, size, seconds, peak_rss, spec)
+    return results
+
+
+def regressions(current: Dict[str, dict], baseline: Dict[str, dict], threshold: float) -> List[str]:
+    """Describe every benchmark that got slower or bigger than baseline allows.
+
+    Entries measured on a different corpus spec, or missing from the
+    baseline, are not compared.
+    """
+    problems = []
+    for key, now in current.items():
+        before = baseline.get(key)
+        if before is None or before.get('corpus') != now['corpus']:
+            continue
+        if now['files_per_s'] < before['files_per_s'] * (1 - threshold):
+            problems.append(
+                f"{key}: {now['files_per_s']} files/s, baseline {before['files_per_s']} "
+                f"(-{1 - now['files_per_s'] / before['files_per_s']:.0%})"
+            )
+        if now['peak_rss_mb'] > before['peak_rss_mb'] * (1 + threshold):
+            problems.append(
+                f"{key}: {now['peak_rss_mb']} MB peak RSS, baseline {before['peak_rss_mb']} "
+                f"(+{now['peak_rss_mb'] / before['peak_rss_mb'] - 1:.0%})"
+            )
+    return problems
+
+
+def load_baseline(path: Path) -> Dict[str, dict]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_baseline(path: Path, results: Dict[str, dict]) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def print_table(results: Dict[str, dict]) -> None:
+    print(f"{'benchmark':<22} {'files':>7} {'MB':>8} {'seconds':>8} {'files/s':>9} {'MB/s':>7} {'RSS MB':>7}")
+    print('-' * 74)
+    for key, m in results.items():
+        print(
+            f"{key:<22} {m['files']:>7} {m['bytes'] / 1e6:>8.1f} {m['seconds']:>8.3f} "
+            f"{m['files_per_s']:>9.1f} {m['mb_per_s']:>7.2f} {m['peak_rss_mb']:>7.1f}"
+        )
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument(
+        '--scales', type=float, nargs='+', default=[1, 10], metavar='N',
+        help='corpus sizes as multiples of the real 640-file tree (default: 1 10; try 1 10 100)',
+    )
+    defaults = CorpusSpec()
+    parser.add_argument(
+        '--density', type=float, default=defaults.density,
+        help=f'chance that a generated line holds a hardcoded string (default: {defaults.density})',
+    )
+    parser.add_argument(
+        '--outlier-rate', type=float, default=defaults.outlier_rate,
+        help=f'fraction of files that are long outliers (default: {defaults.outlier_rate})',
+    )
+    parser.add_argument('--seed', type=int, default=defaults.seed, help='corpus generator seed')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per tool; the fastest counts (default: 3)')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='passed to the scanner (default: 1)')
+    parser.add_argument(
+        '--baseline', type=Path, default=DEFAULT_BASELINE, metavar='PATH',
+        help=f'baseline JSON to compare against (default: {DEFAULT_BASELINE.name} in the repo root)',
+    )
+    parser.add_argument(
+        '--threshold', type=float, default=DEFAULT_THRESHOLD,
+        help=f'allowed slowdown / memory growth as a fraction (default: {DEFAULT_THRESHOLD})',
+    )
+    parser.add_argument(
+        '--update-baseline', action='store_true',
+        help='record this run as the new baseline instead of failing on regressions',
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    results = {}
+    for scale in args.scales:
+        spec = CorpusSpec(
+            scale=scale, density=args.density, outlier_rate=args.outlier_rate, seed=args.seed,
+        )
+        print(f"⏱️  {spec.files} files at {scale:g}x...")
+        results.update(bench_scale(spec, repeat=args.repeat, jobs=args.jobs))
+
+    print()
+    print_table(results)
+
+    baseline = load_baseline(args.baseline)
+    if args.update_baseline or not baseline:
+        save_baseline(args.baseline, {**baseline, **results})
+        print(f"\n✅ Baseline written to {args.baseline}")
+        sys.exit(0)
+
+    unseen = {key: m for key, m in results.items() if key not in baseline}
+    if unseen:
+        save_baseline(args.baseline, {**baseline, **unseen})
+        print(f"\n📝 Recorded {', '.join(unseen)} in {args.baseline}")
+
+    problems = regressions(results, baseline, args.threshold)
+    if problems:
+        print(f"\n❌ {len(problems)} regression(s) past {args.threshold:.0%}:")
+        for problem in problems:
+            print(f"   {problem}")
+        sys.exit(1)
+    print(f"\n✅ No regressions past {args.threshold:.0%} against {args.baseline}")
@@ -0,0 +1,228 @@
+"""Audit organizations' own brand colors, thousands of palettes at a time.
+
+Organizations can bring their own brand colors, which reach the page as token
+overrides on top of the default theme. audit-brand-themes.py --bulk reads
+those overrides from a JSON or JSONL file, one record per organization:
+
+    {"org": "acme", "light": {"primary": "12 80% 45%"}, "dark": {"primary": [12, 70, 65]}}
+
+A JSON file can also be a list of such records, or an object mapping each org
+to its {"light": ..., "dark": ...}. Values are `H S% L%` as app.css writes
+them, or [h, s, l]. The overrides are layered the way .dark already inherits
+from :root. An org's dark overrides fall back to its light ones. Each mode's
+overrides are then laid over that mode of the default theme.
+
+Only the rows that read an overridden token can change, so BulkAuditor
+measures the default theme once and then re-checks only those rows per org,
+through the ConstraintIndex from theme_fixes. The org themes are derived from
+the default ones and reuse their converted colors. Records are audited in
+batches on a process pool and streamed back in input order as JSONL:
+
+    {"org": "acme", "ok": false, "failures": [{"mode": "light", "check": ..., "value": 2.41, "need": 3.0}], "unknown": []}
+
+`unknown` lists overridden tokens the default theme does not define. A
+misspelt token silently does nothing in the browser, so it fails the record.
+A record that cannot be read (a value that is not a color, or one outside
+0-360 / 0-100%) fails on its own, without stopping the run:
+
+    {"org": "acme", "ok": false, "error": "light.primary: 170% saturation is not in 0-100"}
+
+The colorblind check simulates each deficiency at every one of the
+`severities` given, as the single-theme audit does.
+"""
+
+import json
+import re
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from brand_themes import FULL_SEVERITY, Theme, parse_themes
+from theme_fixes import ConstraintIndex
+
+HSL = Tuple[float, float, float]
+Overrides = Dict[str, Dict[str, HSL]]  # mode -> token -> HSL
+MODES = ("light", "dark")
+# How many records the bulk audit reads at a time; results stream per window.
+BULK_WINDOW = 4096
+JSONL_SUFFIXES = (".jsonl", ".ndjson")
+_HSL_RE = re.compile(r"^\s*([\d.]+)\s+([\d.]+)%\s+([\d.]+)%\s*$")
+
+
+class RecordError(ValueError):
+    """A record that could not be read; it is reported as failing, with the message."""
+
+
+# What read_overrides yields for each record.
+Record = Tuple[Optional[str], Union[Overrides, RecordError]]
+
+
+def parse_hsl(value) -> HSL:
+    if isinstance(value, str):
+        m = _HSL_RE.match(value)
+        if m is None:
+            raise ValueError(f"not an `H S% L%` value: {value!r}")
+        h, s, ll = float(m.group(1)), float(m.group(2)), float(m.group(3))
+    elif isinstance(value, (list, tuple)) and len(value) == 3:
+        h, s, ll = (float(v) for v in value)
+    else:
+        raise ValueError(f"not an `H S% L%` value or [h, s, l]: {value!r}")
+    if not 0 <= h <= 360:
+        raise ValueError(f"hue {h:g} is not in 0-360")
+    for name, v in (("saturation", s), ("lightness", ll)):
+        if not 0 <= v <= 100:
+            raise ValueError(f"{v:g}% {name} is not in 0-100")
+    return h, s, ll
+
+
+def _overrides(record: dict) -> Overrides:
+    overrides = {}
+    for mode in MODES:
+        tokens = record.get(mode) or {}
+        if not isinstance(tokens, dict):
+            raise ValueError(f"{mode}: not a token object: {tokens!r}")
+        overrides[mode] = {}
+        for token, value in tokens.items():
+            try:
+                overrides[mode][token.removeprefix("--")] = parse_hsl(value)
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"{mode}.{token}: {e}") from None
+    return overrides
+
+
+def _org(record: dict) -> str:
+    return str(record.get("org", record.get("id")))
+
+
+def _record(record, org: Optional[str] = None) -> Record:
+    """(org, overrides), or (org, RecordError) for a record that cannot be read."""
+    if not isinstance(record, dict):
+        return org, RecordError(f"not a record object: {record!r}")
+    if org is None:
+        org = _org(record)
+    try:
+        return org, _overrides(record)
+    except ValueError as e:
+        return org, RecordError(str(e))
+
+
+def read_overrides(path) -> Iterator[Record]:
+    """(org, overrides) for each record in a JSON or JSONL (.jsonl / .ndjson) file, in file order.
+
+    JSONL is read a line at a time, so a file of any size streams. A record
+    that cannot be read comes with a RecordError in place of its overrides
+    (and no org, for a JSONL line that is not JSON) rather than ending the run.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        if Path(path).suffix in JSONL_SUFFIXES:
+            for number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError as e:
+                    yield None, RecordError(f"line {number}: {e}")
+                    continue
+                yield _record(record)
+            return
+        data = json.load(f)
+    if isinstance(data, dict):
+        for org, record in data.items():
+            yield _record(record, str(org))
+    else:
+        for record in data:
+            yield _record(record)
+
+
+class BulkAuditor:
+    """Audits org overrides against the default theme's light and dark modes."""
+
+    def __init__(
+        self, themes: Dict[Tuple[str, str], Theme], index: Optional[ConstraintIndex] = None,
+        severities: Sequence[float] = (FULL_SEVERITY,),
+    ):
+        self.index = index or ConstraintIndex()
+        self.severities = severities
+        self.base = {mode: themes[("default", mode)] for mode in MODES if ("default", mode) in themes}
+        # What the default theme fails on its own, per mode; an org inherits
+        # those failures unless it overrides one of the row's tokens.
+        self.base_failures: Dict[str, List[dict]] = {}
+        for mode, theme in self.base.items():
+            failures = []
+            for constraint in self.index.constraints:
+                failure = self._failure(constraint, theme)
+                if failure is not None:
+                    failures.append((constraint, failure))
+            self.base_failures[mode] = failures
+
+    def _failure(self, constraint, theme: Theme) -> Optional[dict]:
+        value = constraint.measure(theme, self.severities)
+        if value is None or value >= constraint.need:
+            return None
+        return {"mode": theme.mode, "check": constraint.describe(), "value": round(value, 2), "need": constraint.need}
+
+    def audit_org(self, org: Optional[str], overrides: Union[Overrides, RecordError]) -> dict:
+        if isinstance(overrides, RecordError):
+            return {"org": org, "ok": False, "error": str(overrides)}
+        light = overrides.get("light", {})
+        layers = {"light": light, "dark": {**light, **overrides.get("dark", {})}}
+        failures, unknown = [], set()
+        for mode, theme in self.base.items():
+            layer = layers[mode]
+            unknown.update(token for token in layer if token not in theme)
+            touched = {id(c): c for token in layer for c in self.index.involving(token)}
+            failures += [failure for constraint, failure in self.base_failures[mode] if id(constraint) not in touched]
+            if not touched:
+                continue
+            org_theme = theme.derive(layer, brand=org)
+            for constraint in touched.values():
+                failure = self._failure(constraint, org_theme)
+                if failure is not None:
+                    failures.append(failure)
+        return {"org": org, "ok": not failures and not unknown, "failures": failures, "unknown": sorted(unknown)}
+
+    def audit_all(self, records: Iterable[Record]) -> List[dict]:
+        return [self.audit_org(org, overrides) for org, overrides in records]
+
+
+_worker: Optional[BulkAuditor] = None
+
+
+def _start_worker(css: str, severities: Sequence[float]) -> None:
+    global _worker
+    _worker = BulkAuditor(parse_themes(css), severities=severities)
+
+
+def _audit_batch(batch: List[Record]) -> List[dict]:
+    return _worker.audit_all(batch)
+
+
+def bulk_audit(
+    css: str, records: Iterable[Record], jobs: int = 1, severities: Sequence[float] = (FULL_SEVERITY,),
+) -> Iterator[dict]:
+    """Yield a pass/fail record per org, in input order, auditing on `jobs` processes.
+
+    Records are read BULK_WINDOW at a time and each window is cut into a few
+    batches per worker; Executor.map hands batches back in submission order.
+    """
+    records = iter(records)
+    with ExitStack() as stack:
+        if jobs > 1:
+            pool = stack.enter_context(ProcessPoolExecutor(
+                max_workers=jobs, initializer=_start_worker, initargs=(css, severities),
+            ))
+        else:
+            pool, auditor = None, BulkAuditor(parse_themes(css), severities=severities)
+        while True:
+            window = list(islice(records, BULK_WINDOW))
+            if not window:
+                break
+            if pool is None:
+                yield from auditor.audit_all(window)
+                continue
+            batch_size = max(1, -(-len(window) // (jobs * 4)))
+            batches = [window[i:i + batch_size] for i in range(0, len(window), batch_size)]
+            for results in pool.map(_audit_batch, batches):
+                yield from results
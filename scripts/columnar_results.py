@@ -0,0 +1,207 @@
+"""A compact, memory-mappable alternative to i18n-scan-results.json.
+
+The JSON is pretty-printed and spells out every path, priority label and
+sample string in full, file after file. This format stores each distinct
+string once, in a string table, and everything else as columns of
+little-endian uint32:
+
+    header     magic, version and the four sizes below
+    offsets    string table: S + 1 offsets into the UTF-8 blob
+    blob       the strings, back to back (padded to 4 bytes)
+    files      F paths, F priorities, F counts, F extras (string ids; extras
+               is the JSON of any other entry keys, e.g. suggestions),
+               F + 1 sample offsets: file i owns samples [first[i], first[i + 1])
+    samples    N lines, N texts (string ids)
+
+A reader maps the file and views the columns in place with memoryview.cast,
+so opening it costs the same whatever its size; strings are decoded the first
+time they are used and shared after that. Entries convert both ways without
+loss: to_json writes the same bytes json.dump(..., indent=2) does.
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Dict, Iterator, Optional, Tuple
+
+from sweep_model import FileResult
+
+MAGIC = b'I18NCOLS'
+VERSION = 1
+COLUMNAR_RESULTS_FILE = 'i18n-scan-results.cols'
+_HEADER = struct.Struct('<8sIIIII')  # magic, version, strings, files, samples, blob bytes
+_NONE = 0xFFFFFFFF
+_ENTRY_KEYS = ('priority', 'count', 'strings')
+
+# 'I' is 32 bits on every platform CPython supports; 'L' is the fallback.
+_UINT32 = 'I' if array('I').itemsize == 4 else 'L'
+_LITTLE = sys.byteorder == 'little'
+
+
+def _as_entries(results) -> Iterator[Tuple[str, dict]]:
+    if isinstance(results, dict):
+        results = results.items()
+    for item in results:
+        if isinstance(item, FileResult):
+            yield item.path, item.to_entry()
+        else:
+            yield item
+
+
+def _write_column(f, column: array) -> None:
+    if not _LITTLE:
+        column = array(_UINT32, column)
+        column.byteswap()
+    column.tofile(f)
+
+
+def write_columnar(results, path=COLUMNAR_RESULTS_FILE) -> None:
+    """Write results (a dict, (file, entry) pairs or FileResults) to `path`, atomically."""
+    ids = {}
+    blob = bytearray()
+    offsets = array(_UINT32, [0])
+
+    def string_id(text: str) -> int:
+        found = ids.get(text)
+        if found is None:
+            found = ids[text] = len(offsets) - 1
+            blob.extend(text.encode('utf-8'))
+            offsets.append(len(blob))
+        return found
+
+    paths, priorities, counts, extras = (array(_UINT32) for _ in range(4))
+    first = array(_UINT32, [0])
+    lines, texts = array(_UINT32), array(_UINT32)
+    for file_path, entry in _as_entries(results):
+        paths.append(string_id(file_path))
+        priorities.append(string_id(entry['priority']))
+        counts.append(entry['count'])
+        rest = {key: value for key, value in entry.items() if key not in _ENTRY_KEYS}
+        extras.append(string_id(json.dumps(rest, ensure_ascii=False)) if rest else _NONE)
+        for line_num, text in entry['strings']:
+            lines.append(line_num)
+            texts.append(string_id(text))
+        first.append(len(lines))
+
+    blob.extend(b'\0' * (-len(blob) % 4))
+    tmp = f'{path}.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, len(offsets) - 1, len(paths), len(lines), len(blob)))
+        _write_column(f, offsets)
+        f.write(blob)
+        for column in (paths, priorities, counts, extras, first, lines, texts):
+            _write_column(f, column)
+    os.replace(tmp, path)
+
+
+class ColumnarResults:
+    """A columnar results file, memory-mapped; iterate it for FileResults or call items() for JSON entries."""
+
+    def __init__(self, path=COLUMNAR_RESULTS_FILE):
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, strings, files, samples, blob_size = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError(f'{path} is not a version {VERSION} columnar results file')
+        self._view = memoryview(self._map)
+        self._columns = []
+        pos = _HEADER.size
+        self._offsets, pos = self._column(pos, strings + 1)
+        self._blob = self._view[pos:pos + blob_size]
+        pos += blob_size
+        self.paths, pos = self._column(pos, files)
+        self.priorities, pos = self._column(pos, files)
+        self.counts, pos = self._column(pos, files)
+        self.extras, pos = self._column(pos, files)
+        self.first, pos = self._column(pos, files + 1)
+        self.lines, pos = self._column(pos, samples)
+        self.texts, pos = self._column(pos, samples)
+        self._strings = [None] * strings
+
+    def _column(self, pos: int, length: int):
+        raw = self._view[pos:pos + 4 * length]
+        if _LITTLE and _UINT32 == 'I':
+            column = raw.cast('I')
+            self._columns.append(column)
+        else:
+            column = array(_UINT32, bytes(raw))
+            if not _LITTLE:
+                column.byteswap()
+        return column, pos + 4 * length
+
+    def string(self, string_id: int) -> str:
+        text = self._strings[string_id]
+        if text is None:
+            start, end = self._offsets[string_id], self._offsets[string_id + 1]
+            text = self._strings[string_id] = sys.intern(str(self._blob[start:end], 'utf-8'))
+        return text
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def __iter__(self) -> Iterator[FileResult]:
+        return self.results()
+
+    def results(self, sample_limits: Optional[Dict[str, int]] = None) -> Iterator[FileResult]:
+        """Yield the FileResults in file order.
+
+        With `sample_limits` (priority -> samples to keep, 0 for priorities not
+        listed) only those samples are decoded, so a reader that prints a few
+        strings per file does not pay for the rest.
+        """
+        string, lines, texts, first = self.string, self.lines, self.texts, self.first
+        limits = {}
+        for i in range(len(self.paths)):
+            priority_id = self.priorities[i]
+            start, end = first[i], first[i + 1]
+            if sample_limits is not None:
+                limit = limits.get(priority_id)
+                if limit is None:
+                    limit = limits[priority_id] = sample_limits.get(string(priority_id), 0)
+                end = min(end, start + limit)
+            samples = tuple((lines[j], string(texts[j])) for j in range(start, end))
+            yield FileResult(string(self.paths[i]), string(priority_id), self.counts[i], samples)
+
+    def items(self) -> Iterator[Tuple[str, dict]]:
+        """(file, entry) pairs exactly as i18n-scan-results.json holds them."""
+        for i, result in enumerate(self):
+            entry = result.to_entry()
+            if self.extras[i] != _NONE:
+                entry.update(json.loads(self.string(self.extras[i])))
+            yield result.path, entry
+
+    def close(self) -> None:
+        for column in self._columns:
+            column.release()
+        self._blob.release()
+        self._view.release()
+        self._map.close()
+
+    def __enter__(self) -> 'ColumnarResults':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def to_json(columnar_path, json_path) -> None:
+    """Convert a columnar results file to i18n-scan-results.json."""
+    with ColumnarResults(columnar_path) as results:
+        entries = dict(results.items())
+    with open(json_path, 'w') as f:
+        json.dump(entries, f, indent=2)
+
+
+def from_json(json_path, columnar_path) -> None:
+    """Convert i18n-scan-results.json to a columnar results file."""
+    with open(json_path, 'r', encoding='utf-8') as f:
+        write_columnar(json.load(f), columnar_path)
+
+
+def is_columnar(path) -> bool:
+    with open(path, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
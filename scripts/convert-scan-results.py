@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""
+Convert scan results between i18n-scan-results.json and the columnar format.
+
+The direction follows the input: a columnar file is written out as JSON and
+a JSON file as columnar. Round trips are lossless.
+"""
+
+import argparse
+from pathlib import Path
+
+from columnar_results import from_json, is_columnar, to_json
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n\n')[0])
+    parser.add_argument('source', type=Path, help='i18n-scan-results.json or a columnar results file')
+    parser.add_argument('target', type=Path, help='where to write the other format')
+    args = parser.parse_args()
+
+    if is_columnar(args.source):
+        to_json(args.source, args.target)
+        print(f"✅ Wrote {args.target} (JSON) from {args.source}")
+    else:
+        from_json(args.source, args.target)
+        print(f"✅ Wrote {args.target} (columnar) from {args.source}")
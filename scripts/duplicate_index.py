@@ -0,0 +1,126 @@
+"""Which hardcoded strings appear in more than one place, and where.
+
+The scanner drops repeats of a string within one file, but the same phrase
+hardcoded in twenty components is still twenty entries in the sweep report,
+when a single new message key would fix all of them. DuplicateIndex is fed
+every file's findings during the scan and maps each normalized string to all
+of its locations, so the report can rank strings by how many places one key
+would fix.
+
+Strings are normalized the way the --gate baseline and the scan history
+fingerprint them (whitespace collapsed), memoized per distinct text, so the
+index costs a dict lookup and two array appends per finding. Locations are
+packed as (file number, line) pairs in an array per string, 8 bytes each.
+"""
+
+import json
+from array import array
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+DUPLICATES_FILE = 'i18n-scan-duplicates.json'
+
+Location = Tuple[str, int]  # (results key, line)
+
+
+class DuplicateIndex:
+    """Normalized string -> every (file, line) it was found at, in scan order."""
+
+    def __init__(self):
+        self.files: List[str] = []
+        self._file_numbers: Dict[str, int] = {}
+        # Normalized string -> [file number, line, file number, line, ...]
+        self._locations: Dict[str, array] = {}
+        # The first spelling seen of each normalized string, for display.
+        self.texts: Dict[str, str] = {}
+        self._normalized: Dict[str, str] = {}
+
+    def normalize(self, text: str) -> str:
+        key = self._normalized.get(text)
+        if key is None:
+            key = self._normalized[text] = ' '.join(text.split())
+        return key
+
+    def _file_number(self, file_key: str) -> int:
+        number = self._file_numbers.get(file_key)
+        if number is None:
+            number = self._file_numbers[file_key] = len(self.files)
+            self.files.append(file_key)
+        return number
+
+    def _packed(self, text: str) -> array:
+        key = self.normalize(text)
+        packed = self._locations.get(key)
+        if packed is None:
+            packed = self._locations[key] = array('I')
+            self.texts[key] = text
+        return packed
+
+    def add(self, file_key: str, findings: Iterable[Tuple[int, str]]) -> None:
+        """Record a file's (line, text, ...) findings."""
+        number = None
+        for line_num, text, *_ in findings:
+            if number is None:
+                number = self._file_number(file_key)
+            packed = self._packed(text)
+            packed.append(number)
+            packed.append(line_num)
+
+    def discard(self, file_key: str) -> None:
+        """Forget every location in `file_key`, before it is re-added after a rescan or when it is gone."""
+        number = self._file_numbers.get(file_key)
+        if number is None:
+            return
+        for key, packed in list(self._locations.items()):
+            if number not in packed[::2]:
+                continue
+            kept = array('I')
+            for i in range(0, len(packed), 2):
+                if packed[i] != number:
+                    kept.append(packed[i])
+                    kept.append(packed[i + 1])
+            if kept:
+                self._locations[key] = kept
+            else:
+                del self._locations[key]
+                del self.texts[key]
+
+    def places(self, text: str) -> int:
+        packed = self._locations.get(self.normalize(text))
+        return len(packed) // 2 if packed else 0
+
+    def locations(self, text: str) -> Iterator[Location]:
+        """Every (file, line) `text` was found at, in scan order."""
+        packed = self._locations.get(self.normalize(text), ())
+        for i in range(0, len(packed), 2):
+            yield self.files[packed[i]], packed[i + 1]
+
+    def ranked(self, min_places: int = 2) -> List[Tuple[str, int]]:
+        """(text, places) of the strings found in at least `min_places` places, most places first."""
+        shared = [
+            (key, len(packed) // 2) for key, packed in self._locations.items() if len(packed) >= 2 * min_places
+        ]
+        shared.sort(key=lambda item: (-item[1], item[0]))
+        return [(self.texts[key], places) for key, places in shared]
+
+    def write(self, path=DUPLICATES_FILE) -> None:
+        """Write the shared strings, ranked, as {text: [[file, line], ...]}, one string at a time."""
+        dumps = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('{')
+            for i, (text, _) in enumerate(self.ranked()):
+                f.write(f'{"," if i else ""}\n{dumps(text)}:{dumps(list(self.locations(text)))}')
+            f.write('\n}\n')
+
+    @classmethod
+    def load(cls, path=DUPLICATES_FILE) -> 'DuplicateIndex':
+        index = cls()
+        with open(path, 'r', encoding='utf-8') as f:
+            for text, places in json.load(f).items():
+                index.add_locations(text, places)
+        return index
+
+    def add_locations(self, text: str, places: Iterable[Location]) -> None:
+        packed = self._packed(text)
+        for file_key, line_num in places:
+            packed.append(self._file_number(file_key))
+            packed.append(line_num)
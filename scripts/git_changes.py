@@ -0,0 +1,95 @@
+"""What git says changed: the files and lines behind --since, and the commit a scan ran at.
+
+All of it shells out to git and parses its -z / -U0 output; which files
+count is up to the SourceWalker the caller passes.
+"""
+
+import codecs
+import re
+import subprocess
+from typing import Optional
+
+from source_tree import SourceWalker
+
+
+def _git(*args: str) -> str:
+    return subprocess.run(
+        ['git', *args], check=True, capture_output=True, text=True, encoding='utf-8',
+    ).stdout
+
+
+def _unquote_git_path(path: str) -> str:
+    """Undo git's C-style quoting of unusual paths ("a\\303\\251.svelte")."""
+    if path.startswith('"') and path.endswith('"'):
+        return codecs.escape_decode(path[1:-1].encode())[0].decode('utf-8')
+    return path
+
+
+_HUNK_HEADER = re.compile(r'^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@')
+
+
+def git_changes(ref: str, walker: Optional[SourceWalker] = None):
+    """Ask git which source files (those `walker` selects) changed since `ref`, and where.
+
+    Compares the merge base of `ref` and HEAD with the working tree, so commits
+    that landed on `ref` after the branch point are not counted as ours. Returns
+    (changed, removed): `changed` maps each added, modified, renamed or
+    type-changed file (a symlink replaced by a regular file, say) to the set of
+    its new-side line numbers that were added or modified (None for an
+    untracked file: all of it is new); `removed` lists paths that no longer
+    exist under that name (deleted, or the old side of a rename).
+    """
+    walker = walker or SourceWalker()
+    base = _git('merge-base', ref, 'HEAD').strip()
+    # Diff only below the include globs' anchors; the walker's rules pick the files.
+    pathspec = sorted(prefix or '.' for prefix in walker.prefixes)
+    changed, removed = {}, []
+
+    fields = _git(
+        'diff', '--name-status', '-z', '-M', '--relative', base, '--', *pathspec
+    ).split('\0')
+    i = 0
+    while i < len(fields) - 1:
+        status = fields[i]
+        if status.startswith('R'):
+            old, new = fields[i + 1], fields[i + 2]
+            if walker.selects(old):
+                removed.append(old)
+            if walker.selects(new):
+                changed[new] = set()
+            i += 3
+            continue
+        path = fields[i + 1]
+        if walker.selects(path):
+            if status.startswith('D'):
+                removed.append(path)
+            elif status[:1] in ('A', 'M', 'T'):
+                changed[path] = set()
+        i += 2
+
+    current = None
+    for line in _git(
+        'diff', '-U0', '--no-color', '--no-prefix', '-M', '--relative', base, '--', *pathspec
+    ).splitlines():
+        if line.startswith('+++ '):
+            current = _unquote_git_path(line[4:])
+        elif line.startswith('@@') and current in changed:
+            hunk = _HUNK_HEADER.match(line)
+            start, count = int(hunk.group(1)), int(hunk.group(2) or 1)
+            changed[current].update(range(start, start + count))
+
+    for path in _git(
+        'ls-files', '-z', '--others', '--exclude-standard', '--', *pathspec
+    ).split('\0'):
+        if path and walker.selects(path):
+            changed[path] = None
+
+    return changed, removed
+
+
+def current_commit() -> Optional[str]:
+    """The short hash of HEAD, or None outside a git checkout."""
+    try:
+        return _git('rev-parse', '--short', 'HEAD').strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
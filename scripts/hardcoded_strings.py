@@ -0,0 +1,1122 @@
+"""
+Scan the .svelte components under src/ and the TypeScript modules under
+src/lib/ for hardcoded strings that need i18n translation.
+Generates a comprehensive report for the i18n sweep.
+
+The library behind scripts/scan-hardcoded-strings.py. scan_file_results
+yields typed FileResults for the sweep report to aggregate in-process;
+i18n-scan-results.json is one output of a scan, not the way to hand it on.
+The findings cache, the --gate baseline, the git plumbing behind --since and
+the --watch loop live in scan_cache, scan_gate, git_changes and scan_watch.
+"""
+
+import argparse
+import hashlib
+import heapq
+import re
+import os
+import sys
+import time
+from bisect import bisect_right
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from itertools import accumulate, islice
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+import json
+
+from columnar_results import COLUMNAR_RESULTS_FILE, write_columnar
+from duplicate_index import DuplicateIndex
+from git_changes import current_commit, git_changes
+from message_index import MessageIndex
+from scan_cache import DEFAULT_CACHE, ScanCache
+from scan_history import DEFAULT_HISTORY, HistoryStore, fingerprint
+from source_tree import DEFAULT_EXCLUDE, DEFAULT_INCLUDE, SourceWalker
+from svelte_sections import MARKUP, SCRIPT, lex, lex_script
+from sweep_model import FileResult
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Patterns to identify hardcoded English strings, as (rule id, regex). The id
+# names the rule's group in the compiled alternation below, so it must be a
+# valid Python identifier.
+PATTERNS = [
+    # Quoted strings that look like English text (capital letter start, spaces, common words)
+    ('quoted_double', r'"([A-Z][a-z\s,\']{4,})"'),
+    ('quoted_single', r"'([A-Z][a-z\s,\']{4,})'"),
+    # Common error/success message patterns
+    ('failed_to', r'(Failed to \w+)'),
+    ('successfully', r'(Successfully \w+)'),
+    ('error_message', r'(Error:? [A-Z][a-z\s]+)'),
+    ('unable_to', r'(Unable to \w+)'),
+    ('please', r'(Please \w+)'),
+    ('are_you_sure', r'(Are you sure)'),
+    ('do_you_want', r'(Do you want)'),
+]
+
+# Patterns to EXCLUDE (false positives), as (rule id, regex)
+EXCLUDE_PATTERNS = [
+    ('import_stmt', r'import\s+'),
+    ('from_clause', r'from\s+["\']'),
+    ('i18n_call', r'm\['),  # Already using i18n
+    ('aria_attr', r'aria-'),
+    ('class_attr', r'class='),
+    ('id_attr', r'id='),
+    ('name_attr', r'name='),
+    ('type_attr', r'type='),
+    ('placeholder_attr', r'placeholder='),  # Will check these separately
+    ('svelte_path', r'\.svelte'),
+    ('rune', r'^\$'),  # Svelte stores/runes
+    ('url', r'http[s]?://'),
+    ('number', r'^\d+$'),  # Numbers
+]
+
+# Common false positive strings to skip
+FALSE_POSITIVES = {
+    'Check', 'Submit', 'Cancel', 'Delete', 'Edit', 'Save', 'Close',
+    'Loading', 'Error', 'Success', 'Warning', 'Info',
+    'Yes', 'No', 'OK', 'Back', 'Next', 'Previous',
+}
+
+
+def _leading_literal(pattern: str):
+    """Return the one character every match of `pattern` must start with, or None.
+
+    Deliberately conservative: only plain patterns (no alternation, no leading
+    quantifier, class or anchor) get an answer. None just means "no guard".
+    """
+    if '|' in pattern:
+        return None
+    body = re.sub(r'^(?:\((?:\?:|\?P<\w+>)?)+', '', pattern)
+    if body[:1] == '\\' and len(body) > 1 and not body[1].isalnum():
+        lead, rest = body[1], body[2:]
+    elif body[:1] and body[0] not in '.^$*+?{}[]()\\':
+        lead, rest = body[0], body[1:]
+    else:
+        return None
+    if rest[:1] in ('?', '*', '{'):
+        return None
+    return lead
+
+
+def _alternation(rules) -> re.Pattern:
+    """Compile (rule_id, regex) pairs into one alternation of named groups.
+
+    When every rule starts with a known literal, the alternation is prefixed
+    with a lookahead on those characters: `re` cannot derive that prefix through
+    named groups itself, and without it every branch is tried at every offset.
+    """
+    branches = '|'.join(f'(?P<{rule_id}>{pattern})' for rule_id, pattern in rules)
+    leads = [_leading_literal(pattern) for _, pattern in rules]
+    if None in leads:
+        return re.compile(branches)
+    charset = ''.join(sorted({re.escape(lead) for lead in leads}))
+    return re.compile(f'(?=[{charset}])(?:{branches})')
+
+
+class RuleMatcher:
+    """The include and exclude rule sets, compiled once for a single pass per line.
+
+    Each rule set is joined into one named-group alternation. A line that the
+    include alternation cannot match anywhere has no findings, so most lines cost
+    a single search. A line that the exclude alternation matches anywhere has
+    every one of its matches suppressed, so exclusion is decided once per line
+    rather than once per match. Only lines that survive both screens run the
+    individual include rules, which keeps the findings (and their order)
+    identical to running every pattern with `re.finditer` on its own.
+    """
+
+    def __init__(self, include, exclude):
+        self.include = [(rule_id, re.compile(pattern)) for rule_id, pattern in include]
+        self.include_any = _alternation(include)
+        self.exclude_any = _alternation(exclude)
+
+    def excluding_rule(self, line: str):
+        """Return the id of the first exclude rule that matches `line`, or None."""
+        match = self.exclude_any.search(line)
+        return match.lastgroup if match else None
+
+    def scan_line(self, line: str):
+        """Yield (offset, rule_id, text) for every include match on `line` that is kept."""
+        if self.include_any.search(line) is None:
+            return
+        if self.exclude_any.search(line) is not None:
+            return
+        for rule_id, regex in self.include:
+            for match in regex.finditer(line):
+                group = 1 if regex.groups else 0
+                text = match.group(group).strip('"\'')
+                if not is_false_positive(text):
+                    yield match.start(group), rule_id, text
+
+    def scan_text_nodes(self, content: str, start: int, end: int):
+        """Yield (match, text) for every kept `>Text<` node in content[start:end]."""
+        for match in HTML_TEXT_PATTERN.finditer(content, start, end):
+            text = match.group(1).strip()
+            if not any(char in text for char in ['{', '}', '$', '@']) and text not in FALSE_POSITIVES:
+                yield match, text
+
+
+def false_positive_reason(match: str) -> Optional[str]:
+    """Why a matched string is never user-facing, whatever line it is on; None if it may be."""
+    # Check if match is a common false positive
+    if match.strip() in FALSE_POSITIVES:
+        return 'false_positive'
+
+    # Skip if it's a translation key (contains dots or underscores)
+    if '.' in match or '_' in match:
+        return 'translation_key'
+
+    # Skip very short strings (likely not user-facing)
+    if len(match.strip()) < 4:
+        return 'too_short'
+
+    return None
+
+
+def is_false_positive(match: str) -> bool:
+    """Check if a matched string is never user-facing, whatever line it is on."""
+    return false_positive_reason(match) is not None
+
+
+MATCHER = RuleMatcher(PATTERNS, EXCLUDE_PATTERNS)
+
+# Text content in HTML: text between > and < that looks like English
+HTML_TEXT_PATTERN = re.compile(r'>([A-Z][a-zA-Z\s,\.!?]{5,})<')
+
+
+def should_exclude(line: str, match: str) -> bool:
+    """Check if a matched string should be excluded."""
+    return MATCHER.excluding_rule(line) is not None or is_false_positive(match)
+
+def read_source(data: bytes) -> str:
+    """Decode a file's bytes the way text-mode open() does (UTF-8, universal newlines)."""
+    return data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+
+def split_lines(content: str) -> List[str]:
+    """Split on '\n' only, keeping line ends, exactly like readlines()."""
+    lines = [line + '\n' for line in content.split('\n')]
+    lines[-1] = lines[-1][:-1]
+    if not lines[-1]:
+        lines.pop()
+    return lines
+
+
+class LineIndex:
+    """Start offset of every line of a text, for offset-to-line lookups.
+
+    Built once per file from its lines, so finding the line of a match is a
+    binary search instead of counting the newlines in everything before it.
+    """
+
+    def __init__(self, lines: List[str]):
+        self.starts = [0, *accumulate(map(len, lines))]
+
+    def line_of(self, offset: int) -> int:
+        """1-based line number of the character at `offset`."""
+        return bisect_right(self.starts, offset)
+
+
+# The regions of a file each pass reads (see svelte_sections). Style blocks,
+# comments and import declarations are in neither, so they never reach a regex.
+LINE_PASS_REGIONS = {MARKUP, SCRIPT}
+HTML_PASS_REGIONS = {MARKUP}
+
+
+# A finding as the pipeline carries it: (line, text, column, rule id). Line and
+# text come first so code that only wants the (line, text) pair can index it.
+Finding = Tuple[int, str, int, str]
+HTML_TEXT_RULE = 'html_text'
+
+
+# Per-extension rule sets, expressed as the lexer that splits a file into
+# regions: the line rules run on markup and script regions and the HTML text
+# rule on markup only, so a TypeScript module (.ts, .svelte.ts), which lex_script
+# reads as one script body, gets the line rules and no html_text pass.
+LEXERS = {'.svelte': lex, '.ts': lex_script}
+
+
+def scan_findings(
+    content: str, matcher: Optional[RuleMatcher] = None, lexer=lex
+) -> List[Finding]:
+    """Extract hardcoded strings, with their 1-based column and rule, from a source file.
+
+    The file is split into regions by `lexer` (svelte_sections.lex for a
+    component, lex_script for a module; see LEXERS). The per-line pass
+    reads the part of each line that falls inside markup or script; the HTML
+    text pass reads markup only, since `>Text<` inside a script body is an arrow
+    function or a comparison, not a text node. Both work off this one decoded
+    string, with offsets mapped back to lines through a LineIndex. `matcher`
+    defaults to MATCHER; --profile passes a ProfilingMatcher.
+    """
+    matcher = matcher or MATCHER
+    findings = []
+    index = LineIndex(split_lines(content))
+    regions = [region for region in lexer(content) if region[0] in LINE_PASS_REGIONS]
+
+    for _kind, start, end in regions:
+        line_num = index.line_of(start)
+        while start < end:
+            newline = content.find('\n', start, end)
+            stop = end if newline == -1 else newline + 1
+            column = start - index.starts[line_num - 1] + 1
+            for offset, rule_id, text in matcher.scan_line(content[start:stop]):
+                findings.append((line_num, text, column + offset, rule_id))
+            start, line_num = stop, line_num + 1
+
+    # Also check for text content in HTML (between tags). The window reaches one
+    # character past each side so a tag bracket owned by a neighbouring region
+    # (`</script>`, `<!--`) still delimits the text.
+    for kind, start, end in regions:
+        if kind not in HTML_PASS_REGIONS:
+            continue
+        for match, text in matcher.scan_text_nodes(content, max(start - 1, 0), end + 1):
+            line_num = index.line_of(match.start())
+            column = match.start(1) - index.starts[line_num - 1] + 1
+            findings.append((line_num, text, column, HTML_TEXT_RULE))
+
+    # Deduplicate findings
+    seen = set()
+    unique_findings = []
+    for finding in findings:
+        if finding[1] not in seen:
+            seen.add(finding[1])
+            unique_findings.append(finding)
+
+    return unique_findings
+
+
+def scan_source(content: str) -> List[Tuple[int, str]]:
+    """Extract hardcoded strings from the text of a Svelte file, as (line, text)."""
+    return [(line_num, text) for line_num, text, *_ in scan_findings(content)]
+
+
+def extract_hardcoded_strings(file_path: Path) -> List[Tuple[int, str]]:
+    """Extract hardcoded strings from a Svelte file."""
+    return [(line_num, text) for line_num, text, *_ in scan_path(file_path)[1]]
+
+
+def scan_path(
+    file_path: Path, known_digest: Optional[str] = None, matcher: Optional[RuleMatcher] = None
+):
+    """Read, hash and scan one file, reading it exactly once.
+
+    Returns (digest, findings). When the content digest equals `known_digest`
+    the scan is skipped and findings is None: the caller already has them. A
+    file that cannot be read or decoded yields (None, []), which is not cached.
+    """
+    try:
+        data = Path(file_path).read_bytes()
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        if digest == known_digest:
+            return digest, None
+        lexer = LEXERS.get(Path(file_path).suffix, lex)
+        return digest, scan_findings(read_source(data), matcher, lexer)
+    except Exception as e:
+        print(f"Error reading {file_path}: {e}")
+        return None, []
+
+
+def classify_priority(file_path: Path, strings: List[Finding]) -> str:
+    """Classify priority based on file path and content."""
+    path_str = str(file_path)
+
+    # HIGH priority: Public-facing, auth, events, organizations
+    if any(keyword in path_str for keyword in [
+        '(public)', 'events/', 'organizations/', 'login', 'register',
+        'dashboard', 'EventCard', 'OrganizationCard', 'Header', 'Footer',
+        'Navigation', 'Landing'
+    ]):
+        return '🔴 HIGH'
+
+    # MEDIUM priority: Admin, forms, modals
+    if any(keyword in path_str for keyword in [
+        'admin/', 'forms/', 'Modal', 'Dialog', 'members/', 'questionnaires/'
+    ]):
+        return '🟡 MED'
+
+    # LOW priority: UI components, utilities
+    if any(keyword in path_str for keyword in [
+        'ui/', 'utils/', 'types', 'skeleton', 'Badge', 'Button'
+    ]):
+        return '🟢 LOW'
+
+    # Default to MEDIUM if uncertain
+    return '🟡 MED'
+
+# Bump when the scanning logic changes in a way the rules fingerprint cannot see.
+CACHE_VERSION = 3
+
+
+def rules_fingerprint() -> str:
+    """Hash of everything that decides a file's findings besides its content."""
+    rules = [
+        CACHE_VERSION, PATTERNS, EXCLUDE_PATTERNS,
+        sorted(FALSE_POSITIVES), HTML_TEXT_PATTERN.pattern,
+    ]
+    return hashlib.blake2b(json.dumps(rules).encode(), digest_size=16).hexdigest()
+
+
+def load_cache(path=DEFAULT_CACHE) -> ScanCache:
+    """The scan cache at `path`, discarded if it was written under other rules."""
+    return ScanCache(path, rules_fingerprint()).load()
+
+
+def scan_batch(items: List[Tuple[Path, Optional[str]]]):
+    """Scan one batch of (path, known digest) in a worker process, preserving its order."""
+    return [scan_path(path, known_digest) for path, known_digest in items]
+
+
+def _scan_items(
+    items: List[Tuple[Path, Optional[str]]], pool: Optional[ProcessPoolExecutor], jobs: int = 1
+):
+    """Run scan_path over items, on `pool` when one is given; results keep item order.
+
+    With a pool the list is cut into contiguous batches (a few per worker, so
+    one slow batch does not hold up the pool). `Executor.map` hands batches back
+    in submission order, so the merged stream is the same as a serial scan.
+    """
+    if pool is None or len(items) < 2:
+        for path, known_digest in items:
+            yield scan_path(path, known_digest)
+        return
+
+    batch_size = max(1, -(-len(items) // (jobs * 4)))
+    batches = [items[i:i + batch_size] for i in range(0, len(items), batch_size)]
+    for batch_results in pool.map(scan_batch, batches):
+        yield from batch_results
+
+
+# How many paths scan_files takes from its input at a time. Findings are held
+# for one window, not for the whole tree.
+SCAN_WINDOW = 512
+
+
+def scan_files(
+    paths: Iterable[Path], jobs: int = 1, cache: Optional[ScanCache] = None, save_cache: bool = True,
+) -> Iterator[Tuple[Path, List[Finding]]]:
+    """Yield (path, findings) for every path, in the order given.
+
+    Paths are consumed SCAN_WINDOW at a time and each window is handed back
+    before the next is read, so a consumer that writes findings out as they
+    arrive keeps memory flat. Within a window, files the cache can vouch for
+    are answered from it; the rest are scanned (see _scan_items) and written
+    back. The order, and therefore anything written from this stream, is the
+    same whatever `jobs` and the cache hold. The cache is saved at the end
+    unless `save_cache` is false, for callers that save it on their own
+    schedule.
+    """
+    paths = iter(paths)
+    with ExitStack() as stack:
+        pool = stack.enter_context(ProcessPoolExecutor(max_workers=jobs)) if jobs > 1 else None
+        while True:
+            window = list(islice(paths, SCAN_WINDOW))
+            if not window:
+                break
+            yield from _scan_window(window, pool, jobs, cache)
+    if cache is not None and save_cache:
+        cache.save()
+
+
+def _scan_window(
+    paths: List[Path], pool: Optional[ProcessPoolExecutor], jobs: int, cache: Optional[ScanCache]
+) -> Iterator[Tuple[Path, List[Finding]]]:
+    if cache is None:
+        for path, (_, findings) in zip(paths, _scan_items([(p, None) for p in paths], pool, jobs)):
+            yield path, findings
+        return
+
+    findings_by_index = [None] * len(paths)
+    misses = []
+    for index, path in enumerate(paths):
+        key = str(path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            st = None
+        cached, known_digest = cache.lookup(key, st) if st else (None, None)
+        if cached is not None:
+            findings_by_index[index] = cached
+        else:
+            misses.append((index, path, st, known_digest))
+
+    scanned = _scan_items([(path, known) for _, path, _, known in misses], pool, jobs)
+    for (index, path, st, _), (digest, findings) in zip(misses, scanned):
+        key = str(path)
+        if findings is None:
+            findings = cache.cached_findings(key)
+        if digest is not None and st is not None:
+            cache.store(key, st, digest, findings)
+        findings_by_index[index] = findings
+
+    yield from zip(paths, findings_by_index)
+
+
+class RuleStats:
+    """Counters for one rule under --profile."""
+
+    __slots__ = ('seconds', 'lines', 'matches', 'suppressions')
+
+    def __init__(self):
+        self.seconds = 0.0
+        self.lines = 0
+        self.matches = 0
+        self.suppressions = 0
+
+    def as_dict(self) -> dict:
+        return {
+            'seconds': round(self.seconds, 6),
+            'lines': self.lines,
+            'matches': self.matches,
+            'suppressions': self.suppressions,
+        }
+
+
+class ProfilingMatcher(RuleMatcher):
+    """A RuleMatcher that times and counts every rule; only --profile pays for it.
+
+    It yields exactly what RuleMatcher yields, doing the same work in the same
+    order with a clock around each step. Exclude rules are additionally run one
+    by one on every line that passes the include screen, so each is credited
+    with the lines it matches; the candidate findings on an excluded line count
+    as suppressions of the first matching rule in EXCLUDE_PATTERNS order.
+    """
+
+    def __init__(self, include, exclude):
+        super().__init__(include, exclude)
+        self.exclude = [(rule_id, re.compile(pattern)) for rule_id, pattern in exclude]
+        self.include_stats = {rule_id: RuleStats() for rule_id, _ in include}
+        self.exclude_stats = {rule_id: RuleStats() for rule_id, _ in exclude}
+        self.screen_stats = {'include_any': RuleStats(), 'exclude_any': RuleStats()}
+        self.text_node_stats = RuleStats()
+        self.suppression_reasons = Counter()
+        self.false_positive_hits = Counter()
+
+    def _search(self, stats: RuleStats, regex, line: str):
+        started = time.perf_counter()
+        match = regex.search(line)
+        stats.seconds += time.perf_counter() - started
+        stats.lines += 1
+        if match is not None:
+            stats.matches += 1
+        return match
+
+    def _suppress(self, stats: RuleStats, reason: str, text: str) -> None:
+        stats.suppressions += 1
+        self.suppression_reasons[reason] += 1
+        if reason == 'false_positive':
+            self.false_positive_hits[text.strip()] += 1
+
+    def _candidates(self, line: str) -> int:
+        """How many findings the include rules would keep on `line` were it not excluded."""
+        return sum(
+            1
+            for _, regex in self.include
+            for match in regex.finditer(line)
+            if not is_false_positive(match.group(1 if regex.groups else 0).strip('"\''))
+        )
+
+    def scan_line(self, line: str):
+        if self._search(self.screen_stats['include_any'], self.include_any, line) is None:
+            return
+        excluded = self._search(self.screen_stats['exclude_any'], self.exclude_any, line)
+        first = None
+        for rule_id, regex in self.exclude:
+            stats = self.exclude_stats[rule_id]
+            if self._search(stats, regex, line) is not None and first is None:
+                first = stats
+        if excluded is not None:
+            for _ in range(self._candidates(line)):
+                self._suppress(first, 'exclude_rule', '')
+            return
+
+        for rule_id, regex in self.include:
+            stats = self.include_stats[rule_id]
+            started = time.perf_counter()
+            matches = list(regex.finditer(line))
+            stats.seconds += time.perf_counter() - started
+            stats.lines += 1
+            stats.matches += len(matches)
+            group = 1 if regex.groups else 0
+            for match in matches:
+                text = match.group(group).strip('"\'')
+                reason = false_positive_reason(text)
+                if reason is None:
+                    yield match.start(group), rule_id, text
+                else:
+                    self._suppress(stats, reason, text)
+
+    def scan_text_nodes(self, content: str, start: int, end: int):
+        stats = self.text_node_stats
+        started = time.perf_counter()
+        matches = list(HTML_TEXT_PATTERN.finditer(content, start, end))
+        stats.seconds += time.perf_counter() - started
+        stats.lines += content.count('\n', start, end) + 1
+        stats.matches += len(matches)
+        for match in matches:
+            text = match.group(1).strip()
+            if any(char in text for char in ['{', '}', '$', '@']):
+                self._suppress(stats, 'expression', text)
+            elif text in FALSE_POSITIVES:
+                self._suppress(stats, 'false_positive', text)
+            else:
+                yield match, text
+
+
+PROFILE_FILE = 'i18n-scan-profile.json'
+
+
+class ScanProfile:
+    """Everything --profile measures over one scan.
+
+    Files are scanned serially and without the cache, since a cache hit or a
+    worker process would hide the very work being measured. A file's time
+    covers reading, hashing, lexing and matching it.
+    """
+
+    SLOWEST = 20
+
+    def __init__(self):
+        self.matcher = ProfilingMatcher(PATTERNS, EXCLUDE_PATTERNS)
+        self.file_seconds = {}
+
+    def scan_files(self, paths: Iterable[Path]) -> Iterator[Tuple[Path, List[Finding]]]:
+        """scan_files(paths) on this process, timing every file."""
+        for path in paths:
+            started = time.perf_counter()
+            _, findings = scan_path(path, matcher=self.matcher)
+            self.file_seconds[str(path)] = time.perf_counter() - started
+            yield path, findings
+
+    def slowest(self) -> List[Tuple[str, float]]:
+        return heapq.nlargest(self.SLOWEST, self.file_seconds.items(), key=lambda item: item[1])
+
+    def report(self) -> dict:
+        matcher = self.matcher
+        hits = matcher.false_positive_hits
+        return {
+            'files': len(self.file_seconds),
+            'seconds': round(sum(self.file_seconds.values()), 6),
+            'rules': {
+                'include': {rule_id: s.as_dict() for rule_id, s in matcher.include_stats.items()},
+                'exclude': {rule_id: s.as_dict() for rule_id, s in matcher.exclude_stats.items()},
+                'screens': {name: s.as_dict() for name, s in matcher.screen_stats.items()},
+                'text_node': {HTML_TEXT_RULE: matcher.text_node_stats.as_dict()},
+            },
+            'suppression_reasons': dict(sorted(matcher.suppression_reasons.items())),
+            # Every FALSE_POSITIVES entry, most used first; a 0 is a candidate for removal.
+            'false_positives': {
+                entry: hits[entry] for entry in sorted(FALSE_POSITIVES, key=lambda e: (-hits[e], e))
+            },
+            'slowest_files': [
+                {'file': path, 'seconds': round(seconds, 6)} for path, seconds in self.slowest()
+            ],
+            'file_seconds': {path: round(seconds, 6) for path, seconds in self.file_seconds.items()},
+        }
+
+    def write(self) -> dict:
+        report = self.report()
+        with open(PROFILE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        return report
+
+    def print(self) -> None:
+        matcher = self.matcher
+        rules = [
+            *matcher.include_stats.items(), *matcher.exclude_stats.items(),
+            *matcher.screen_stats.items(), (HTML_TEXT_RULE, matcher.text_node_stats),
+        ]
+        print(f"\n⏱️  PROFILE ({sum(self.file_seconds.values()):.3f}s in {len(self.file_seconds)} files)")
+        print(f"-" * 60)
+        for rule_id, stats in sorted(rules, key=lambda rule: -rule[1].seconds)[:10]:
+            print(
+                f"{rule_id:<16} {stats.seconds * 1000:8.1f} ms  {stats.lines:7} lines  "
+                f"{stats.matches:6} matches  {stats.suppressions:6} suppressed"
+            )
+        unused = sum(1 for entry in FALSE_POSITIVES if not matcher.false_positive_hits[entry])
+        print(f"\nFALSE_POSITIVES entries never hit: {unused} of {len(FALSE_POSITIVES)}")
+        print(f"Slowest files:")
+        for path, seconds in self.slowest()[:5]:
+            print(f"  {seconds * 1000:7.1f} ms  {path}")
+
+
+RESULTS_FILE = 'i18n-scan-results.json'
+
+
+def result_entry(
+    file_path: Path, findings: List[Finding], messages: Optional[MessageIndex] = None
+) -> dict:
+    """The i18n-scan-results.json record for one file with findings.
+
+    With a MessageIndex, every finding that resembles an existing message gets
+    its candidate keys under 'suggestions', keyed by the finding's text.
+    """
+    entry = {
+        'priority': classify_priority(file_path, findings),
+        'count': len(findings),
+        'strings': [(line_num, text) for line_num, text, *_ in findings[:10]]  # Show first 10
+    }
+    if messages is not None:
+        suggestions = {text: messages.suggest(text) for _, text, *_ in findings}
+        entry['suggestions'] = {text: found for text, found in suggestions.items() if found}
+    return entry
+
+
+def format_suggestions(suggestions: List[dict]) -> str:
+    """One-line rendering of MessageIndex suggestions for console reports."""
+    return ', '.join(
+        f"m['{s['key']}']() ({s['score']:.2f}; {', '.join(s['locales']) or 'en only'})"
+        for s in suggestions
+    )
+
+
+def write_results(results: dict, path=RESULTS_FILE) -> None:
+    """Write i18n-scan-results.json in the order a full scan produces.
+
+    A full scan walks sorted Paths, which order by path component rather than
+    by string, so merged-in entries are sorted the same way.
+    """
+    with open(path, 'w') as f:
+        json.dump(dict(sorted(results.items(), key=lambda kv: Path(kv[0]).parts)), f, indent=2)
+
+
+class ScanSummary:
+    """Running totals for the console summary, fed one file at a time.
+
+    Only counters and a bounded min-heap of the TOP largest files are kept, so
+    the summary costs the same for 600 files or 60,000. Heap entries carry the
+    negated arrival order, which breaks ties the way a stable sort by count
+    would.
+    """
+
+    TOP = 20
+
+    def __init__(self):
+        self.files = 0
+        self.files_with_findings = 0
+        self.strings = 0
+        self.priorities = Counter()
+        self._top = []
+
+    def add(self, file_key: str, priority: Optional[str], findings: List[Finding]) -> None:
+        self.files += 1
+        if not findings:
+            return
+        self.files_with_findings += 1
+        self.strings += len(findings)
+        self.priorities[priority] += 1
+        entry = (len(findings), -self.files, file_key, priority, findings[0][1])
+        if len(self._top) < self.TOP:
+            heapq.heappush(self._top, entry)
+        else:
+            heapq.heappushpop(self._top, entry)
+
+    def print(self) -> None:
+        print(f"\n📊 SCAN SUMMARY")
+        print(f"=" * 60)
+        print(f"Total files scanned: {self.files}")
+        print(f"Files with hardcoded strings: {self.files_with_findings}")
+        print(f"Total hardcoded strings found: {self.strings}")
+        print(f"Files already clean: {self.files - self.files_with_findings}")
+        print(f"=" * 60)
+
+        # Breakdown by priority
+        print(f"\n🔴 HIGH Priority: {self.priorities['🔴 HIGH']} files")
+        print(f"🟡 MEDIUM Priority: {self.priorities['🟡 MED']} files")
+        print(f"🟢 LOW Priority: {self.priorities['🟢 LOW']} files")
+
+        # Show top offenders
+        print(f"\n📋 TOP {self.TOP} FILES WITH MOST HARDCODED STRINGS:")
+        print(f"-" * 60)
+        for i, (count, _, file_key, priority, example) in enumerate(sorted(self._top, reverse=True), 1):
+            print(f"{i:2}. {priority} {file_key}")
+            print(f"    {count} hardcoded strings")
+            print(f"    Examples: {example[:60]}...")
+
+
+def source_files(walker: Optional[SourceWalker] = None) -> List[Path]:
+    """The files a full scan reads (by default src/**/*.svelte and src/lib/**/*.ts), in path order."""
+    return list(walker or SourceWalker())
+
+
+def result_key(file_path: Path, src_dir: Path = Path('src')) -> str:
+    """The key of a file in the results: its path relative to src/ (or as given, outside it)."""
+    try:
+        return str(file_path.relative_to(src_dir))
+    except ValueError:
+        return str(file_path)
+
+
+def scan_tree(
+    paths: List[Path],
+    jobs: int = 1,
+    cache: Optional[ScanCache] = None,
+    profile: Optional[ScanProfile] = None,
+    summary: Optional[ScanSummary] = None,
+    recorder=None,
+    duplicates: Optional[DuplicateIndex] = None,
+) -> Iterator[Tuple[Path, str, Optional[str], List[Finding]]]:
+    """Scan `paths` in order, yielding (path, results key, priority, findings) for every file.
+
+    Priority is None for a clean file. The console summary, the history
+    recorder and the duplicate index, when given, are fed each file as it
+    comes by.
+    """
+    stream = profile.scan_files(paths) if profile else scan_files(paths, jobs, cache)
+    for file_path, findings in stream:
+        file_key = result_key(file_path)
+        priority = classify_priority(file_path, findings) if findings else None
+        if summary is not None:
+            summary.add(file_key, priority, findings)
+        if recorder is not None:
+            recorder.add(file_key, history_records(file_key, findings))
+        if duplicates is not None:
+            duplicates.add(file_key, findings)
+        yield file_path, file_key, priority, findings
+
+
+def scan_file_results(
+    jobs: int = 1,
+    cache: Optional[ScanCache] = None,
+    walker: Optional[SourceWalker] = None,
+    history: Optional[HistoryStore] = None,
+    summary: Optional[ScanSummary] = None,
+    duplicates: Optional[DuplicateIndex] = None,
+) -> Iterator[FileResult]:
+    """Scan every source file, yielding a FileResult for each one with findings, in path order.
+
+    The run is recorded in `history` once the last file has been scanned.
+    """
+    recorder = history.run(current_commit()) if history is not None else None
+    for _, file_key, priority, findings in scan_tree(
+        source_files(walker), jobs, cache, summary=summary, recorder=recorder, duplicates=duplicates,
+    ):
+        if findings:
+            yield FileResult.build(
+                file_key, priority, len(findings), ((line_num, text) for line_num, text, *_ in findings),
+            )
+    if recorder is not None:
+        recorder.finish()
+
+
+def scan_all_files(
+    jobs: int = 1,
+    cache: Optional[ScanCache] = None,
+    messages: Optional[MessageIndex] = None,
+    profile: Optional[ScanProfile] = None,
+    walker: Optional[SourceWalker] = None,
+    history: Optional[HistoryStore] = None,
+    columnar: bool = False,
+    duplicates: Optional[DuplicateIndex] = None,
+):
+    """Scan all source files and generate report.
+
+    With `columnar`, the results go to COLUMNAR_RESULTS_FILE (see
+    columnar_results) instead of RESULTS_FILE. Strings found in more than one
+    place are collected in `duplicates` (a fresh DuplicateIndex if none is
+    given) and written to DUPLICATES_FILE for the sweep report.
+    """
+    svelte_files = source_files(walker)
+
+    results = {}
+    summary = ScanSummary()
+    recorder = history.run(current_commit()) if history is not None else None
+    if duplicates is None:
+        duplicates = DuplicateIndex()
+
+    print(f"🔍 Scanning {len(svelte_files)} source files...\n")
+
+    for file_path, relative_path, _, findings in scan_tree(
+        svelte_files, jobs, cache, profile, summary, recorder, duplicates,
+    ):
+        if findings:
+            results[relative_path] = result_entry(file_path, findings, messages)
+
+    # Generate summary report
+    summary.print()
+
+    # Save detailed results to JSON
+    if columnar:
+        write_columnar(results)
+    else:
+        write_results(results)
+
+    duplicates.write()
+
+    print(f"\n✅ Detailed results saved to {COLUMNAR_RESULTS_FILE if columnar else RESULTS_FILE}")
+    if recorder is not None:
+        print(f"🗂️  Recorded run {recorder.finish()} in {history.path}")
+
+    if profile:
+        profile.write()
+        profile.print()
+        print(f"\n✅ Profile saved to {PROFILE_FILE}")
+
+    return results
+
+
+def finding_records(
+    file_key: str, priority: str, findings: List[Finding], messages: Optional[MessageIndex] = None
+) -> Iterator[dict]:
+    """One JSON-ready record per finding, in the order the scanner found them."""
+    for line_num, text, column, rule_id in findings:
+        record = {
+            'file': file_key,
+            'line': line_num,
+            'column': column,
+            'text': text,
+            'priority': priority,
+            'rule': rule_id,
+        }
+        if messages is not None:
+            record['suggestions'] = messages.suggest(text)
+        yield record
+
+
+def stream_all_files(
+    output: Path,
+    jobs: int = 1,
+    cache: Optional[ScanCache] = None,
+    messages: Optional[MessageIndex] = None,
+    profile: Optional[ScanProfile] = None,
+    walker: Optional[SourceWalker] = None,
+    history: Optional[HistoryStore] = None,
+) -> ScanSummary:
+    """Scan all source files, writing every finding to `output` as JSON Lines.
+
+    Unlike scan_all_files nothing is truncated and no results dict is built:
+    each file's findings are written as soon as they are scanned and only the
+    ScanSummary counters outlive the file, so memory does not grow with the
+    tree. Lines follow the sorted file order, then the order within each file.
+    """
+    svelte_files = source_files(walker)
+    summary = ScanSummary()
+    recorder = history.run(current_commit()) if history is not None else None
+
+    print(f"🔍 Scanning {len(svelte_files)} source files...\n")
+
+    with open(output, 'w', encoding='utf-8') as f:
+        for _, relative_path, priority, findings in scan_tree(
+            svelte_files, jobs, cache, profile, summary, recorder,
+        ):
+            for record in finding_records(relative_path, priority, findings, messages):
+                f.write(json.dumps(record, ensure_ascii=False))
+                f.write('\n')
+
+    summary.print()
+    print(f"\n✅ {summary.strings} findings streamed to {output}")
+    if recorder is not None:
+        print(f"🗂️  Recorded run {recorder.finish()} in {history.path}")
+
+    if profile:
+        profile.write()
+        profile.print()
+        print(f"\n✅ Profile saved to {PROFILE_FILE}")
+    return summary
+
+
+def history_records(file_key: str, findings: List[Finding]) -> List[tuple]:
+    """A file's findings as scan_history records: (fingerprint, rule, text, line, column)."""
+    return [
+        (fingerprint(file_key, rule_id, text), rule_id, text, line_num, column)
+        for line_num, text, column, rule_id in findings
+    ]
+
+
+def scan_changed_files(
+    ref: str,
+    jobs: int = 1,
+    cache: Optional[ScanCache] = None,
+    messages: Optional[MessageIndex] = None,
+    walker: Optional[SourceWalker] = None,
+):
+    """Scan only the source files changed since `ref` and merge them into the results.
+
+    The printed report covers findings on added or modified lines only. The
+    results file keeps every other entry as it was and gets the full, current
+    findings of each changed file, so it remains a snapshot of the whole tree.
+    Returns the changed-line findings as {relative path: [(line, text), ...]}.
+    """
+    changed, removed = git_changes(ref, walker)
+    paths = sorted(Path(p) for p in changed)
+
+    try:
+        with open(RESULTS_FILE, 'r') as f:
+            results = json.load(f)
+    except (OSError, ValueError):
+        results = {}
+    for path in removed:
+        results.pop(result_key(Path(path)), None)
+
+    print(f"🔍 Scanning {len(paths)} source files changed since {ref}...\n")
+
+    new_findings = {}
+    for file_path, findings in scan_files(paths, jobs, cache):
+        key = result_key(file_path)
+        if findings:
+            results[key] = result_entry(file_path, findings, messages)
+        else:
+            results.pop(key, None)
+        lines = changed[file_path.as_posix()]
+        on_changed_lines = [(f[0], f[1]) for f in findings if lines is None or f[0] in lines]
+        if on_changed_lines:
+            new_findings[key] = on_changed_lines
+
+    total = sum(len(f) for f in new_findings.values())
+    print(f"📊 {total} hardcoded strings on changed lines in {len(new_findings)} files")
+    for key, findings in new_findings.items():
+        print(f"\n{results[key]['priority']} {key}")
+        for line_num, text in findings:
+            print(f"    {line_num}: {text}")
+            suggestions = results[key].get('suggestions', {}).get(text)
+            if suggestions:
+                print(f"        ↳ {format_suggestions(suggestions)}")
+
+    write_results(results)
+
+    print(f"\n✅ Merged {len(paths)} files into {RESULTS_FILE}")
+
+    return new_findings
+
+
+def parse_args(argv=None):
+    from scan_gate import DEFAULT_BASELINE
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n\n')[0])
+    parser.add_argument(
+        '-j', '--jobs', type=int, default=1,
+        help='scan on N worker processes (0 = one per CPU); output is identical to a serial run',
+    )
+    parser.add_argument(
+        '--cache', default=DEFAULT_CACHE, metavar='PATH',
+        help=f'reuse findings for unchanged files from PATH (default: {DEFAULT_CACHE})',
+    )
+    parser.add_argument('--no-cache', action='store_true', help='rescan every file from scratch')
+    parser.add_argument(
+        '--since', metavar='REF',
+        help='scan only the source files changed since REF, report findings on changed lines, '
+        f'merge into {RESULTS_FILE} and exit 1 if there are any',
+    )
+    parser.add_argument(
+        '--root', type=Path, default=REPO_ROOT, metavar='DIR',
+        help='project to scan; src/ and the output files are relative to it (default: this repo)',
+    )
+    parser.add_argument(
+        '--watch', action='store_true',
+        help=f'after the full scan, keep rescanning changed files and updating {RESULTS_FILE}',
+    )
+    parser.add_argument(
+        '--interval', type=float, default=0.05, metavar='SECONDS',
+        help='how often --watch polls for changes (default: 0.05)',
+    )
+    parser.add_argument(
+        '--jsonl', type=Path, metavar='PATH',
+        help=f'write every finding, untruncated, to PATH as JSON Lines while scanning '
+        f'(instead of {RESULTS_FILE})',
+    )
+    parser.add_argument(
+        '--columnar', action='store_true',
+        help=f'write the results to {COLUMNAR_RESULTS_FILE}, a compact memory-mappable format, '
+        f'instead of {RESULTS_FILE}',
+    )
+    parser.add_argument(
+        '--suggest-keys', action='store_true',
+        help="suggest existing m['key']() messages from messages/*.json for each finding",
+    )
+    parser.add_argument(
+        '--profile', action='store_true',
+        help=f'time and count every rule, file and FALSE_POSITIVES entry and write {PROFILE_FILE} '
+        '(scans serially, without the cache)',
+    )
+    parser.add_argument(
+        '--include', action='append', metavar='GLOB',
+        help='scan the files matching GLOB, relative to --root; repeatable, replaces the default '
+        f"({', '.join(DEFAULT_INCLUDE)})",
+    )
+    parser.add_argument(
+        '--exclude', action='append', default=[], metavar='GLOB',
+        help=f"skip the files matching GLOB; repeatable, added to {', '.join(DEFAULT_EXCLUDE)}",
+    )
+    parser.add_argument(
+        '--gate', action='store_true',
+        help='fail (exit 1) on findings not accepted in the baseline, instead of writing results',
+    )
+    parser.add_argument(
+        '--fail-fast', action='store_true',
+        help='with --gate, stop at the first new finding',
+    )
+    parser.add_argument(
+        '--update-baseline', action='store_true',
+        help='accept every current finding into the baseline, replacing it',
+    )
+    parser.add_argument(
+        '--baseline', type=Path, default=DEFAULT_BASELINE, metavar='PATH',
+        help=f'baseline for --gate / --update-baseline, relative to --root (default: {DEFAULT_BASELINE})',
+    )
+    parser.add_argument(
+        '--history', default=DEFAULT_HISTORY, metavar='PATH',
+        help=f'record every full scan in the SQLite database at PATH (default: {DEFAULT_HISTORY})',
+    )
+    parser.add_argument('--no-history', action='store_true', help='do not record this scan')
+    args = parser.parse_args(argv)
+    if args.fail_fast:
+        args.gate = True
+    if args.profile and (args.since or args.watch):
+        parser.error('--profile works with full scans only, not --since or --watch')
+    if args.jobs == 0:
+        args.jobs = os.cpu_count() or 1
+    if args.jobs < 0:
+        parser.error('--jobs must be >= 0')
+    return args
+
+
+def main(argv=None) -> None:
+    args = parse_args(argv)
+    os.chdir(args.root)
+    cache = None if args.no_cache or args.profile else load_cache(args.cache)
+    profile = ScanProfile() if args.profile else None
+    messages = MessageIndex.load(Path('messages')) if args.suggest_keys else None
+    walker = SourceWalker(include=args.include, exclude=DEFAULT_EXCLUDE + args.exclude)
+    if args.update_baseline or args.gate:
+        # The gate, --since's git plumbing and the watcher build on this module.
+        from scan_gate import Baseline, gate_all_files, update_baseline
+    if args.update_baseline:
+        update_baseline(Baseline(args.baseline), jobs=args.jobs, cache=cache, walker=walker)
+        sys.exit(0)
+    if args.gate:
+        new_findings = gate_all_files(
+            Baseline(args.baseline).load(), fail_fast=args.fail_fast, jobs=args.jobs, cache=cache,
+            walker=walker,
+        )
+        sys.exit(1 if new_findings else 0)
+    if args.since:
+        new_findings = scan_changed_files(
+            args.since, jobs=args.jobs, cache=cache, messages=messages, walker=walker,
+        )
+        sys.exit(1 if new_findings else 0)
+    if args.watch:
+        from scan_watch import Watcher
+
+        watcher = Watcher(cache=cache, messages=messages, walker=walker)
+        watcher.start(jobs=args.jobs)
+        watcher.run(args.interval)
+        sys.exit(0)
+    # Only full scans of the default file set are recorded: --since and --watch
+    # see part of the tree, and with --include / --exclude a run covers other
+    # files, which the history's deltas would count as added or fixed.
+    custom_files = args.include is not None or bool(args.exclude)
+    history = None if args.no_history or custom_files else HistoryStore(args.history)
+    if custom_files and not args.no_history:
+        print(f"ℹ️  Not recording this run in {args.history}: --include/--exclude change the files scanned\n")
+    if args.jsonl:
+        stream_all_files(
+            args.jsonl, jobs=args.jobs, cache=cache, messages=messages, profile=profile, walker=walker,
+            history=history,
+        )
+        sys.exit(0)
+    scan_all_files(
+        jobs=args.jobs, cache=cache, messages=messages, profile=profile, walker=walker, history=history,
+        columnar=args.columnar,
+    )
@@ -0,0 +1,57 @@
+"""Scan the tree and update i18n-sweep.md in one process: scan → aggregate → render.
+
+The scanner yields a FileResult per file with findings, ReportIndex folds
+them into the report's counts, groups and top lists as they arrive, and
+update_markdown renders the sections and rewrites the ones that changed.
+Nothing is serialized between the stages; i18n-scan-results.json is only
+written when asked for, as a side output of the same pass, and always
+together with i18n-scan-duplicates.json so the two describe the same scan.
+"""
+
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from duplicate_index import DUPLICATES_FILE, DuplicateIndex
+from hardcoded_strings import ScanSummary, scan_file_results, write_results
+from scan_cache import ScanCache
+from scan_history import HistoryStore
+from source_tree import SourceWalker
+from sweep_model import FileResult
+from sweep_report import SWEEP_FILE, ReportIndex, update_markdown
+
+
+def _tee_results(results: Iterable[FileResult], path) -> Iterator[FileResult]:
+    """Pass results through, then write them to `path` in the i18n-scan-results.json format."""
+    entries = {}
+    for result in results:
+        entries[result.path] = result.to_entry()
+        yield result
+    write_results(entries, path)
+
+
+def sweep(
+    jobs: int = 1,
+    cache: Optional[ScanCache] = None,
+    walker: Optional[SourceWalker] = None,
+    history: Optional[HistoryStore] = None,
+    results_file=None,
+    duplicates_file=DUPLICATES_FILE,
+    sweep_file=SWEEP_FILE,
+) -> Tuple[ReportIndex, List[str]]:
+    """Scan the source tree and bring `sweep_file` up to date; return the index and the changed headings.
+
+    The scan is recorded in `history` when one is given, and the results are
+    also written to `results_file` (without key suggestions) when one is,
+    with the shared strings written to `duplicates_file` alongside them.
+    """
+    summary = ScanSummary()
+    duplicates = DuplicateIndex()
+    results = scan_file_results(jobs, cache, walker, history, summary, duplicates)
+    if results_file is not None:
+        results = _tee_results(results, results_file)
+    index = ReportIndex(results, history=history, duplicates=duplicates)
+    # The index has drained the scan, so the summary and the duplicate index
+    # have seen every file.
+    index.total_files = summary.files
+    if results_file is not None:
+        duplicates.write(duplicates_file)
+    return index, update_markdown(index, sweep_file)
@@ -0,0 +1,169 @@
+"""Look up existing Paraglide messages for a hardcoded English string.
+
+Built once from messages/en.json (the source locale) and consulted for every
+scanner finding, so a string that is already in the catalog can be replaced
+with `m['key']()` instead of getting a new key. Two structures:
+
+  - an exact map from a normalized message value to its keys, and
+  - a character-trigram inverted index for near matches, scored with the Dice
+    coefficient over trigram sets.
+
+Near matches are counted, not compared: the query's trigram postings are
+merged into per-message overlap counts (ScanCount), so a message's score comes
+straight from how many postings it appeared in. Postings are sorted by
+trigram-set size, and Dice >= t bounds a candidate's size to [a|Q|, |Q|/a]
+with a = t / (2 - t), so each posting is cut to that range by bisection before
+it is counted. Repeated strings hit a memo.
+"""
+
+import json
+import math
+import re
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, Iterator, List, Set, Tuple
+
+SOURCE_LOCALE = 'en'
+NGRAM = 3
+
+_PLACEHOLDER = re.compile(r'\{[^}]*\}')
+
+
+def flatten(tree: dict, prefix: str = '') -> Iterator[Tuple[str, str]]:
+    """Yield (dotted key, value) for every message; plural variants yield each form."""
+    for name, value in tree.items():
+        if name.startswith('$'):
+            continue
+        key = prefix + name
+        if isinstance(value, dict):
+            yield from flatten(value, key + '.')
+        elif isinstance(value, str):
+            yield key, value
+        elif isinstance(value, list):
+            for variant in value:
+                for form in variant.get('match', {}).values():
+                    yield key, form
+
+
+def normalize(text: str) -> str:
+    """Case-, whitespace-, placeholder- and end-punctuation-insensitive form."""
+    text = _PLACEHOLDER.sub('{}', text)
+    return ' '.join(text.lower().split()).strip(' .:!?…')
+
+
+def ngrams(text: str) -> Set[str]:
+    padded = f' {text} '
+    return {padded[i:i + NGRAM] for i in range(len(padded) - NGRAM + 1)}
+
+
+# Slack for float error in the bounds below, which are often exact integers
+# (0.6 / 1.4 * 28 is 12.000000000000002, and ceil() would make that 13).
+_EPSILON = 1e-9
+
+
+class MessageIndex:
+    """Exact and near-match lookup of English message values, with locale coverage."""
+
+    def __init__(
+        self,
+        messages: List[Tuple[str, str]],
+        locale_keys: Dict[str, Set[str]],
+        min_score: float = 0.6,
+    ):
+        self.locale_keys = locale_keys
+        self.alpha = min_score / (2 - min_score)
+        self.min_score = min_score
+        self.exact: Dict[str, List[str]] = defaultdict(list)
+        for key, value in messages:
+            normalized = normalize(value)
+            if normalized:
+                self.exact[normalized].append(key)
+
+        self.values = list(self.exact)
+        self.sizes = [len(ngrams(value)) for value in self.values]
+        # Postings list entries in order of trigram-set size, with the sizes
+        # alongside, so the size bound is a bisect rather than a scan.
+        self.postings: Dict[str, List[int]] = defaultdict(list)
+        for entry in sorted(range(len(self.values)), key=self.sizes.__getitem__):
+            for gram in ngrams(self.values[entry]):
+                self.postings[gram].append(entry)
+        self.posting_sizes = {
+            gram: [self.sizes[entry] for entry in entries]
+            for gram, entries in self.postings.items()
+        }
+        self._memo: Dict[str, List[dict]] = {}
+
+    @classmethod
+    def load(cls, messages_dir: Path = Path('messages')) -> 'MessageIndex':
+        """Index messages_dir/en.json and record which keys every catalog defines."""
+        locale_keys = {}
+        messages = []
+        for path in sorted(Path(messages_dir).glob('*.json')):
+            with open(path, 'r', encoding='utf-8') as f:
+                pairs = list(flatten(json.load(f)))
+            locale_keys[path.stem] = {key for key, value in pairs if value.strip()}
+            if path.stem == SOURCE_LOCALE:
+                messages = pairs
+        return cls(messages, locale_keys)
+
+    def locales_for(self, key: str) -> List[str]:
+        """The non-source locales that already translate `key`."""
+        return [
+            locale for locale, keys in sorted(self.locale_keys.items())
+            if locale != SOURCE_LOCALE and key in keys
+        ]
+
+    def suggest(self, text: str, limit: int = 3) -> List[dict]:
+        """Best existing keys for `text`, exact matches first, as JSON-ready dicts."""
+        query = normalize(text)
+        if not query:
+            return []
+        memo_key = f'{limit}:{query}'
+        if memo_key in self._memo:
+            return self._memo[memo_key]
+
+        scored = [(1.0, key) for key in self.exact.get(query, ())]
+        if len(scored) < limit:
+            scored.extend(self._near(query))
+
+        suggestions, seen = [], set()
+        for score, key in scored:
+            if key in seen:
+                continue
+            seen.add(key)
+            suggestions.append({
+                'key': key,
+                'score': round(score, 3),
+                'locales': self.locales_for(key),
+            })
+            if len(suggestions) == limit:
+                break
+        self._memo[memo_key] = suggestions
+        return suggestions
+
+    def _near(self, query: str) -> List[Tuple[float, str]]:
+        grams = ngrams(query)
+        size = len(grams)
+        low = self.alpha * size - _EPSILON
+        high = size / self.alpha + _EPSILON
+        overlap = Counter()
+        for gram in grams:
+            if gram in self.postings:
+                sizes = self.posting_sizes[gram]
+                overlap.update(
+                    self.postings[gram][bisect_left(sizes, low):bisect_right(sizes, high)]
+                )
+
+        # Dice >= t needs at least a|Q| shared trigrams whatever the other size.
+        required = math.ceil(self.alpha * size - _EPSILON)
+        matches = []
+        for entry, shared in overlap.items():
+            if shared < required:
+                continue
+            score = 2 * shared / (size + self.sizes[entry])
+            value = self.values[entry]
+            if score >= self.min_score - _EPSILON and value != query:
+                matches.extend((score, key) for key in self.exact[value])
+        matches.sort(key=lambda match: (-match[0], match[1]))
+        return matches
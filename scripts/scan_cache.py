@@ -0,0 +1,73 @@
+"""The per-file findings cache behind incremental i18n scans.
+
+hardcoded_strings.load_cache opens it for the current rules; scan_files
+consults it before reading a file and stores what it scanned. Findings are
+kept as hardcoded_strings.Finding tuples.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import List
+
+DEFAULT_CACHE = '.i18n-scan-cache.json'
+
+
+class ScanCache:
+    """Per-file findings persisted between runs, for incremental rescans.
+
+    Entries are keyed by path and hold the file's size, mtime and content
+    digest. A file whose size and mtime are unchanged is not even opened; one
+    whose stat changed but whose digest did not (a checkout, a touch) is read
+    but not rescanned. The whole cache is discarded when `rules`, the
+    scanner's rules fingerprint, differs from the one it was written with.
+    """
+
+    def __init__(self, path, rules: str):
+        self.path = Path(path)
+        self.rules = rules
+        self.entries = {}
+        self.seen = set()
+        self.dirty = False
+
+    def load(self) -> 'ScanCache':
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return self
+        if isinstance(data, dict) and data.get('rules') == self.rules:
+            self.entries = data.get('files', {})
+        else:
+            self.dirty = True
+        return self
+
+    def lookup(self, key: str, st: os.stat_result):
+        """Return (findings, digest): findings only if size and mtime still match."""
+        self.seen.add(key)
+        entry = self.entries.get(key)
+        if entry is None:
+            return None, None
+        size, mtime_ns, digest, findings = entry
+        if size == st.st_size and mtime_ns == st.st_mtime_ns:
+            return [tuple(f) for f in findings], digest
+        return None, digest
+
+    def cached_findings(self, key: str) -> List[tuple]:
+        return [tuple(f) for f in self.entries[key][3]]
+
+    def store(self, key: str, st: os.stat_result, digest: str, findings) -> None:
+        self.entries[key] = [st.st_size, st.st_mtime_ns, digest, findings]
+        self.dirty = True
+
+    def save(self) -> None:
+        stale = [key for key in self.entries if key not in self.seen and not os.path.exists(key)]
+        for key in stale:
+            del self.entries[key]
+        if not (self.dirty or stale):
+            return
+        tmp = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({'rules': self.rules, 'files': self.entries}, f, separators=(',', ':'))
+        os.replace(tmp, self.path)
+        self.dirty = False
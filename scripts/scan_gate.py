@@ -0,0 +1,123 @@
+"""The --gate check and its baseline of accepted findings.
+
+Findings are matched by fingerprint (results key, rule and normalized text;
+see scan_history.fingerprint), so a string that moves to another line stays
+accepted and the gate agrees with the scan history about what is new.
+"""
+
+import json
+import os
+from contextlib import closing
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from hardcoded_strings import Finding, result_key, scan_files, source_files
+from scan_cache import ScanCache
+from scan_history import baseline_entry, fingerprint
+from source_tree import SourceWalker
+
+# Accepted findings for --gate. Same shape as the Node checker's
+# scripts/i18n-hardcoded-baseline.json (file -> accepted entries), but a
+# separate file: that one is owned and rewritten by check-i18n-hardcoded.mjs,
+# whose rules and entry format differ from this scanner's. Files are keyed by
+# result_key, as in the results and the scan history, so a finding has one
+# fingerprint everywhere.
+DEFAULT_BASELINE = Path('scripts') / 'i18n-scan-baseline.json'
+
+
+class Baseline:
+    """Accepted findings as a set of fingerprints, so every lookup is O(1)."""
+
+    def __init__(self, path: Path = DEFAULT_BASELINE):
+        self.path = Path(path)
+        self.fingerprints = set()
+
+    def load(self) -> 'Baseline':
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                accepted = json.load(f)
+        except FileNotFoundError:
+            accepted = {}
+        for file_key, entries in accepted.items():
+            for entry in entries:
+                rule_id, _, text = entry.partition(': ')
+                self.fingerprints.add(fingerprint(file_key, rule_id, text))
+        return self
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.fingerprints
+
+    def write(self, accepted: dict) -> None:
+        """Replace the baseline with `accepted` ({file: set of entries}), sorted for stable diffs."""
+        tmp = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(
+                {file_key: sorted(entries) for file_key, entries in sorted(accepted.items())},
+                f, indent='\t', ensure_ascii=False,
+            )
+            f.write('\n')
+        os.replace(tmp, self.path)
+
+
+def gate_all_files(
+    baseline: Baseline,
+    fail_fast: bool = False,
+    jobs: int = 1,
+    cache: Optional[ScanCache] = None,
+    walker: Optional[SourceWalker] = None,
+) -> List[Tuple[str, Finding]]:
+    """Check every finding against `baseline` as it streams out; return the new ones.
+
+    With fail_fast the scan stops at the first new finding. Otherwise every
+    new finding is listed, and baseline entries no scan produced any more are
+    reported as stale (not fatal), as the Node checker does. New findings are
+    returned and printed with their path on disk, for the editor to open.
+    """
+    svelte_files = source_files(walker)
+    new_findings = []
+    seen = set()
+
+    print(f"🔍 Checking {len(svelte_files)} source files against {baseline.path}...\n")
+
+    with closing(scan_files(svelte_files, jobs, cache)) as stream:
+        for file_path, findings in stream:
+            file_key = result_key(file_path)
+            for finding in findings:
+                line_num, text, column, rule_id = finding
+                key = fingerprint(file_key, rule_id, text)
+                seen.add(key)
+                if key in baseline:
+                    continue
+                new_findings.append((file_path.as_posix(), finding))
+                print(f"   {file_path.as_posix()}:{line_num}:{column}  [{rule_id}] {text}")
+                if fail_fast:
+                    print(f"\n❌ New hardcoded string (stopped at the first, --fail-fast)")
+                    return new_findings
+
+    stale = len(baseline.fingerprints - seen)
+    if stale:
+        print(f"   ({stale} baseline entries are now stale; run with --update-baseline to prune.)")
+    if new_findings:
+        print(f"\n❌ {len(new_findings)} new hardcoded string(s) not in {baseline.path}")
+    else:
+        print(f"✅ No new hardcoded strings")
+    return new_findings
+
+
+def update_baseline(
+    baseline: Baseline,
+    jobs: int = 1,
+    cache: Optional[ScanCache] = None,
+    walker: Optional[SourceWalker] = None,
+) -> int:
+    """Rewrite `baseline` to accept every current finding; return how many there are."""
+    accepted = {}
+    for file_path, findings in scan_files(source_files(walker), jobs, cache):
+        if findings:
+            accepted[result_key(file_path)] = {
+                baseline_entry(rule_id, text) for _, text, _, rule_id in findings
+            }
+    baseline.write(accepted)
+    total = sum(len(entries) for entries in accepted.values())
+    print(f"✅ Wrote baseline: {total} accepted finding(s) across {len(accepted)} file(s) to {baseline.path}")
+    return total
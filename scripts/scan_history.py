@@ -0,0 +1,227 @@
+"""Record every full i18n scan in a local SQLite database and query it for deltas.
+
+Three tables:
+
+  runs      one row per scan: when, at which commit, how many files and findings
+  files     one row per path ever scanned (relative to src/, like the results)
+  findings  one row per stretch of consecutive runs a finding was present in
+
+A finding is identified by its fingerprint (results key, rule and normalized
+text, the same identity the --gate baseline uses), so moving a string to
+another line does not make it new. Instead of a row per finding per run, a
+finding's row holds the first and last run it was seen in; a run extends the
+rows that were open in the run before it and opens rows for the rest. A
+finding that goes away and comes back gets a second row.
+
+That makes the questions the sweep report asks into indexed range queries:
+new in run R is `first_run = R`, fixed in R is `last_run = <run before R>`,
+and still present is `last_run = R`.
+"""
+
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+DEFAULT_HISTORY = '.i18n-scan-history.sqlite'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started_at TEXT NOT NULL,
+    git_commit TEXT,
+    files INTEGER NOT NULL DEFAULT 0,
+    findings INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS findings (
+    id INTEGER PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    file_id INTEGER NOT NULL REFERENCES files(id),
+    rule TEXT NOT NULL,
+    text TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    col INTEGER NOT NULL,
+    first_run INTEGER NOT NULL REFERENCES runs(id),
+    last_run INTEGER NOT NULL REFERENCES runs(id)
+);
+CREATE INDEX IF NOT EXISTS findings_last_run ON findings(last_run, fingerprint);
+CREATE INDEX IF NOT EXISTS findings_first_run ON findings(first_run);
+"""
+
+# (fingerprint, rule, text, line, column) as the scanner reports it.
+FindingRecord = Tuple[str, str, str, int, int]
+
+
+def baseline_entry(rule_id: str, text: str) -> str:
+    """How a finding is recorded in the --gate baseline: rule and whitespace-normalized text."""
+    return f"{rule_id}: {' '.join(text.split())}"
+
+
+def fingerprint(file_key: str, rule_id: str, text: str) -> str:
+    """A finding's identity across edits: results key, rule and normalized text, no line or column."""
+    return f'{file_key}\0{baseline_entry(rule_id, text)}'
+
+
+class Run(NamedTuple):
+    id: int
+    started_at: str
+    git_commit: Optional[str]
+    files: int
+    findings: int
+
+
+class FileDelta(NamedTuple):
+    """How one file's findings changed between a run and the run before it."""
+
+    path: str
+    new: int
+    fixed: int
+    unchanged: int
+
+
+class TrendPoint(NamedTuple):
+    run: Run
+    new: int
+    fixed: int
+
+
+class RunRecorder:
+    """Collects one scan's findings file by file; HistoryStore.record writes them."""
+
+    def __init__(self, store: 'HistoryStore', git_commit: Optional[str] = None):
+        self.store = store
+        self.git_commit = git_commit
+        self.files = 0
+        self.findings: Dict[str, Tuple[str, str, str, int, int]] = {}
+
+    def add(self, file_key: str, findings: Iterable[FindingRecord]) -> None:
+        """Record a scanned file, with or without findings."""
+        self.files += 1
+        for fingerprint, rule, text, line, column in findings:
+            self.findings.setdefault(fingerprint, (file_key, rule, text, line, column))
+
+    def finish(self) -> int:
+        return self.store.record(self)
+
+
+class HistoryStore:
+    """The scan history database at `path`, created on first use."""
+
+    def __init__(self, path=DEFAULT_HISTORY):
+        self.path = Path(path)
+        self.db = sqlite3.connect(str(self.path))
+        self.db.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.db.close()
+
+    def run(self, git_commit: Optional[str] = None) -> RunRecorder:
+        return RunRecorder(self, git_commit)
+
+    def record(self, recorder: RunRecorder) -> int:
+        """Store a finished scan as a new run; return its id."""
+        with self.db:
+            previous = self.latest_run_id()
+            cursor = self.db.execute(
+                'INSERT INTO runs (started_at, git_commit, files, findings) VALUES (?, ?, ?, ?)',
+                (
+                    time.strftime('%Y-%m-%d %H:%M UTC', time.gmtime()), recorder.git_commit,
+                    recorder.files, len(recorder.findings),
+                ),
+            )
+            run_id = cursor.lastrowid
+            still_open = dict(self.db.execute(
+                'SELECT fingerprint, id FROM findings WHERE last_run = ?', (previous,),
+            )) if previous is not None else {}
+            file_ids = dict(self.db.execute('SELECT path, id FROM files'))
+
+            extended, opened = [], []
+            for fingerprint, (file_key, rule, text, line, column) in recorder.findings.items():
+                row = still_open.get(fingerprint)
+                if row is not None:
+                    extended.append((line, column, run_id, row))
+                    continue
+                file_id = file_ids.get(file_key)
+                if file_id is None:
+                    file_id = file_ids[file_key] = self.db.execute(
+                        'INSERT INTO files (path) VALUES (?)', (file_key,),
+                    ).lastrowid
+                opened.append((fingerprint, file_id, rule, text, line, column, run_id, run_id))
+
+            self.db.executemany(
+                'UPDATE findings SET line = ?, col = ?, last_run = ? WHERE id = ?', extended,
+            )
+            self.db.executemany(
+                'INSERT INTO findings (fingerprint, file_id, rule, text, line, col, first_run, last_run) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                opened,
+            )
+        return run_id
+
+    def latest_run_id(self) -> Optional[int]:
+        return self.db.execute('SELECT MAX(id) FROM runs').fetchone()[0]
+
+    def previous_run_id(self, run_id: int) -> Optional[int]:
+        return self.db.execute('SELECT MAX(id) FROM runs WHERE id < ?', (run_id,)).fetchone()[0]
+
+    def get_run(self, run_id: int) -> Optional[Run]:
+        row = self.db.execute(
+            'SELECT id, started_at, git_commit, files, findings FROM runs WHERE id = ?', (run_id,),
+        ).fetchone()
+        return Run(*row) if row else None
+
+    def delta(self, run_id: Optional[int] = None) -> List[FileDelta]:
+        """Per-file new / fixed / unchanged counts of `run_id` (default: the latest run) against the run before it.
+
+        Reads only the rows that end at or after the previous run, through the
+        last_run index; for the latest run that is exactly the rows of both runs.
+        Files with no findings in either run are not listed.
+        """
+        if run_id is None:
+            run_id = self.latest_run_id()
+        if run_id is None:
+            return []
+        previous = self.previous_run_id(run_id)
+        rows = self.db.execute(
+            """
+            SELECT files.path,
+                   SUM(findings.first_run = :run),
+                   SUM(findings.last_run = :previous),
+                   SUM(findings.first_run < :run AND findings.last_run >= :run)
+            FROM findings JOIN files ON files.id = findings.file_id
+            WHERE findings.last_run >= :previous AND findings.first_run <= :run
+            GROUP BY findings.file_id
+            ORDER BY files.path
+            """,
+            {'run': run_id, 'previous': previous if previous is not None else -1},
+        )
+        return [FileDelta(*row) for row in rows]
+
+    def trend(self, limit: int = 20) -> List[TrendPoint]:
+        """The last `limit` runs, oldest first, with how many findings each added and fixed."""
+        runs = [Run(*row) for row in self.db.execute(
+            'SELECT id, started_at, git_commit, files, findings FROM runs ORDER BY id DESC LIMIT ?',
+            (limit,),
+        )][::-1]
+        if not runs:
+            return []
+        first = runs[0].id
+        new = dict(self.db.execute(
+            'SELECT first_run, COUNT(*) FROM findings WHERE first_run >= ? GROUP BY first_run', (first,),
+        ))
+        # A row that ended in run P was fixed by the run after P.
+        ended = dict(self.db.execute(
+            'SELECT last_run, COUNT(*) FROM findings WHERE last_run >= ? GROUP BY last_run',
+            (self.previous_run_id(first) or first,),
+        ))
+        points = []
+        previous = self.previous_run_id(first)
+        for run in runs:
+            fixed = ended.get(previous, 0) if previous is not None else 0
+            points.append(TrendPoint(run, new.get(run.id, 0), fixed))
+            previous = run.id
+        return points
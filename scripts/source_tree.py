@@ -0,0 +1,169 @@
+"""Find the source files the i18n scanner reads, without visiting the rest of the tree.
+
+A walk over os.scandir that decides about each directory before descending
+into it. A directory is pruned when it is always ignored (dependencies, build
+output, generated code), when .gitignore ignores it, or when no include glob
+could match anything below it. Only files that are kept become Path objects,
+so the walk's cost follows the files the scanner cares about, not the size of
+node_modules or .svelte-kit.
+
+Files come out in the order of sorted(Path.rglob(...)), i.e. by path
+component, so output written from the walk is the same as before.
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+# What the scanner reads by default: components and routes, plus the TypeScript
+# modules under src/lib (.ts and .svelte.ts) where toasts and errors live.
+DEFAULT_INCLUDE = ['src/**/*.svelte', 'src/lib/**/*.ts']
+# Tests, test helpers and type declarations are never user-facing.
+DEFAULT_EXCLUDE = [
+    '**/*.test.ts', '**/*.spec.ts', '**/*.d.ts', 'src/lib/test-utils/**',
+]
+# Pruned wherever they appear, whatever .gitignore says.
+IGNORED_DIR_NAMES = {'.git', 'node_modules', '.svelte-kit', 'build', '.vercel', '.output'}
+# Generated code: the Paraglide runtime/messages and the OpenAPI client.
+IGNORED_DIRS = ['src/lib/paraglide', 'src/lib/api/generated']
+
+
+def glob_regex(pattern: str) -> 're.Pattern':
+    """Compile a path glob: `*` and `?` stay inside one component, `**` spans any number."""
+    out = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith('**/', i):
+            out.append('(?:.*/)?')
+            i += 3
+        elif pattern.startswith('**', i):
+            out.append('.*')
+            i += 2
+        elif pattern[i] == '*':
+            out.append('[^/]*')
+            i += 1
+        elif pattern[i] == '?':
+            out.append('[^/]')
+            i += 1
+        else:
+            out.append(re.escape(pattern[i]))
+            i += 1
+    return re.compile(''.join(out) + r'\Z')
+
+
+def _literal_prefix(pattern: str) -> str:
+    """The directories a glob is anchored to before its first wildcard ('src/lib' for 'src/lib/**/*.ts')."""
+    parts = []
+    for part in pattern.split('/')[:-1]:
+        if any(char in part for char in '*?['):
+            break
+        parts.append(part)
+    return '/'.join(parts)
+
+
+class IgnoreRules:
+    """The subset of .gitignore the walk needs: globs, `/` anchoring, dir-only `/` suffix and `!`.
+
+    As in git, the last matching pattern wins, and a pattern without a slash
+    (other than a trailing one) matches a name at any depth.
+    """
+
+    def __init__(self, lines: Iterable[str] = ()):
+        self.rules: List[Tuple['re.Pattern', bool, bool, bool]] = []
+        for line in lines:
+            line = line.rstrip('\n').rstrip()
+            if not line or line.startswith('#'):
+                continue
+            negated = line.startswith('!')
+            if negated:
+                line = line[1:]
+            dir_only = line.endswith('/')
+            line = line.rstrip('/')
+            anchored = '/' in line
+            self.rules.append((glob_regex(line.lstrip('/')), anchored, dir_only, negated))
+
+    @classmethod
+    def load(cls, path: Path) -> 'IgnoreRules':
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return cls(f)
+        except FileNotFoundError:
+            return cls()
+
+    def ignores(self, rel_path: str, name: str, is_dir: bool) -> bool:
+        ignored = False
+        for regex, anchored, dir_only, negated in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if regex.match(rel_path if anchored else name):
+                ignored = not negated
+        return ignored
+
+
+class SourceWalker:
+    """Yield the files under `root` that the include globs select and nothing excludes."""
+
+    def __init__(
+        self,
+        root: Path = Path('.'),
+        include: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+        ignore: Optional[IgnoreRules] = None,
+    ):
+        self.root = Path(root)
+        include = include or DEFAULT_INCLUDE
+        exclude = DEFAULT_EXCLUDE if exclude is None else exclude
+        self.include = [glob_regex(pattern) for pattern in include]
+        self.exclude = [glob_regex(pattern) for pattern in exclude]
+        self.prefixes = {_literal_prefix(pattern) for pattern in include}
+        self.ignore = IgnoreRules.load(self.root / '.gitignore') if ignore is None else ignore
+        self.ignored_dirs = set(IGNORED_DIRS)
+
+    def _descend(self, rel_dir: str, name: str) -> bool:
+        if name in IGNORED_DIR_NAMES or rel_dir in self.ignored_dirs:
+            return False
+        if self.ignore.ignores(rel_dir, name, True):
+            return False
+        # An exclude glob ending in /** rules out the whole directory.
+        if any(regex.match(rel_dir + '/') for regex in self.exclude):
+            return False
+        # Only directories on the way to, or below, an include glob's anchor.
+        return any(
+            not prefix or prefix == rel_dir
+            or prefix.startswith(rel_dir + '/') or rel_dir.startswith(prefix + '/')
+            for prefix in self.prefixes
+        )
+
+    def _keep(self, rel_path: str, name: str) -> bool:
+        return (
+            any(regex.match(rel_path) for regex in self.include)
+            and not any(regex.match(rel_path) for regex in self.exclude)
+            and not self.ignore.ignores(rel_path, name, False)
+        )
+
+    def selects(self, rel_path: str) -> bool:
+        """Whether the walk would yield `rel_path` ('/'-separated, relative to root)."""
+        parts = rel_path.split('/')
+        for depth in range(1, len(parts)):
+            if not self._descend('/'.join(parts[:depth]), parts[depth - 1]):
+                return False
+        return self._keep(rel_path, parts[-1])
+
+    def __iter__(self) -> Iterator[Path]:
+        """Yield the selected files as paths relative to root, in sorted-path order."""
+        yield from self._walk(self.root, '')
+
+    def _walk(self, directory: Path, rel_dir: str) -> Iterator[Path]:
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            return
+        for entry in entries:
+            rel_path = f'{rel_dir}/{entry.name}' if rel_dir else entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if self._descend(rel_path, entry.name):
+                    yield from self._walk(Path(entry.path), rel_path)
+            elif self._keep(rel_path, entry.name):
+                yield Path(rel_path)
@@ -0,0 +1,186 @@
+"""Generate synthetic .svelte trees for benchmarking the i18n tooling.
+
+The corpus imitates src/ closely enough to exercise every scanner path:
+script blocks with imports, runes, comments and toasts, markup with
+attributes, Paraglide calls and text nodes, and style blocks. Output is a pure
+function of the CorpusSpec, so two runs with the same spec produce the same
+bytes and benchmark numbers stay comparable across machines and commits.
+
+Scale 1 is the size of the real tree (640 files, median ~140 lines). A small
+fraction of files are long outliers, like the handful of admin pages that run
+past 700 lines.
+"""
+
+import json
+import os
+import random
+import re
+import shutil
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+BASE_FILES = 640
+
+_AREAS = [
+    'account', 'attendees', 'billing', 'common', 'dashboard', 'events', 'forms',
+    'members', 'organizations', 'polls', 'questionnaires', 'tickets', 'tokens', 'venues',
+]
+_ROUTES = [
+    '(public)/events/[slug]', '(public)/org/[slug]', '(auth)/dashboard',
+    '(auth)/account/settings', '(auth)/org/[slug]/admin/events', '(auth)/org/[slug]/admin/members',
+]
+_NOUNS = ['event', 'ticket', 'member', 'invitation', 'venue', 'poll', 'token', 'payment', 'profile']
+_VERBS = ['load', 'save', 'delete', 'update', 'create', 'send', 'export', 'archive']
+_WORDS = [
+    'your', 'the', 'this', 'new', 'all', 'members', 'changes', 'settings', 'before',
+    'continue', 'organization', 'attendees', 'details', 'again', 'later', 'now',
+]
+
+# Hardcoded strings in the shapes the scanner looks for, one template per
+# PATTERNS family plus plain text nodes for the HTML pass. `{noun}`, `{verb}`,
+# `{word}` and `{Word}` are slots; every other brace is literal Svelte.
+_HARDCODED = [
+    "\ttoast.error('Failed to {verb} {noun}');",
+    "\ttoast.success('Successfully updated {noun}');",
+    "\terror = 'Unable to {verb} the {noun}';",
+    '\tconst label = "{Word} {word} {word}";',
+    "\tif (!confirm('Are you sure you want to {verb} this {noun}?')) return;",
+]
+_HARDCODED_MARKUP = [
+    '<p>{Word} {word} {word} {word}</p>',
+    '<Button title="{Word} {word} {noun}">{Word} {word}</Button>',
+    '<span class="hint">Please {verb} {word} {noun}</span>',
+    '<h2>{Word} {word} {noun}</h2>',
+]
+# Lines the scanner must read and reject.
+_CLEAN_SCRIPT = [
+    "\timport { {noun}Store } from '$lib/stores/{noun}';",
+    '\tlet {noun}Count = $state(0);',
+    '\tconst {noun}Url = `/api/{noun}s/${id}`;',
+    '\t// {Word} {word} {word} when the {noun} changes',
+    "\tconst message = m['{noun}.{verb}Success']();",
+    '\t$effect(() => { {noun}Count += 1; });',
+]
+_CLEAN_MARKUP = [
+    '<div class="flex items-center gap-2">',
+    '</div>',
+    "<p>{m['{noun}.{verb}Title']()}</p>",
+    '<input type="text" placeholder="{Word} {word}" bind:value={{noun}Name} />',
+    '<!-- {Word} {word} {word} -->',
+    '{#if {noun}Count > 0}',
+    '{/if}',
+    "<a href=\"/{noun}s/{id}\" aria-label={m['{noun}.open']()}>{id}</a>",
+]
+_SLOT = re.compile(r'\{(noun|verb|word|Word)\}')
+_SLOT_WORDS = {'noun': _NOUNS, 'verb': _VERBS, 'word': _WORDS}
+
+
+@dataclass(frozen=True)
+class CorpusSpec:
+    """Everything that determines a corpus; equal specs give identical trees."""
+
+    scale: float = 1.0
+    density: float = 0.08  # chance that a generated line carries a hardcoded string
+    outlier_rate: float = 0.02  # fraction of files that are long outliers
+    outlier_factor: int = 5  # how many times longer an outlier is
+    median_lines: int = 140
+    seed: int = 640
+
+    @property
+    def files(self) -> int:
+        return max(1, round(BASE_FILES * self.scale))
+
+
+def _fill(rng: random.Random, template: str) -> str:
+    def choose(slot):
+        name = slot.group(1)
+        if name == 'Word':
+            return rng.choice(_WORDS).capitalize()
+        return rng.choice(_SLOT_WORDS[name])
+
+    return _SLOT.sub(choose, template)
+
+
+def _relative_path(rng: random.Random, index: int) -> Path:
+    name = f'{rng.choice(_NOUNS).capitalize()}{rng.choice(_VERBS).capitalize()}{index}.svelte'
+    if rng.random() < 0.75:
+        return Path('lib', 'components', rng.choice(_AREAS), name)
+    route = Path('routes', *rng.choice(_ROUTES).split('/'), f'r{index % 50}')
+    return route / ('+page.svelte' if rng.random() < 0.5 else name)
+
+
+def _section(rng: random.Random, lines: int, hardcoded: List[str], clean: List[str], density: float):
+    for _ in range(lines):
+        pool = hardcoded if rng.random() < density else clean
+        yield _fill(rng, rng.choice(pool))
+
+
+def render_file(rng: random.Random, lines: int, density: float) -> str:
+    script_lines = max(2, lines // 3)
+    markup_lines = max(2, lines - script_lines - 6)
+    parts = ['<script lang="ts">']
+    parts.extend(_section(rng, script_lines, _HARDCODED, _CLEAN_SCRIPT, density))
+    parts.append('</script>')
+    parts.append('')
+    parts.extend(_section(rng, markup_lines, _HARDCODED_MARKUP, _CLEAN_MARKUP, density))
+    parts.append('')
+    parts.append('<style>')
+    parts.append('\t.hint { color: var(--muted); content: "Please wait"; }')
+    parts.append('</style>')
+    return '\n'.join(parts) + '\n'
+
+
+def iter_corpus(spec: CorpusSpec) -> Iterator[Tuple[Path, str]]:
+    """Yield (path relative to the project root, content) for every file in the corpus."""
+    rng = random.Random(spec.seed)
+    seen = set()
+    for index in range(spec.files):
+        path = Path('src') / _relative_path(rng, index)
+        while path in seen:  # a second +page.svelte in the same route
+            path = path.with_name(f'Page{index}.svelte')
+        seen.add(path)
+        lines = max(10, int(rng.lognormvariate(0, 0.6) * spec.median_lines))
+        if rng.random() < spec.outlier_rate:
+            lines *= spec.outlier_factor
+        yield path, render_file(rng, lines, spec.density)
+
+
+MANIFEST = 'corpus.json'
+
+
+def generate(spec: CorpusSpec, root: Path) -> Path:
+    """Write the corpus under `root` (reusing it if a matching one is there); return root.
+
+    The spec is recorded in root/corpus.json. An existing corpus with the
+    same spec is left alone, since 100x takes a while to write. The corpus is
+    written to a temporary sibling of `root` and renamed into place, so an
+    interrupted run leaves `root` as it was rather than a src/ without its
+    manifest.
+    """
+    root = Path(root)
+    manifest = root / MANIFEST
+    if manifest.exists() and json.loads(manifest.read_text()) == asdict(spec):
+        return root
+    if manifest.exists() or (root / 'src').exists():
+        raise FileExistsError(f'{root} holds a different corpus; remove it first')
+
+    root.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=f'.{root.name}-', dir=root.parent))
+    try:
+        for path, content in iter_corpus(spec):
+            target = staging / path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(content, encoding='utf-8')
+        (staging / MANIFEST).write_text(json.dumps(asdict(spec), indent=2) + '\n')
+        if root.exists():
+            # The manifest goes last: a root with src/ but no corpus.json is
+            # never a finished corpus.
+            os.replace(staging / 'src', root / 'src')
+            os.replace(staging / MANIFEST, manifest)
+        else:
+            os.replace(staging, root)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    return root
@@ -0,0 +1,111 @@
+"""Split a .svelte file into the regions the i18n scanner treats differently.
+
+A lightweight streaming lexer, not a parser: it walks the source once and
+yields (kind, start, end) regions that cover the whole text in order, so a
+caller can hand each region to the rules that apply to it and map offsets back
+to lines itself. Kinds:
+
+  MARKUP   template markup, including `{...}` expressions
+  SCRIPT   the body (and tags) of a <script> block, minus the regions below
+  IMPORT   an import declaration inside a <script> block, multi-line included
+  STYLE    a whole <style> block
+  COMMENT  <!-- ... --> in markup, // and /* */ in script
+
+Script bodies are tokenised just enough to tell a `//` inside a string or a
+template literal from a real comment. Regex literals are not recognised; a
+`//` inside one starts a comment, which only ever hides text from the scanner.
+"""
+
+import re
+from typing import Iterator, Tuple
+
+MARKUP = 'markup'
+SCRIPT = 'script'
+IMPORT = 'import'
+STYLE = 'style'
+COMMENT = 'comment'
+
+_MARKUP_EVENT = re.compile(r'<!--|<(script|style)\b[^>]*>')
+_STYLE_END = re.compile(r'</style\s*>')
+_SCRIPT_EVENT = re.compile(
+    r"""(?P<close></script\s*>)"""
+    r"""|(?P<line_comment>//)"""
+    r"""|(?P<block_comment>/\*)"""
+    r"""|(?P<quote>['"`])"""
+    r"""|(?P<import>(?m:^[ \t]*import\b)(?![ \t]*[(.]))"""
+)
+_STRING_END = {
+    "'": re.compile(r"(?:[^'\\\n]|\\.)*(?:'|$)", re.MULTILINE),
+    '"': re.compile(r'(?:[^"\\\n]|\\.)*(?:"|$)', re.MULTILINE),
+    '`': re.compile(r'(?:[^`\\]|\\.)*(?:`|\Z)', re.DOTALL),
+}
+# An import runs to the end of its first string literal (the module specifier).
+_IMPORT_END = re.compile(r"""[^'"<;]*(?:'[^'\n]*'|"[^"\n]*")[ \t]*;?""")
+
+Region = Tuple[str, int, int]
+
+
+def lex(content: str) -> Iterator[Region]:
+    """Yield (kind, start, end) for consecutive regions covering `content`."""
+    pos, size = 0, len(content)
+    while pos < size:
+        event = _MARKUP_EVENT.search(content, pos)
+        if event is None:
+            yield MARKUP, pos, size
+            return
+        if event.start() > pos:
+            yield MARKUP, pos, event.start()
+
+        tag = event.group(1)
+        if not tag:
+            close = content.find('-->', event.end())
+            pos = size if close == -1 else close + 3
+            yield COMMENT, event.start(), pos
+        elif tag == 'style':
+            close = _STYLE_END.search(content, event.end())
+            pos = size if close is None else close.end()
+            yield STYLE, event.start(), pos
+        else:
+            yield SCRIPT, event.start(), event.end()
+            pos = yield from _lex_script(content, event.end())
+
+
+def lex_script(content: str) -> Iterator[Region]:
+    """Yield the regions of a bare script module (.ts, .svelte.ts): no markup, no <script> tag."""
+    yield from _lex_script(content, 0)
+
+
+def _lex_script(content: str, pos: int):
+    """Yield the regions of a script body; return the offset after </script>."""
+    size = len(content)
+    start = pos
+    while True:
+        event = _SCRIPT_EVENT.search(content, pos)
+        if event is None:
+            if size > start:
+                yield SCRIPT, start, size
+            return size
+
+        kind = event.lastgroup
+        if kind == 'quote':
+            pos = _STRING_END[event.group()].match(content, event.end()).end()
+            continue
+
+        if event.start() > start:
+            yield SCRIPT, start, event.start()
+        if kind == 'close':
+            yield SCRIPT, event.start(), event.end()
+            return event.end()
+        if kind == 'line_comment':
+            newline = content.find('\n', event.end())
+            pos = size if newline == -1 else newline
+            yield COMMENT, event.start(), pos
+        elif kind == 'block_comment':
+            close = content.find('*/', event.end())
+            pos = size if close == -1 else close + 2
+            yield COMMENT, event.start(), pos
+        else:
+            declaration = _IMPORT_END.match(content, event.end())
+            pos = declaration.end() if declaration else event.end()
+            yield IMPORT, event.start(), pos
+        start = pos
@@ -0,0 +1,62 @@
+"""The results the hardcoded-string scanner hands to the sweep report.
+
+A FileResult is what the report needs to know about one file with findings:
+its results key (the path relative to src/), its priority, how many findings
+it has and the first few as (line, text) samples. The scanner builds them
+while it scans and the report aggregates them directly, so the two can run in
+one process without i18n-scan-results.json in between; from_entry/to_entry
+convert to and from that file's entries when it is wanted.
+
+Results are slotted and their strings interned: the priority labels come from
+a set of three, and sample texts such as 'Cancel' or 'Save changes' repeat
+across hundreds of files, so one copy of each is shared.
+"""
+
+import sys
+from dataclasses import dataclass
+from typing import Iterable, Tuple
+
+HIGH, MED, LOW = '🔴 HIGH', '🟡 MED', '🟢 LOW'
+# Sample strings a result keeps, as in the 'strings' of a results entry.
+MAX_STRINGS = 10
+
+
+@dataclass
+class FileResult:
+    """One scanned file with findings."""
+
+    __slots__ = ('path', 'priority', 'count', 'strings')
+
+    path: str
+    priority: str
+    count: int
+    strings: Tuple[Tuple[int, str], ...]
+
+    @classmethod
+    def build(cls, path: str, priority: str, count: int, strings: Iterable) -> 'FileResult':
+        """A result with its strings interned and at most MAX_STRINGS samples."""
+        samples = []
+        for line_num, text in strings:
+            if len(samples) == MAX_STRINGS:
+                break
+            samples.append((line_num, sys.intern(text)))
+        return cls(sys.intern(path), sys.intern(priority), count, tuple(samples))
+
+    @classmethod
+    def from_entry(cls, path: str, entry: dict) -> 'FileResult':
+        """Read an i18n-scan-results.json entry (suggestions, if any, are dropped)."""
+        return cls.build(path, entry['priority'], entry['count'], entry['strings'])
+
+    def to_entry(self) -> dict:
+        """The i18n-scan-results.json entry for this result, without suggestions."""
+        return {
+            'priority': self.priority,
+            'count': self.count,
+            'strings': [list(sample) for sample in self.strings],
+        }
+
+    def trimmed(self, samples: int) -> 'FileResult':
+        """The same result keeping only its first `samples` strings."""
+        if len(self.strings) <= samples:
+            return self
+        return FileResult(self.path, self.priority, self.count, self.strings[:samples])
@@ -0,0 +1,740 @@
+"""
+Generate updated i18n-sweep.md with scan results.
+
+The library behind scripts/generate-sweep-report.py. ReportIndex aggregates
+FileResults (from the scanner in-process, or read back from
+i18n-scan-results.json / --jsonl output) and the SECTIONS render them.
+"""
+
+import hashlib
+import heapq
+import json
+import os
+import re
+from itertools import islice
+from pathlib import Path
+from collections import Counter, defaultdict
+from typing import Dict, FrozenSet, NamedTuple, Optional, Tuple
+
+from columnar_results import COLUMNAR_RESULTS_FILE, ColumnarResults
+from duplicate_index import DUPLICATES_FILE, DuplicateIndex
+from scan_history import DEFAULT_HISTORY, HistoryStore
+from source_tree import SourceWalker
+from sweep_model import HIGH, LOW, MED, FileResult
+
+RESULTS_FILE = 'i18n-scan-results.json'
+SWEEP_FILE = 'i18n-sweep.md'
+
+def load_scan_results():
+    """Load the scan results JSON."""
+    with open(RESULTS_FILE, 'r') as f:
+        return json.load(f)
+
+def iter_scan_results(path=RESULTS_FILE, chunk_size=1 << 16):
+    """Yield (file, entry) from i18n-scan-results.json without loading it whole.
+
+    The file is one object of per-file entries. It is read in chunks and each
+    key and entry is decoded with JSONDecoder.raw_decode as soon as the buffer
+    holds all of it, so memory holds one chunk plus one entry, not the file.
+    An entry is an object, so a decode that succeeds cannot be a prefix of a
+    longer value.
+    """
+    decoder = json.JSONDecoder()
+    with open(path, 'r', encoding='utf-8') as f:
+        buffer, pos, eof = '', 0, False
+
+        def skip(chars):
+            nonlocal buffer, pos, eof
+            while True:
+                while pos < len(buffer) and buffer[pos] in chars:
+                    pos += 1
+                if pos < len(buffer) or eof:
+                    return
+                buffer, pos = f.read(chunk_size), 0
+                eof = not buffer
+
+        def decode():
+            nonlocal buffer, pos, eof
+            while True:
+                try:
+                    value, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    more = f.read(chunk_size)
+                    eof = not more
+                    buffer, pos = buffer[pos:] + more, 0
+                    continue
+                pos = end
+                return value
+
+        skip(' \t\r\n')
+        if buffer[pos:pos + 1] != '{':
+            raise ValueError(f'{path} is not a JSON object')
+        pos += 1
+        while True:
+            skip(' \t\r\n,')
+            if buffer[pos:pos + 1] == '}' or eof:
+                return
+            key = decode()
+            skip(' \t\r\n:')
+            yield key, decode()
+
+def iter_jsonl_results(path, duplicates=None):
+    """Yield (file, entry) from a scan-hardcoded-strings.py --jsonl file.
+
+    Findings arrive grouped by file, so consecutive records are folded into
+    the same shape as a results entry (first 10 strings kept) and each file
+    is yielded as soon as the next one starts. Every finding, not just the
+    first 10, also goes into the DuplicateIndex `duplicates` if one is given.
+    """
+    file_key, entry = None, None
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if record['file'] != file_key:
+                if entry is not None:
+                    yield file_key, entry
+                file_key = record['file']
+                entry = {'priority': record['priority'], 'count': 0, 'strings': []}
+            entry['count'] += 1
+            if duplicates is not None:
+                duplicates.add(file_key, [(record['line'], record['text'])])
+            if len(entry['strings']) < 10:
+                entry['strings'].append([record['line'], record['text']])
+    if entry is not None:
+        yield file_key, entry
+
+def directory_group(file_path):
+    """The report section a results key (a path relative to src/) is listed under."""
+    parts = Path(file_path).parts
+    if len(parts) > 1:
+        if parts[0] == 'lib':
+            if len(parts) > 2:
+                return f"src/lib/components/{parts[2]}"
+            return f"src/lib/components/{parts[1]}"
+        if parts[0] == 'routes':
+            return f"src/routes/{'/'.join(parts[1:-1])}"
+        return f"src/{parts[0]}"
+    return "src"
+
+
+def file_entry(file_path, data):
+    return {
+        'path': file_path,
+        'filename': Path(file_path).name,
+        'priority': data['priority'],
+        'count': data['count'],
+        'strings': data['strings']
+    }
+
+
+def group_files_by_directory(results):
+    """Group files by their directory structure."""
+    grouped = defaultdict(list)
+    for file_path, data in results.items():
+        grouped[directory_group(file_path)].append(file_entry(file_path, data))
+    return grouped
+
+
+# Sample strings the report prints per file; only HIGH files show any.
+SAMPLE_STRINGS = {HIGH: 5}
+
+
+class ReportIndex:
+    """Everything the markdown renders, gathered in one pass over the results.
+
+    Per-priority file counts and string sums, the directory groups, the files of
+    each priority in results order, and the top-N lists, which are kept in
+    bounded heaps while the pass runs. Heap entries carry the negated arrival
+    order, so ties come out first-seen first, exactly like the stable
+    `sorted(..., key=count, reverse=True)[:n]` the report used to take.
+
+    `results` may be a stream of FileResults, a results dict or a stream of
+    (file, entry) pairs. Results are trimmed to what the report prints as they
+    arrive, so the index grows with the number of files, not the findings.
+
+    `total_files` is how many files the scan covered, clean ones included (the
+    results only list files with findings). `statuses` holds the checkbox of
+    each (group, filename) carried over from the previous report. `history`
+    is the scan history database the delta and burn-down sections query, and
+    `duplicates` the DuplicateIndex behind the shared-strings section.
+    """
+
+    TOP_HIGH = 10
+    TOP_MED = 20
+
+    def __init__(self, results, total_files=None, statuses=None, history=None, duplicates=None):
+        if isinstance(results, dict):
+            results = results.items()
+        elif isinstance(results, ColumnarResults):
+            results = results.results(SAMPLE_STRINGS)
+        self.statuses = statuses if statuses is not None else {}
+        self.history = history
+        self.duplicates = duplicates
+        self.files = 0
+        self.counts = Counter()
+        self.sums = Counter()
+        self.by_priority = defaultdict(list)
+        self.grouped = defaultdict(list)
+        self._top = {HIGH: [], MED: []}
+        limits = {HIGH: self.TOP_HIGH, MED: self.TOP_MED}
+
+        for seq, result in enumerate(results):
+            if not isinstance(result, FileResult):
+                result = FileResult.from_entry(*result)
+            priority, count = result.priority, result.count
+            result = result.trimmed(SAMPLE_STRINGS.get(priority, 0))
+            self.files += 1
+            self.counts[priority] += 1
+            self.sums[priority] += count
+            self.by_priority[priority].append(result)
+            self.grouped[directory_group(result.path)].append(result)
+
+            heap = self._top.get(priority)
+            if heap is not None:
+                entry = (count, -seq, result)
+                if len(heap) < limits[priority]:
+                    heapq.heappush(heap, entry)
+                else:
+                    heapq.heappushpop(heap, entry)
+
+        self.total_files = self.files if total_files is None else max(total_files, self.files)
+
+    @property
+    def clean_files(self):
+        return self.total_files - self.files
+
+    @property
+    def strings(self):
+        return sum(self.sums.values())
+
+    def top(self, priority):
+        """The largest files of a priority (TOP_HIGH / TOP_MED of them), most strings first."""
+        return [result for _, _, result in sorted(self._top[priority], reverse=True)]
+
+    def ranked(self, priority):
+        """Every file of a priority, most strings first, ties in results order."""
+        return sorted(self.by_priority[priority], key=lambda result: result.count, reverse=True)
+
+
+def _preamble(index):
+    yield "# i18n Translation Sweep - Complete Inventory"
+    yield ""
+    yield f"**Total Files**: {index.total_files}"
+    yield f"**Files with Hardcoded Strings**: {index.files}"
+    yield f"**Files Already Clean**: {index.clean_files}"
+    yield f"**Total Strings to Translate**: ~{index.strings}"
+    yield "**Status**: Initial scan complete - ready for systematic translation"
+    yield "**Created**: 2025-01-04"
+    yield ""
+    yield "---"
+    yield ""
+
+def _how_to_use(index):
+    yield "## How to Use This File"
+    yield ""
+    yield "- [ ] = Not checked yet / needs translation"
+    yield "- [~] = In progress"
+    yield "- [x] = Completed (all strings translated)"
+    yield "- [SKIP] = No user-facing strings (e.g., test files, demos)"
+    yield ""
+    yield "Mark findings with:"
+    yield "- 🔴 HIGH: User-facing UI strings"
+    yield "- 🟡 MED: Admin/staff strings"
+    yield "- 🟢 LOW: Debug/internal strings"
+    yield "- ⚪ NONE: No hardcoded strings found"
+    yield ""
+    yield "---"
+    yield ""
+
+def _summary_statistics(index):
+    yield "## Summary Statistics"
+    yield ""
+    yield f"- 🔴 **HIGH Priority**: {index.counts[HIGH]} files (~{index.sums[HIGH]} strings)"
+    yield f"- 🟡 **MEDIUM Priority**: {index.counts[MED]} files (~{index.sums[MED]} strings)"
+    yield f"- 🟢 **LOW Priority**: {index.counts[LOW]} files (~{index.sums[LOW]} strings)"
+    yield f"- ⚪ **Clean**: {index.clean_files} files"
+    yield ""
+    yield "---"
+    yield ""
+
+def _changes(index):
+    if index.history is None:
+        return
+    deltas = index.history.delta()
+    if not deltas:
+        return
+    run = index.history.get_run(index.history.latest_run_id())
+    previous = index.history.previous_run_id(run.id)
+
+    yield "## Changes Since Last Scan"
+    yield ""
+    commit = f", `{run.git_commit}`" if run.git_commit else ""
+    if previous is None:
+        yield f"**Run {run.id}** ({run.started_at}{commit}) is the first recorded scan; nothing to compare yet."
+        yield ""
+        yield "---"
+        yield ""
+        return
+
+    # Fold the per-file counts into the report's directory groups.
+    by_group = defaultdict(lambda: [0, 0, 0])
+    for delta in deltas:
+        counts = by_group[directory_group(delta.path)]
+        counts[0] += delta.new
+        counts[1] += delta.fixed
+        counts[2] += delta.unchanged
+    new, fixed, unchanged = (sum(counts[i] for counts in by_group.values()) for i in range(3))
+    yield f"**Run {run.id}** ({run.started_at}{commit}) against run {previous}: {new} new, {fixed} fixed, {unchanged} unchanged"
+    yield ""
+
+    # Regressing directories first, then the most improved.
+    moved = sorted(
+        ((group, counts) for group, counts in by_group.items() if counts[0] or counts[1]),
+        key=lambda item: (item[1][1] - item[1][0], item[0]),
+    )
+    if moved:
+        yield "| Directory | New | Fixed | Unchanged |"
+        yield "|-----------|----:|------:|----------:|"
+        for group, (group_new, group_fixed, group_unchanged) in moved:
+            yield f"| {group} | +{group_new} | -{group_fixed} | {group_unchanged} |"
+        yield ""
+    still = len(by_group) - len(moved)
+    if still:
+        yield f"{still} other directories unchanged."
+        yield ""
+    yield "---"
+    yield ""
+
+# Runs the burn-down shows, and the width of its bars
+TREND_RUNS = 20
+TREND_WIDTH = 20
+
+def _burn_down(index):
+    if index.history is None:
+        return
+    points = index.history.trend(TREND_RUNS)
+    if not points:
+        return
+    widest = max(point.run.findings for point in points) or 1
+
+    yield "## Burn-down"
+    yield ""
+    yield "| Run | Date | Commit | Strings | New | Fixed | Trend |"
+    yield "|----:|------|--------|--------:|----:|------:|-------|"
+    for run, new, fixed in points:
+        bar = "█" * round(TREND_WIDTH * run.findings / widest)
+        commit = f"`{run.git_commit}`" if run.git_commit else ""
+        yield f"| {run.id} | {run.started_at} | {commit} | {run.findings} | +{new} | -{fixed} | {bar} |"
+    yield ""
+    yield "---"
+    yield ""
+
+def _priority_files(index):
+    yield "## Priority Files - Start Here!"
+    yield ""
+    yield "### 🔴 TOP 10 HIGH PRIORITY FILES"
+    yield ""
+
+    # Get top 10 high priority files
+    for i, result in enumerate(index.top(HIGH), 1):
+        yield f"{i}. **{Path(result.path).name}** ({result.count} strings)"
+        yield f"   - Path: `{result.path}`"
+        if result.strings:
+            yield f"   - Examples: `{result.strings[0][1][:50]}`, `{result.strings[1][1][:50] if len(result.strings) > 1 else '...'}`"
+        yield ""
+
+    yield "---"
+    yield ""
+
+# Shared strings listed, and locations spelled out per string
+SHARED_STRINGS = 25
+SHARED_LOCATIONS = 5
+
+def _shared_strings(index):
+    if index.duplicates is None:
+        return
+    ranked = index.duplicates.ranked()
+    if not ranked:
+        return
+    places = sum(count for _, count in ranked)
+
+    yield "## Shared Strings - One Key, Many Fixes"
+    yield ""
+    yield f"{len(ranked)} strings are hardcoded in more than one place ({places} places in all). "\
+        "One new message key fixes every place a string appears."
+    yield ""
+    yield "| # | String | Places | Locations |"
+    yield "|--:|--------|-------:|-----------|"
+    for i, (text, count) in enumerate(ranked[:SHARED_STRINGS], 1):
+        locations = islice(index.duplicates.locations(text), SHARED_LOCATIONS)
+        shown = ", ".join(f"`{file_path}:{line_num}`" for file_path, line_num in locations)
+        if count > SHARED_LOCATIONS:
+            shown += f" (+{count - SHARED_LOCATIONS} more)"
+        yield f"| {i} | `{text[:60]}` | {count} | {shown} |"
+    yield ""
+    yield "---"
+    yield ""
+
+# Common directory groups, listed even when they have no findings
+COMMON_GROUPS = [
+    "src/lib/components/common",
+    "src/lib/components/events",
+    "src/lib/components/events/admin",
+    "src/lib/components/organizations",
+    "src/lib/components/members",
+    "src/lib/components/questionnaires",
+    "src/lib/components/forms",
+    "src/lib/components/tickets",
+    "src/lib/components/tokens",
+    "src/lib/components/resources",
+    "src/routes/(public)",
+    "src/routes/(auth)/dashboard",
+    "src/routes/(auth)/account",
+    "src/routes/(auth)/org/[slug]/admin",
+]
+
+FILE_LIST_HEADING = "## Complete File List (Grouped by Directory)"
+
+def _file_list(index):
+    yield FILE_LIST_HEADING
+    yield ""
+
+    # Group files by directory
+    grouped = index.grouped
+
+    # Add all other groups
+    all_groups = sorted(set(list(grouped.keys()) + COMMON_GROUPS))
+
+    for group in all_groups:
+        yield f"### {group}"
+        yield ""
+
+        files = grouped.get(group, [])
+        if files:
+            for filename, result in sorted(((Path(result.path).name, result) for result in files), key=lambda x: x[0]):
+                status = index.statuses.get((group, filename))
+                if status is None:
+                    status = "[ ]" if result.count > 0 else "[x]"
+                priority = result.priority if result.count > 0 else "⚪"
+                yield f"- {status} `{filename}` {priority} ({result.count} strings)"
+        else:
+            yield "- (No files with hardcoded strings)"
+
+        yield ""
+
+    yield "---"
+    yield ""
+
+DETAILED_FINDINGS_HEADING = "## Detailed Findings"
+
+def _detailed_findings(index):
+    yield DETAILED_FINDINGS_HEADING
+    yield ""
+    yield "### 🔴 HIGH Priority - User-Facing Strings"
+    yield ""
+
+    for result in index.ranked(HIGH):
+        yield f"#### {Path(result.path).name}"
+        yield f"**Path**: `{result.path}`"
+        yield f"**Count**: {result.count} hardcoded strings"
+        yield ""
+        yield "**Sample Strings**:"
+        for line_num, string in result.strings[:5]:
+            yield f"- Line {line_num}: `{string}`"
+        if result.count > 5:
+            yield f"- ... and {result.count - 5} more"
+        yield ""
+
+    yield "### 🟡 MEDIUM Priority - Admin/Staff Strings"
+    yield ""
+
+    for result in index.top(MED):  # Show top 20 only
+        yield f"#### {Path(result.path).name}"
+        yield f"**Path**: `{result.path}` | **Count**: {result.count} strings"
+        yield ""
+
+    yield "### 🟢 LOW Priority - Internal Strings"
+    yield ""
+
+    for result in index.ranked(LOW):
+        yield f"- `{result.path}` ({result.count} strings)"
+
+    yield ""
+    yield "---"
+    yield ""
+
+def _next_steps(index):
+    yield "## Next Steps"
+    yield ""
+    yield "1. **Start with HIGH priority files** - Focus on user-facing components first"
+    yield "2. **Extract strings to translation files** - Add to messages/en.json, de.json, it.json"
+    yield "3. **Replace with m['key']() calls** - Use Paraglide translation syntax"
+    yield "4. **Test in all 3 languages** - Verify translations work correctly"
+    yield "5. **Mark files as complete** - Update checkboxes as you go"
+    yield "6. **Run static checks** - Use `pnpm i18n:check-imports` before committing"
+    yield ""
+
+# The report, top to bottom. Each section yields its own lines, ending with the
+# blank line that separates it from the next one; the history sections yield
+# nothing when there is no scan history.
+SECTIONS = [
+    _preamble,
+    _how_to_use,
+    _summary_statistics,
+    _changes,
+    _burn_down,
+    _priority_files,
+    _shared_strings,
+    _file_list,
+    _detailed_findings,
+    _next_steps,
+]
+
+def iter_markdown(index):
+    """Yield the report's lines, section by section."""
+    for section in SECTIONS:
+        yield from section(index)
+
+def generate_markdown(results, all_svelte_files):
+    """Generate the updated markdown content."""
+    return '\n'.join(iter_markdown(ReportIndex(results, total_files=all_svelte_files)))
+
+def write_markdown(index, path=SWEEP_FILE):
+    """Write the report to `path` a line at a time; the same bytes as generate_markdown."""
+    with open(path, 'w') as f:
+        lines = iter_markdown(index)
+        f.write(next(lines))
+        for line in lines:
+            f.write('\n')
+            f.write(line)
+
+# A file-list line: "- [~] `EventCard.svelte` 🔴 HIGH (4 strings)".
+_STATUS_LINE = re.compile(r"- (\[(?: |~|x|X|SKIP)\]) `([^`]+)`.* \((\d+) strings\)$")
+# In the detailed findings: "**Path**: `lib/...`" and "- Line 12: `Save`".
+_PATH_LINE = re.compile(r"\*\*Path\*\*: `([^`]+)`")
+_SAMPLE_LINE = re.compile(r"- Line \d+: `(.*)`$")
+
+def _is_heading(line):
+    return line.startswith("# ") or line.startswith("## ")
+
+
+class Section(NamedTuple):
+    """Where a section of an existing report lies in the file, and a digest of its text."""
+
+    digest: str
+    start: int
+    end: int
+
+
+class SweepState(NamedTuple):
+    """What update_markdown needs from the report it updates."""
+
+    sections: Dict[Optional[str], Section]  # heading (None: text above the title) -> section
+    statuses: Dict[Tuple[str, str], str]  # (group, filename) -> checkbox
+    counts: Dict[Tuple[str, str], int]  # (group, filename) -> strings listed
+    samples: Dict[str, FrozenSet[str]]  # path -> sample strings of the detailed findings
+    size: int
+
+
+def read_sweep(path=SWEEP_FILE):
+    """Index an existing report: its sections, and the checkbox, count and samples of each listed file.
+
+    Sections start at each `#` / `##` heading and run to the next one; the
+    digest covers their exact bytes, so it can be compared with what a new run
+    would write. Everything is empty when there is no report yet.
+    """
+    sections, statuses, counts, samples = {}, {}, {}, defaultdict(set)
+    heading, digest, start, offset = None, None, 0, 0
+    group, sample_path, kind = None, None, None
+    try:
+        f = open(path, 'rb')
+    except FileNotFoundError:
+        return SweepState(sections, statuses, counts, {}, 0)
+    with f:
+        for raw in f:
+            line = raw.decode('utf-8').rstrip('\r\n')
+            if _is_heading(line) or digest is None:
+                if digest is not None:
+                    sections[heading] = Section(digest.hexdigest(), start, offset)
+                heading = line if _is_heading(line) else None
+                digest, start = hashlib.blake2b(digest_size=16), offset
+                kind = line
+            elif kind == FILE_LIST_HEADING:
+                if line.startswith("### "):
+                    group = line[4:]
+                elif match := _STATUS_LINE.match(line):
+                    statuses[(group, match.group(2))] = match.group(1)
+                    counts[(group, match.group(2))] = int(match.group(3))
+            elif kind == DETAILED_FINDINGS_HEADING:
+                if match := _PATH_LINE.match(line):
+                    sample_path = match.group(1)
+                elif sample_path is not None and (match := _SAMPLE_LINE.match(line)):
+                    samples[sample_path].add(match.group(1))
+            digest.update(raw)
+            offset += len(raw)
+    if digest is not None:
+        sections[heading] = Section(digest.hexdigest(), start, offset)
+    return SweepState(sections, statuses, counts, {p: frozenset(t) for p, t in samples.items()}, offset)
+
+
+def _carried_statuses(index, state):
+    """The checkboxes of `state` that still hold for `index`.
+
+    A file whose count rose, or whose sample strings are not the ones the old
+    report showed, has new findings since it was marked, so it starts over
+    as `[ ]`.
+    """
+    carried = {}
+    for group, results in index.grouped.items():
+        for result in results:
+            key = (group, Path(result.path).name)
+            status = state.statuses.get(key)
+            if status is None:
+                continue
+            samples = frozenset(text for _, text in result.strings)
+            if result.count > state.counts[key] or samples != state.samples.get(result.path, frozenset()):
+                continue
+            carried[key] = status
+    return carried
+
+
+def _render_sections(index):
+    """Yield (heading, text as bytes) for each section, joined by newlines as write_markdown joins them."""
+    pending = None
+    for section in SECTIONS:
+        lines = list(section(index))
+        if not lines:
+            continue
+        if pending is not None:
+            yield pending[0], pending[1] + b'\n'
+        pending = lines[0], '\n'.join(lines).encode('utf-8')
+    if pending is not None:
+        yield pending
+
+
+def update_markdown(index, path=SWEEP_FILE):
+    """Bring the report at `path` up to date with `index`; return the headings of the sections that changed.
+
+    The checkbox of every file still listed is carried over from the existing
+    report, so [x], [~] and [SKIP] survive a regeneration, unless the file
+    has gained findings since (see _carried_statuses). Each section is
+    rendered and compared with the old one, and only changed sections are
+    written. A changed section overwrites the old one in place while it keeps
+    the same length and position. From the first section that does not, the
+    rest of the file is written out and truncated to the new length. An
+    unchanged report is not written at all, so its mtime stays put and
+    running this on every commit costs one read and one render. A new report
+    is written to a temporary file and renamed into place.
+    """
+    state = read_sweep(path)
+    index.statuses = {**_carried_statuses(index, state), **index.statuses}
+    changed = []
+    if not state.sections:
+        tmp = f"{path}.tmp"
+        try:
+            with open(tmp, 'wb') as f:
+                for heading, data in _render_sections(index):
+                    f.write(data)
+                    changed.append(heading)
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        return changed
+
+    offset, aligned, seen = 0, True, set()
+    with open(path, 'r+b') as f:
+        for heading, data in _render_sections(index):
+            seen.add(heading)
+            old = state.sections.get(heading)
+            same = old is not None and old.digest == hashlib.blake2b(data, digest_size=16).hexdigest()
+            if not same:
+                changed.append(heading)
+            aligned = aligned and old is not None and old.start == offset and old.end - old.start == len(data)
+            if not (aligned and same):
+                f.seek(offset)
+                f.write(data)
+            offset += len(data)
+        if offset != state.size:
+            f.truncate(offset)
+    changed += [heading or "(text above the title)" for heading in state.sections if heading not in seen]
+    return changed
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n\n')[0])
+    parser.add_argument(
+        '--root', type=Path, default=Path(__file__).resolve().parent.parent, metavar='DIR',
+        help=f'project whose {RESULTS_FILE} to read; {SWEEP_FILE} is written there (default: this repo)',
+    )
+    parser.add_argument(
+        '--jsonl', type=Path, metavar='PATH',
+        help=f'read findings from a scan-hardcoded-strings.py --jsonl file instead of {RESULTS_FILE}',
+    )
+    parser.add_argument(
+        '--columnar', type=Path, nargs='?', const=Path(COLUMNAR_RESULTS_FILE), metavar='PATH',
+        help=f'read a scan-hardcoded-strings.py --columnar file (default: {COLUMNAR_RESULTS_FILE}) '
+        f'instead of {RESULTS_FILE}',
+    )
+    parser.add_argument(
+        '--history', type=Path, default=Path(DEFAULT_HISTORY), metavar='PATH',
+        help=f'scan history for the delta and burn-down sections, relative to --root (default: {DEFAULT_HISTORY})',
+    )
+    parser.add_argument(
+        '--scan', action='store_true',
+        help=f'scan the tree in this process instead of reading {RESULTS_FILE} (records the run in --history)',
+    )
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='with --scan, scan on N worker processes')
+    parser.add_argument('--no-history', action='store_true', help='with --scan, do not record the run')
+    parser.add_argument(
+        '--write-results', action='store_true',
+        help=f'with --scan, also write {RESULTS_FILE} (without key suggestions)',
+    )
+    args = parser.parse_args(argv)
+    os.chdir(args.root)
+
+    if args.scan:
+        # Only a scan needs the scanner; rendering saved results does not.
+        from hardcoded_strings import load_cache
+        from i18n_sweep import sweep
+
+        history = None if args.no_history else HistoryStore(args.history)
+        index, changed = sweep(
+            jobs=args.jobs, cache=load_cache(), history=history,
+            results_file=RESULTS_FILE if args.write_results else None,
+        )
+        print(f"🔍 Scanned {index.total_files} files: {index.files} with {index.strings} hardcoded strings")
+    else:
+        # A JSONL file holds every finding, so the shared strings are counted
+        # from it; a full scan leaves them in DUPLICATES_FILE.
+        duplicates = None
+        if args.jsonl:
+            duplicates = DuplicateIndex()
+        elif os.path.exists(DUPLICATES_FILE):
+            duplicates = DuplicateIndex.load(DUPLICATES_FILE)
+        if args.columnar:
+            results = ColumnarResults(args.columnar)
+        elif args.jsonl:
+            results = iter_jsonl_results(args.jsonl, duplicates)
+        else:
+            results = iter_scan_results()
+        # The results only list files with findings; the total is every file the
+        # scanner reads by default.
+        total_files = sum(1 for _ in SourceWalker())
+        history = HistoryStore(args.history) if args.history.exists() else None
+        changed = update_markdown(ReportIndex(
+            results, total_files=total_files, history=history, duplicates=duplicates,
+        ))
+
+    if changed:
+        print(f"✅ Updated {SWEEP_FILE}: {len(changed)} section(s) changed")
+        for heading in changed:
+            print(f"   {heading.lstrip('# ')}")
+    else:
+        print(f"✅ {SWEEP_FILE} is already up to date")
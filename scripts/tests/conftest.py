@@ -0,0 +1,78 @@
+"""Shared fixtures for the Python maintenance scripts in scripts/.
+
+The hyphenated CLI files are not importable modules, so they are loaded by
+path; the scanner and sweep report are tested through their library modules
+(hardcoded_strings, sweep_report). write_tree and git build the small
+source trees and repositories the scanner tests run in; random_results
+builds scan results for the report and results-file tests. Run with `make test-scripts` (or
+`python3 -m pytest scripts/tests`).
+"""
+
+import importlib.util
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+REPO_ROOT = SCRIPTS_DIR.parent
+PRIORITIES = ['🔴 HIGH', '🟡 MED', '🟢 LOW']
+
+# The scripts import their helper modules (svelte_sections, ...) as siblings.
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+
+def load_script(name: str):
+    """Import scripts/<name>.py as a module, once per test session."""
+    module_name = name.replace('-', '_')
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, SCRIPTS_DIR / f'{name}.py')
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope='session')
+def scanner():
+    import hardcoded_strings
+    return hardcoded_strings
+
+
+def random_results(count, seed=0):
+    """`count` files of scan results, shaped like i18n-scan-results.json.
+
+    Texts repeat across files and include non-ASCII ones, and a file's count
+    may exceed its samples, as it does when the scanner trims them.
+    """
+    rng = random.Random(seed)
+    results = {}
+    for i in range(count):
+        area = rng.choice(['lib/components/events', 'lib/components/forms', 'routes/(auth)/dashboard'])
+        strings = [[rng.randint(1, 900), rng.choice(['Cancel', 'Save changes', f'Only here {i}', 'Ünïcode ✓'])]
+                   for _ in range(rng.randint(1, 10))]
+        results[f'{area}/File{i}.svelte'] = {
+            'priority': rng.choice(PRIORITIES),
+            'count': len(strings) + rng.randint(0, 30),
+            'strings': strings,
+        }
+    return results
+
+
+def write_tree(tmp_path, count=6):
+    """Write src/Comp<i>.svelte files with one finding each; return their sorted paths."""
+    src = tmp_path / 'src'
+    src.mkdir()
+    for i in range(count):
+        (src / f'Comp{i}.svelte').write_text(f'<p>Please save item {i}</p>\n')
+    return sorted(src.rglob('*.svelte'))
+
+
+def git(cwd, *args):
+    subprocess.run(
+        ['git', '-c', 'user.name=t', '-c', 'user.email=t@t', *args],
+        cwd=cwd, check=True, capture_output=True,
+    )
@@ -0,0 +1,61 @@
+"""Contract for scripts/batched_contrast.py (skipped without NumPy)."""
+
+import random
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+import batched_contrast  # noqa: E402
+from brand_themes import Theme, audit, hsl_to_rgb, load_themes  # noqa: E402
+
+APP_CSS = Path(__file__).resolve().parent.parent.parent / 'src' / 'app.css'
+
+
+def _random_themes(live, count, seed=0):
+    rng = random.Random(seed)
+    themes = []
+    for i in range(count):
+        for (_, mode), theme in live.items():
+            tokens = {
+                token: (rng.choice([0, 60, 120, 180, 240, 300, rng.uniform(0, 360)]), rng.uniform(0, 100), rng.uniform(0, 100))
+                for token in theme.tokens if rng.random() < 0.95
+            }
+            themes.append(Theme('default' if i % 2 else f'brand{i}', mode, tokens))
+    return themes
+
+
+def test_hsl_conversion_matches_the_scalar_one():
+    rng = random.Random(1)
+    values = [(rng.uniform(0, 360), rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(2000)]
+    values += [(h, 50.0, 50.0) for h in (0, 60, 120, 180, 240, 300, 359.99)]
+    rgb = batched_contrast.hsl_to_rgb(np.array(values))
+    assert [tuple(map(int, row)) for row in rgb] == [hsl_to_rgb(*value) for value in values]
+
+
+def test_batched_audit_is_identical_to_the_scalar_audit():
+    live = load_themes(APP_CSS)
+    assert audit(live, batched=True) == audit(live)
+    themes = _random_themes(live, 40)
+    batched = audit(themes, batched=True)
+    assert batched == audit(themes)
+    assert batched.failures > 0
+
+    # Saturations and lightnesses beyond 100% give channels outside 0-255.
+    out_of_range = [(0, 150, 50), (200, 150, 20), (270, 170, 48), (30, 100, 120), (120, 90, -5)]
+    themes = [
+        Theme(f'brand{i}', mode, {**theme.tokens, token: value})
+        for i, value in enumerate(out_of_range)
+        for (_, mode), theme in live.items()
+        for token in ('primary', 'background')
+    ]
+    assert audit(themes, batched=True) == audit(themes)
+
+
+def test_missing_tokens_are_nan_and_still_reported_as_unknown():
+    themes = [Theme('default', 'light', {'foreground': (0, 0, 10), 'background': (0, 0, 100)})]
+    pairs, recipes = batched_contrast.contrast_tables(themes)
+    assert pairs.shape[0] == recipes.shape[0] == 1
+    assert not np.isnan(pairs[0, 0]) and np.isnan(pairs[0, 1])
+    assert audit(themes, batched=True) == audit(themes)
@@ -0,0 +1,44 @@
+"""Contract for scripts/bench-i18n-tools.py."""
+
+import pytest
+
+from conftest import load_script
+from svelte_corpus import CorpusSpec
+
+
+@pytest.fixture(scope='module')
+def bench():
+    return load_script('bench-i18n-tools')
+
+
+def _entry(bench, files_per_s, rss, spec=CorpusSpec()):
+    return bench.metrics(640, 4_000_000, 640 / files_per_s, int(rss * 1e6), spec)
+
+
+def test_regressions_flag_slowdowns_and_memory_growth(bench):
+    baseline = {'scanner@1x': _entry(bench, 1000, 30)}
+    assert bench.regressions({'scanner@1x': _entry(bench, 800, 36)}, baseline, 0.25) == []
+
+    problems = bench.regressions({'scanner@1x': _entry(bench, 700, 40)}, baseline, 0.25)
+    assert len(problems) == 2
+    assert problems[0].startswith('scanner@1x: 700.0 files/s, baseline 1000.0')
+
+
+def test_regressions_skip_other_corpora_and_new_benchmarks(bench):
+    baseline = {'scanner@1x': _entry(bench, 1000, 30)}
+    current = {
+        'scanner@1x': _entry(bench, 10, 300, CorpusSpec(density=0.5)),
+        'scanner@10x': _entry(bench, 10, 300),
+    }
+    assert bench.regressions(current, baseline, 0.25) == []
+
+
+def test_bench_scale_measures_both_tools(bench, tmp_path, monkeypatch):
+    monkeypatch.setattr(bench, 'corpus_dir', lambda spec: tmp_path)
+    results = bench.bench_scale(CorpusSpec(scale=0.01), repeat=1)
+
+    assert set(results) == {'scanner@0.01x', 'sweep-report@0.01x'}
+    scan = results['scanner@0.01x']
+    assert scan['files'] == 6 and scan['bytes'] > 0 and scan['peak_rss_mb'] > 0
+    assert scan['files_per_s'] == pytest.approx(scan['files'] / scan['seconds'], rel=0.01)
+    assert (tmp_path / 'i18n-sweep.md').exists()
@@ -0,0 +1,102 @@
+"""Contract for scripts/brand_themes.py, behind audit-brand-themes.py."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import brand_themes
+from brand_themes import (
+    CVD, SEMANTIC, PairCheck, RecipeCheck, UnknownToken, audit, check_separation, deltaE, load_themes, parse_themes,
+    simulate,
+)
+
+SCRIPTS = Path(__file__).resolve().parent.parent
+APP_CSS = SCRIPTS.parent / 'src' / 'app.css'
+
+CSS = """
+:root {
+  --background: 0 0% 100%;
+  --foreground: 0 0% 10%;
+  --primary: 260 60% 45%;
+  --radius: 0.5rem;
+}
+.dark {
+  --background: 0 0% 5%;
+  --foreground: 0 0% 95%;
+}
+[data-brand='acme'] {
+  --primary: 10 80% 50%;
+  --accent: 10 80% 52%;
+}
+"""
+
+
+def test_parse_merges_dark_over_light_and_reads_brand_blocks():
+    themes = parse_themes(CSS)
+    assert list(themes) == [('acme', 'light'), ('default', 'dark'), ('default', 'light')]
+    dark = themes[('default', 'dark')]
+    assert dark.tokens['primary'] == (260.0, 60.0, 45.0)
+    assert dark.rgb('background') == (13, 13, 13)
+    assert 'radius' not in dark and 'missing' not in dark
+
+
+def test_rgb_and_luminance_are_computed_once_per_token():
+    theme = parse_themes(CSS)[('default', 'light')]
+    assert theme._rgb == {}
+    assert theme.luminance('background') == 1.0
+    assert theme.rgb('background') is theme.rgb('background')
+    assert set(theme._rgb) == set(theme._luminance) == {'background'}
+    assert abs(theme.contrast('foreground', 'background') - 17.40) < 0.01
+
+
+def test_audit_reports_unknown_tokens_only_in_the_live_theme():
+    result = audit(parse_themes(CSS))
+    acme, _, default_light = result.themes
+    assert (default_light.brand, default_light.mode) == ('default', 'light')
+    body = default_light.pairs[0]
+    assert body == PairCheck('foreground', 'background', 4.5, 'body text', body.ratio) and body.ok
+    assert UnknownToken('card-foreground', 'card text') in default_light.pairs
+    assert UnknownToken('card', 'ToneTile brand on card') in default_light.composited
+    assert any(isinstance(check, RecipeCheck) for check in default_light.composited)
+    assert not any(isinstance(check, UnknownToken) for check in acme.pairs)
+    assert [(pair.a, pair.b) for pair in acme.separation] == [('primary', 'accent')]
+    assert acme.separation[0].confusable and acme.confusables == 1
+    assert result.failures == sum(theme.failures for theme in result.themes) > 0
+    assert not result.ok
+
+
+def test_cvd_tables_simulate_each_color_once_and_feed_the_separation_check():
+    theme = load_themes(APP_CSS)[('default', 'light')]
+    separation = check_separation(theme)
+    assert {len(table) for table in theme._simulated.values()} == {len(SEMANTIC)}
+    assert set(theme._simulated) == {(kind, 1.0) for kind in CVD}
+    for pair in separation:
+        naive = min(
+            (deltaE(simulate(theme.rgb(pair.a), kind), simulate(theme.rgb(pair.b), kind)), kind) for kind in CVD
+        )
+        assert (pair.worst, pair.kind) == naive
+    matrix = theme.distances(SEMANTIC, 'deutan')
+    assert matrix is theme.distances(list(SEMANTIC), 'deutan')
+    assert all(matrix[i][j] == matrix[j][i] for i in range(len(SEMANTIC)) for j in range(len(SEMANTIC)))
+
+
+def test_milder_severities_are_checked_alongside_dichromacy():
+    theme = load_themes(APP_CSS)[('default', 'dark')]
+    assert theme.simulated('primary', 'protan', 0.0) == theme.rgb('primary')
+    assert theme.simulated('primary', 'protan', 1.0) == simulate(theme.rgb('primary'), 'protan')
+    mild = check_separation(theme, severities=(1.0, 0.5))
+    assert [(p.a, p.b) for p in mild] == [(p.a, p.b) for p in check_separation(theme)]
+    assert all(p.worst <= full.worst for p, full in zip(mild, check_separation(theme)))
+    assert ('protan', 0.5) in theme._simulated
+
+
+def test_live_theme_passes_and_cli_prints_the_report():
+    result = audit(load_themes(APP_CSS))
+    assert result.ok and {t.mode for t in result.themes} == {'light', 'dark'}
+    expected = '\n'.join(brand_themes.report_lines(result)) + '\n'
+    cli = subprocess.run(
+        [sys.executable, str(SCRIPTS / 'audit-brand-themes.py'), str(APP_CSS)],
+        capture_output=True, text=True,
+    )
+    assert cli.returncode == 0 and cli.stdout == expected
+    assert cli.stdout.endswith('Total WCAG failures: 0\nTotal colorblind confusables: 0\n')
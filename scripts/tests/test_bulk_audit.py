@@ -0,0 +1,155 @@
+"""Contract for scripts/bulk_audit.py (audit-brand-themes.py --bulk)."""
+
+import json
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from brand_themes import Theme, audit, parse_themes
+from bulk_audit import BulkAuditor, RecordError, bulk_audit, parse_hsl, read_overrides
+
+SCRIPTS = Path(__file__).resolve().parent.parent
+APP_CSS = (SCRIPTS.parent / 'src' / 'app.css').read_text()
+TOKENS = ['primary', 'primary-foreground', 'accent', 'ring', 'highlight', 'background', 'success']
+
+
+def _records(count, seed=0):
+    rng = random.Random(seed)
+    records = []
+    for i in range(count):
+        record = {'org': f'org{i}', 'light': {
+            t: f'{rng.randint(0, 359)} {rng.randint(30, 100)}% {rng.randint(20, 80)}%' for t in rng.sample(TOKENS, 2)
+        }}
+        if i % 2:
+            record['dark'] = {t: [rng.randint(0, 359), rng.randint(30, 100), rng.randint(50, 85)] for t in rng.sample(TOKENS, 1)}
+        records.append(record)
+    return records
+
+
+def _parsed(records):
+    for record in records:
+        yield record['org'], {mode: {t: parse_hsl(v) for t, v in record.get(mode, {}).items()} for mode in ('light', 'dark')}
+
+
+@pytest.fixture(scope='module')
+def auditor():
+    return BulkAuditor(parse_themes(APP_CSS))
+
+
+def test_reads_jsonl_json_lists_and_json_objects(tmp_path):
+    records = _records(3)
+    (tmp_path / 'orgs.jsonl').write_text(''.join(json.dumps(r) + '\n' for r in records) + '\n')
+    (tmp_path / 'list.json').write_text(json.dumps(records))
+    (tmp_path / 'object.json').write_text(json.dumps({r['org']: {k: v for k, v in r.items() if k != 'org'} for r in records}))
+    read = [list(read_overrides(tmp_path / name)) for name in ('orgs.jsonl', 'list.json', 'object.json')]
+    assert read[0] == read[1] == read[2]
+    assert [org for org, _ in read[0]] == ['org0', 'org1', 'org2']
+    assert read[0][1][1]['dark'] and read[0][0][1]['dark'] == {}
+    assert parse_hsl(' 12 80% 45.5% ') == parse_hsl([12, 80, 45.5]) == (12.0, 80.0, 45.5)
+    with pytest.raises(ValueError):
+        parse_hsl('#ff0000')
+
+
+def test_unreadable_records_fail_alone(tmp_path):
+    records = _records(2)
+    lines = [
+        json.dumps(records[0]),
+        json.dumps({'org': 'red', 'light': {'primary': 'red'}}),
+        json.dumps({'org': 'loud', 'light': {'primary': '270 170% 48%'}}),
+        json.dumps({'org': 'list', 'dark': {'accent': [400, 50, 50]}}),
+        json.dumps({'org': 'flat', 'light': ['primary']}),
+        '{"org": "cut',
+        json.dumps(records[1]),
+    ]
+    (tmp_path / 'orgs.jsonl').write_text('\n'.join(lines) + '\n')
+    out = list(bulk_audit(APP_CSS, read_overrides(tmp_path / 'orgs.jsonl')))
+    assert [r['org'] for r in out] == ['org0', 'red', 'loud', 'list', 'flat', None, 'org1']
+    assert out[1:6] == [
+        {'org': 'red', 'ok': False, 'error': "light.primary: not an `H S% L%` value: 'red'"},
+        {'org': 'loud', 'ok': False, 'error': 'light.primary: 170% saturation is not in 0-100'},
+        {'org': 'list', 'ok': False, 'error': 'dark.accent: hue 400 is not in 0-360'},
+        {'org': 'flat', 'ok': False, 'error': "light: not a token object: ['primary']"},
+        {'org': None, 'ok': False, 'error': out[5]['error']},
+    ]
+    assert out[5]['error'].startswith('line 6: ')
+    assert 'error' not in out[0] and 'error' not in out[6]
+
+    (tmp_path / 'list.json').write_text(json.dumps([records[0], 'acme', {'org': 'red', 'light': {'primary': 'red'}}]))
+    read = list(read_overrides(tmp_path / 'list.json'))
+    assert [type(overrides) for _, overrides in read] == [dict, RecordError, RecordError]
+
+
+def test_out_of_range_values_are_rejected():
+    assert parse_hsl('360 100% 0%') == (360.0, 100.0, 0.0)
+    for value in ('270 170% 48%', '12 80% 100.5%', '361 50% 50%', [-1, 50, 50], [10, 50, -5], [1, 2]):
+        with pytest.raises(ValueError):
+            parse_hsl(value)
+
+
+def test_severities_reach_the_colorblind_check():
+    themes = parse_themes(APP_CSS)
+    records = list(_parsed(_records(30, seed=3)))
+    # The full-severity check alone, and a mild deficiency alone, fail different rows.
+    for severities in ([1.0], [0.4]):
+        expected = []
+        for org, overrides in records:
+            light = {**themes[('default', 'light')].tokens, **overrides['light']}
+            dark = {**themes[('default', 'dark')].tokens, **overrides['light'], **overrides['dark']}
+            full = audit([Theme(org, 'light', light), Theme(org, 'dark', dark)], severities=severities)
+            expected.append(sum(theme.failures + theme.confusables for theme in full.themes))
+        out = list(bulk_audit(APP_CSS, records, severities=severities))
+        assert [len(record['failures']) for record in out] == expected
+        assert list(bulk_audit(APP_CSS, records, jobs=2, severities=severities)) == out
+
+
+def test_records_match_a_full_audit_of_the_layered_theme(auditor):
+    base = parse_themes(APP_CSS)
+    for org, overrides in _parsed(_records(40, seed=1)):
+        record = auditor.audit_org(org, overrides)
+        light = {**base[('default', 'light')].tokens, **overrides['light']}
+        dark = {**base[('default', 'dark')].tokens, **overrides['light'], **overrides['dark']}
+        full = audit([Theme(org, 'light', light), Theme(org, 'dark', dark)])
+        for theme in full.themes:
+            reported = [f for f in record['failures'] if f['mode'] == theme.mode]
+            assert len(reported) == theme.failures + theme.confusables, (org, theme.mode)
+        assert record['ok'] == full.ok
+
+
+def test_unknown_tokens_fail_and_untouched_orgs_pass(auditor):
+    assert auditor.audit_org('same', {'light': {}, 'dark': {}}) == {'org': 'same', 'ok': True, 'failures': [], 'unknown': []}
+    typo = auditor.audit_org('typo', {'light': {'primry': (0, 0, 0)}, 'dark': {}})
+    assert not typo['ok'] and typo['unknown'] == ['primry'] and typo['failures'] == []
+    dark_only = auditor.audit_org('dim', {'light': {}, 'dark': {'primary': (268, 60, 20)}})
+    assert {f['mode'] for f in dark_only['failures']} == {'dark'}
+
+
+def test_pool_streams_records_in_input_order():
+    records = list(_parsed(_records(30, seed=2)))
+    serial = list(bulk_audit(APP_CSS, records))
+    assert [r['org'] for r in serial] == [org for org, _ in records]
+    assert list(bulk_audit(APP_CSS, records, jobs=2)) == serial
+
+
+def test_cli_writes_jsonl_and_fails_on_any_failing_org(tmp_path):
+    (tmp_path / 'orgs.jsonl').write_text(''.join(json.dumps(r) + '\n' for r in _records(10)))
+    cli = subprocess.run(
+        [sys.executable, str(SCRIPTS / 'audit-brand-themes.py'), str(SCRIPTS.parent / 'src' / 'app.css'),
+         '--bulk', str(tmp_path / 'orgs.jsonl'), '-o', str(tmp_path / 'out.jsonl')],
+        capture_output=True, text=True,
+    )
+    records = [json.loads(line) for line in (tmp_path / 'out.jsonl').read_text().splitlines()]
+    assert len(records) == 10 and cli.stderr.startswith('10 organizations audited, ')
+    assert cli.returncode == (1 if any(not r['ok'] for r in records) else 0)
+
+
+@pytest.mark.parametrize('flag', ['--batched', '--suggest-fixes'])
+def test_cli_rejects_flags_bulk_does_not_support(tmp_path, flag):
+    (tmp_path / 'orgs.jsonl').write_text(json.dumps(_records(1)[0]) + '\n')
+    cli = subprocess.run(
+        [sys.executable, str(SCRIPTS / 'audit-brand-themes.py'), '--bulk', str(tmp_path / 'orgs.jsonl'), flag],
+        capture_output=True, text=True,
+    )
+    assert cli.returncode == 2 and '--bulk cannot be combined with --batched or --suggest-fixes' in cli.stderr
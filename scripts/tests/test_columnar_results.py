@@ -0,0 +1,64 @@
+"""Contract for scripts/columnar_results.py."""
+
+import json
+
+import pytest
+
+import sweep_report
+from columnar_results import ColumnarResults, from_json, is_columnar, to_json, write_columnar
+from conftest import random_results
+from sweep_model import FileResult
+
+
+def _results(count, seed=0):
+    results = random_results(count, seed)
+    results['routes/Empty.svelte'] = {'priority': '🟢 LOW', 'count': 0, 'strings': []}
+    results['lib/Suggested.svelte'] = {
+        'priority': '🟡 MED', 'count': 1, 'strings': [[3, 'Save changes']],
+        'suggestions': {'Save changes': [{'key': 'common.save', 'score': 1.0, 'locales': ['de', 'it']}]},
+    }
+    return results
+
+
+def test_json_round_trip_is_byte_identical(tmp_path):
+    original = tmp_path / 'results.json'
+    original.write_text(json.dumps(_results(300), indent=2))
+    from_json(original, tmp_path / 'results.cols')
+    to_json(tmp_path / 'results.cols', tmp_path / 'back.json')
+    assert (tmp_path / 'back.json').read_bytes() == original.read_bytes()
+    assert is_columnar(tmp_path / 'results.cols') and not is_columnar(original)
+    assert (tmp_path / 'results.cols').stat().st_size * 2 < original.stat().st_size
+
+
+def test_reader_yields_file_results_in_order(tmp_path):
+    results = _results(50, seed=1)
+    write_columnar(results, tmp_path / 'results.cols')
+    with ColumnarResults(tmp_path / 'results.cols') as columns:
+        assert len(columns) == len(results)
+        assert list(columns) == [FileResult.from_entry(path, entry) for path, entry in results.items()]
+        trimmed = list(columns.results({'🔴 HIGH': 2}))
+    for result, entry in zip(trimmed, results.values()):
+        limit = 2 if entry['priority'] == '🔴 HIGH' else 0
+        assert result.strings == tuple(tuple(s) for s in entry['strings'][:limit])
+        assert result.count == entry['count']
+
+
+def test_strings_are_decoded_once_and_shared(tmp_path):
+    write_columnar(_results(40, seed=2), tmp_path / 'results.cols')
+    with ColumnarResults(tmp_path / 'results.cols') as columns:
+        texts = [text for result in columns for _, text in result.strings if text == 'Cancel']
+    assert len(texts) > 1 and all(text is texts[0] for text in texts)
+
+
+def test_writer_accepts_file_results_and_the_report_reads_them(tmp_path):
+    results = _results(200, seed=3)
+    write_columnar((FileResult.from_entry(p, e) for p, e in results.items()), tmp_path / 'results.cols')
+    with ColumnarResults(tmp_path / 'results.cols') as columns:
+        md = '\n'.join(sweep_report.iter_markdown(sweep_report.ReportIndex(columns, total_files=500)))
+    assert md == sweep_report.generate_markdown(results, 500)
+
+
+def test_other_files_are_rejected(tmp_path):
+    (tmp_path / 'results.json').write_text('{"a": 1}' + ' ' * 64)
+    with pytest.raises(ValueError):
+        ColumnarResults(tmp_path / 'results.json')
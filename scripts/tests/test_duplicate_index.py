@@ -0,0 +1,41 @@
+"""Contract for scripts/duplicate_index.py."""
+
+from duplicate_index import DuplicateIndex
+
+
+def _index():
+    index = DuplicateIndex()
+    index.add('lib/A.svelte', [(3, 'Failed to load'), (9, 'Save')])
+    index.add('lib/B.svelte', [(5, 'Failed  to\n load'), (7, 'Cancel')])
+    index.add('lib/C.ts', [(1, 'Failed to load'), (2, 'Save')])
+    index.add('lib/Empty.svelte', [])
+    return index
+
+
+def test_ranks_strings_by_places_across_files():
+    index = _index()
+    assert index.ranked() == [('Failed to load', 3), ('Save', 2)]
+    assert index.ranked(min_places=1)[-1] == ('Cancel', 1)
+    assert list(index.locations('Failed to load')) == [('lib/A.svelte', 3), ('lib/B.svelte', 5), ('lib/C.ts', 1)]
+    assert index.places(' Save ') == 2 and index.places('Missing') == 0
+    assert index.files == ['lib/A.svelte', 'lib/B.svelte', 'lib/C.ts']
+
+
+def test_write_keeps_only_shared_strings_and_loads_back(tmp_path):
+    path = tmp_path / 'duplicates.json'
+    _index().write(path)
+    loaded = DuplicateIndex.load(path)
+    assert loaded.ranked() == [('Failed to load', 3), ('Save', 2)]
+    assert list(loaded.locations('Save')) == [('lib/A.svelte', 9), ('lib/C.ts', 2)]
+    assert loaded.places('Cancel') == 0
+
+
+def test_discard_forgets_one_file():
+    index = _index()
+    index.discard('lib/A.svelte')
+    assert index.ranked() == [('Failed to load', 2)]
+    assert index.places('Save') == 1
+    index.add('lib/A.svelte', [(4, 'Cancel')])
+    assert list(index.locations('Cancel')) == [('lib/B.svelte', 7), ('lib/A.svelte', 4)]
+    index.discard('lib/Missing.svelte')
+    assert index.ranked() == [('Cancel', 2), ('Failed to load', 2)]
@@ -0,0 +1,219 @@
+"""Contract for scripts/sweep_report.py, behind generate-sweep-report.py."""
+
+import json
+import time
+
+import pytest
+
+import sweep_report
+from conftest import PRIORITIES, random_results
+
+
+@pytest.fixture(scope='module')
+def report():
+    return sweep_report
+
+
+def test_index_top_lists_match_a_stable_sort(report):
+    results = random_results(500)
+    index = report.ReportIndex(results)
+    for priority, limit in [('🔴 HIGH', 10), ('🟡 MED', 20)]:
+        files = [(path, data) for path, data in results.items() if data['priority'] == priority]
+        expected = [
+            (path, data['count'])
+            for path, data in sorted(files, key=lambda x: x[1]['count'], reverse=True)
+        ]
+        assert [(result.path, result.count) for result in index.top(priority)] == expected[:limit]
+        assert [(result.path, result.count) for result in index.ranked(priority)] == expected
+
+
+def test_index_counts_sums_and_groups(report):
+    results = random_results(200)
+    index = report.ReportIndex(results)
+    assert index.files == len(results)
+    for priority in PRIORITIES:
+        files = [d for d in results.values() if d['priority'] == priority]
+        assert index.counts[priority] == len(files)
+        assert index.sums[priority] == sum(d['count'] for d in files)
+    grouped = report.group_files_by_directory(results)
+    assert index.grouped.keys() == grouped.keys()
+    for group, files in grouped.items():
+        assert [(r.path, r.priority, r.count) for r in index.grouped[group]] == [
+            (entry['path'], entry['priority'], entry['count']) for entry in files
+        ]
+
+
+def test_index_keeps_only_the_strings_it_prints(report):
+    index = report.ReportIndex(random_results(50))
+    for priority, files in index.by_priority.items():
+        limit = 5 if priority == '🔴 HIGH' else 0
+        assert all(len(result.strings) <= limit for result in files)
+
+
+def test_markdown_renders_from_the_index(report):
+    results = {
+        'lib/components/events/A.svelte': {'priority': '🔴 HIGH', 'count': 2, 'strings': [[3, 'Save now'], [9, 'Go back']]},
+        'lib/components/events/B.svelte': {'priority': '🔴 HIGH', 'count': 7, 'strings': [[1, 'Welcome']]},
+        'lib/components/forms/C.svelte': {'priority': '🟢 LOW', 'count': 1, 'strings': [[4, 'Debug']]},
+    }
+    md = report.generate_markdown(results, 213)
+    assert '- 🔴 **HIGH Priority**: 2 files (~9 strings)' in md
+    assert md.index('1. **B.svelte** (7 strings)') < md.index('2. **A.svelte** (2 strings)')
+    assert '- [ ] `C.svelte` 🟢 LOW (1 strings)' in md
+
+
+def test_markdown_for_100k_findings_is_fast(report):
+    results = random_results(7000, seed=1)
+    assert sum(d['count'] for d in results.values()) > 100_000
+    started = time.perf_counter()
+    report.generate_markdown(results, 213)
+    assert time.perf_counter() - started < 1
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 1 << 16])
+def test_streaming_reader_matches_json_load(report, tmp_path, chunk_size):
+    results = random_results(40)
+    results['routes/Ünïcode "quoted" {x}.svelte'] = {
+        'priority': '🟢 LOW', 'count': 1, 'strings': [[1, 'Braces } and , commas']],
+    }
+    path = tmp_path / 'results.json'
+    path.write_text(json.dumps(results, indent=2), encoding='utf-8')
+    assert list(report.iter_scan_results(path, chunk_size)) == list(json.loads(path.read_text()).items())
+
+    (tmp_path / 'empty.json').write_text(' {\n}\n')
+    assert list(report.iter_scan_results(tmp_path / 'empty.json', chunk_size)) == []
+
+
+def test_jsonl_reader_folds_findings_into_entries(report, tmp_path):
+    records = [
+        {'file': 'A.svelte', 'line': n, 'column': 1, 'text': f'Text {n}', 'priority': '🔴 HIGH', 'rule': 'please'}
+        for n in range(1, 13)
+    ] + [{'file': 'B.svelte', 'line': 2, 'column': 4, 'text': 'Other', 'priority': '🟢 LOW', 'rule': 'html_text'}]
+    path = tmp_path / 'findings.jsonl'
+    path.write_text(''.join(json.dumps(record) + '\n' for record in records))
+
+    entries = dict(report.iter_jsonl_results(path))
+    assert entries['A.svelte']['count'] == 12
+    assert entries['A.svelte']['strings'] == [[n, f'Text {n}'] for n in range(1, 11)]
+    assert entries['B.svelte'] == {'priority': '🟢 LOW', 'count': 1, 'strings': [[2, 'Other']]}
+
+
+def test_write_markdown_streams_the_same_document(report, tmp_path):
+    results = random_results(300, seed=3)
+    out = tmp_path / 'sweep.md'
+    report.write_markdown(report.ReportIndex(iter(results.items())), out)
+    assert out.read_text() == report.generate_markdown(results, 213)
+
+
+def test_markdown_takes_totals_from_the_scan(report):
+    results = random_results(30, seed=4)
+    md = report.generate_markdown(results, 100)
+    strings = sum(d['count'] for d in results.values())
+    assert '**Total Files**: 100' in md
+    assert '**Files Already Clean**: 70' in md
+    assert f'**Total Strings to Translate**: ~{strings}' in md
+    assert '- ⚪ **Clean**: 70 files' in md
+
+
+def test_update_keeps_statuses_and_skips_unchanged_reports(report, tmp_path):
+    results = random_results(60, seed=5)
+    out = tmp_path / 'sweep.md'
+    changed = report.update_markdown(report.ReportIndex(results, total_files=80), out)
+    assert out.read_text() == report.generate_markdown(results, 80)
+    assert changed == [line for line in out.read_text().splitlines() if line.startswith(('# ', '## '))]
+
+    text = out.read_text()
+    for filename, status in [('File1.svelte', '[x]'), ('File2.svelte', '[~]'), ('File3.svelte', '[SKIP]')]:
+        text = text.replace(f'- [ ] `{filename}`', f'- {status} `{filename}`')
+    out.write_text(text)
+    mtime = out.stat().st_mtime_ns
+    assert report.update_markdown(report.ReportIndex(results, total_files=80), out) == []
+    assert out.stat().st_mtime_ns == mtime
+
+    path = next(path for path in results if path.endswith('/File1.svelte'))
+    results[path]['count'] += 1
+    changed = report.update_markdown(report.ReportIndex(results, total_files=90), out)
+    assert {
+        '# i18n Translation Sweep - Complete Inventory',
+        '## Summary Statistics',
+        '## Complete File List (Grouped by Directory)',
+    } <= set(changed)
+    assert '## How to Use This File' not in changed and '## Next Steps' not in changed
+    updated = out.read_text()
+    # File1 gained a string since it was ticked off, so it is open again.
+    for filename, status in [('File1.svelte', '[ ]'), ('File2.svelte', '[~]'), ('File3.svelte', '[SKIP]')]:
+        assert f'- {status} `{filename}`' in updated
+    assert '**Total Files**: 90' in updated
+    assert not (tmp_path / 'sweep.md.tmp').exists()
+
+
+def test_update_reopens_files_whose_samples_changed(report, tmp_path):
+    results = {
+        'lib/components/events/A.svelte': {'priority': '🔴 HIGH', 'count': 2, 'strings': [[1, 'Old one'], [2, 'Kept']]},
+        'lib/components/events/B.svelte': {'priority': '🔴 HIGH', 'count': 1, 'strings': [[1, 'Still here']]},
+    }
+    out = tmp_path / 'sweep.md'
+    report.update_markdown(report.ReportIndex(results, total_files=5), out)
+    out.write_text(out.read_text().replace('- [ ] `', '- [x] `'))
+
+    results['lib/components/events/A.svelte']['strings'][0] = [1, 'New one']
+    report.update_markdown(report.ReportIndex(results, total_files=5), out)
+    updated = out.read_text()
+    assert '- [ ] `A.svelte`' in updated and '- [x] `B.svelte`' in updated
+
+
+def test_update_writes_only_the_sections_that_changed(report, tmp_path):
+    results = random_results(40, seed=6)
+    out = tmp_path / 'sweep.md'
+    report.update_markdown(report.ReportIndex(results, total_files=80), out)
+    before = out.read_bytes()
+    inode = out.stat().st_ino
+
+    # Same length, so only the summary sections are overwritten, in place.
+    assert '## Next Steps' not in report.update_markdown(report.ReportIndex(results, total_files=81), out)
+    after = out.read_bytes()
+    assert out.stat().st_ino == inode and len(after) == len(before)
+    assert after == report.generate_markdown(results, 81).encode('utf-8')
+    first = next(i for i, (a, b) in enumerate(zip(before, after)) if a != b)
+    assert before[:first].decode('utf-8').startswith('# i18n Translation Sweep')
+
+    # A longer file list shifts everything after it; the file is rewritten from there and truncated.
+    del results[next(iter(results))]
+    report.update_markdown(report.ReportIndex(results, total_files=81), out)
+    assert out.read_bytes() == report.generate_markdown(results, 81).encode('utf-8')
+
+
+def test_history_sections_show_deltas_by_directory_and_the_trend(report, tmp_path):
+    history = report.HistoryStore(tmp_path / 'history.sqlite')
+    for texts in (['One', 'Two'], ['Two', 'Three', 'Four']):
+        run = history.run('abc1234')
+        run.add('lib/components/events/A.svelte', [(f'A\0{t}', 'please', t, 1, 1) for t in texts])
+        run.add('lib/components/forms/B.svelte', [('B\0Same', 'please', 'Same', 1, 1)])
+        run.finish()
+    results = {'lib/components/events/A.svelte': {'priority': '🔴 HIGH', 'count': 3, 'strings': []}}
+
+    md = '\n'.join(report.iter_markdown(report.ReportIndex(results, history=history)))
+    assert '**Run 2** (' in md and 'against run 1: 2 new, 1 fixed, 2 unchanged' in md
+    assert '| src/lib/components/events | +2 | -1 | 1 |' in md
+    assert '1 other directories unchanged.' in md
+    assert md.index('## Summary Statistics') < md.index('## Changes Since Last Scan') < md.index('## Burn-down')
+    assert '| `abc1234` | 3 | +3 | -0 |' in md and '| `abc1234` | 4 | +2 | -1 |' in md
+    history.close()
+
+    md = report.generate_markdown(results, 10)
+    assert '## Changes Since Last Scan' not in md and '## Burn-down' not in md
+
+
+def test_shared_strings_rank_one_key_fixes(report):
+    duplicates = report.DuplicateIndex()
+    for i in range(7):
+        duplicates.add(f'lib/File{i}.svelte', [(i + 1, 'Failed to load'), (20, f'Only here {i}')])
+    duplicates.add('lib/File0.svelte', [(30, 'Retry')])
+    duplicates.add('lib/File1.svelte', [(31, 'Retry')])
+
+    md = '\n'.join(report.iter_markdown(report.ReportIndex(random_results(5), duplicates=duplicates)))
+    assert '2 strings are hardcoded in more than one place (9 places in all)' in md
+    assert '| 1 | `Failed to load` | 7 | `lib/File0.svelte:1`' in md and '(+2 more) |' in md
+    assert '| 2 | `Retry` | 2 |' in md and '| 3 |' not in md
+
+    assert '## Shared Strings' not in report.generate_markdown(random_results(5), 10)
@@ -0,0 +1,63 @@
+"""Contract for scripts/git_changes.py and the --since scan built on it."""
+
+import json
+
+from conftest import git
+from git_changes import git_changes
+
+
+def test_since_scans_changed_lines_and_merges_results(scanner, tmp_path, monkeypatch):
+    src = tmp_path / 'src' / 'lib'
+    src.mkdir(parents=True)
+    (src / 'Kept.svelte').write_text('<p>Please keep me</p>\n')
+    (src / 'Edited.svelte').write_text('<p>Please wait here</p>\n<div></div>\n')
+    (src / 'Old.svelte').write_text('<p>Please move me</p>\n')
+    git(tmp_path, 'init', '-q', '-b', 'main')
+    git(tmp_path, 'add', '.')
+    git(tmp_path, 'commit', '-qm', 'base')
+    monkeypatch.chdir(tmp_path)
+    scanner.scan_all_files()
+
+    (src / 'Edited.svelte').write_text(
+        '<p>Please wait here</p>\n<div></div>\n<p>Unable to connect right now</p>\n'
+    )
+    git(tmp_path, 'mv', 'src/lib/Old.svelte', 'src/lib/Moved.svelte')
+    git(tmp_path, 'commit', '-qam', 'change')
+    (src / 'Fresh.svelte').write_text('<p>Brand new text</p>\n')
+
+    changed, removed = git_changes('main~1')
+    assert changed == {
+        'src/lib/Edited.svelte': {3},
+        'src/lib/Moved.svelte': set(),
+        'src/lib/Fresh.svelte': None,
+    }
+    assert removed == ['src/lib/Old.svelte']
+
+    reported = scanner.scan_changed_files('main~1')
+    assert reported == {
+        'lib/Edited.svelte': [(3, 'Unable to connect'), (3, 'Unable to connect right now')],
+        'lib/Fresh.svelte': [(1, 'Brand new text')],
+    }
+    results = json.loads((tmp_path / 'i18n-scan-results.json').read_text())
+    assert list(results) == [
+        'lib/Edited.svelte', 'lib/Fresh.svelte', 'lib/Kept.svelte', 'lib/Moved.svelte',
+    ]
+    assert results['lib/Edited.svelte']['count'] == 4
+
+
+def test_since_counts_a_symlink_replaced_by_a_file(scanner, tmp_path, monkeypatch):
+    src = tmp_path / 'src' / 'lib'
+    src.mkdir(parents=True)
+    (src / 'Real.svelte').write_text('<div></div>\n')
+    (src / 'Link.svelte').symlink_to('Real.svelte')
+    git(tmp_path, 'init', '-q', '-b', 'main')
+    git(tmp_path, 'add', '.')
+    git(tmp_path, 'commit', '-qm', 'base')
+    monkeypatch.chdir(tmp_path)
+
+    (src / 'Link.svelte').unlink()
+    (src / 'Link.svelte').write_text('<p>Please stay here</p>\n')
+
+    changed, removed = git_changes('main')
+    assert changed == {'src/lib/Link.svelte': {1}}
+    assert removed == []
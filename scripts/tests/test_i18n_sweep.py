@@ -0,0 +1,56 @@
+"""Contract for scripts/i18n_sweep.py: the in-process scan → aggregate → render pipeline."""
+
+import json
+
+import i18n_sweep
+import sweep_report
+from scan_history import HistoryStore
+
+
+def _tree(root):
+    components = root / 'src' / 'lib' / 'components' / 'events'
+    components.mkdir(parents=True)
+    (components / 'EventCard.svelte').write_text('<p>Please wait for it</p>\n<h2>Upcoming events list</h2>\n')
+    (components / 'Clean.svelte').write_text('<p>{m.hello()}</p>\n')
+    (root / 'src' / 'routes').mkdir(parents=True)
+    (root / 'src' / 'routes' / '+page.svelte').write_text("<script>toast.error('Failed to load');</script>\n")
+
+
+def test_pipeline_matches_the_json_handoff(scanner, tmp_path, monkeypatch):
+    _tree(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    results = scanner.scan_all_files()
+    expected = sweep_report.generate_markdown(results, 3)
+
+    index, changed = i18n_sweep.sweep(results_file=tmp_path / 'results.json', sweep_file=tmp_path / 'sweep.md')
+    assert (tmp_path / 'sweep.md').read_text() == expected
+    assert (index.total_files, index.files, index.strings) == (3, 2, sum(e['count'] for e in results.values()))
+    assert changed
+    written = json.loads((tmp_path / 'results.json').read_text())
+    assert written == json.loads(json.dumps({key: {k: v for k, v in entry.items() if k != 'suggestions'} for key, entry in results.items()}))
+
+    assert i18n_sweep.sweep(sweep_file=tmp_path / 'sweep.md')[1] == []
+
+
+def test_results_are_written_with_their_duplicates(tmp_path, monkeypatch):
+    _tree(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    stale = tmp_path / 'duplicates.json'
+    stale.write_text('{"From an older scan": [["lib/Gone.svelte", 1], ["lib/Gone.svelte", 2]]}')
+    (tmp_path / 'src' / 'routes' / 'Other.svelte').write_text('<p>Please wait for it</p>\n')
+
+    i18n_sweep.sweep(sweep_file=tmp_path / 'sweep.md', duplicates_file=stale)
+    assert 'From an older scan' in stale.read_text()
+    i18n_sweep.sweep(results_file=tmp_path / 'results.json', sweep_file=tmp_path / 'sweep.md', duplicates_file=stale)
+    shared = [['lib/components/events/EventCard.svelte', 1], ['routes/Other.svelte', 1]]
+    assert json.loads(stale.read_text()) == {'Please wait': shared, 'Please wait for it': shared}
+
+
+def test_pipeline_records_the_run(tmp_path, monkeypatch):
+    _tree(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    history = HistoryStore(tmp_path / 'history.sqlite')
+    i18n_sweep.sweep(history=history, sweep_file=tmp_path / 'sweep.md')
+    assert history.latest_run_id() == 1
+    assert '## Burn-down' in (tmp_path / 'sweep.md').read_text()
+    history.close()
@@ -0,0 +1,63 @@
+"""Contract for scripts/message_index.py."""
+
+import json
+
+import pytest
+
+from message_index import MessageIndex, ngrams, normalize
+
+
+@pytest.fixture
+def index(tmp_path):
+    catalogs = {
+        'en': {
+            '$schema': 'https://inlang.com/schema/inlang-message-format',
+            'common': {'save': 'Save changes', 'loadError': 'Failed to load events.'},
+            'events': {'title': 'Upcoming events', 'empty': 'No events yet'},
+            'count': [{'match': {'n=one': '{count} event', 'n=*': '{count} events'}}],
+        },
+        'de': {'common': {'save': 'Änderungen speichern', 'loadError': ''}},
+        'it': {'common': {'save': 'Salva modifiche'}, 'events': {'title': 'Prossimi eventi'}},
+    }
+    for locale, tree in catalogs.items():
+        (tmp_path / f'{locale}.json').write_text(json.dumps(tree))
+    return MessageIndex.load(tmp_path)
+
+
+def test_normalize_ignores_case_space_placeholders_and_end_punctuation():
+    assert normalize('  Failed to  load {name}!') == 'failed to load {}'
+
+
+def test_exact_match_reports_translated_locales(index):
+    assert index.suggest('Save changes') == [
+        {'key': 'common.save', 'score': 1.0, 'locales': ['de', 'it']}
+    ]
+    assert index.suggest('Failed to load events')[0] == {
+        'key': 'common.loadError', 'score': 1.0, 'locales': [],
+    }
+
+
+def test_near_match_and_plural_forms(index):
+    assert [s['key'] for s in index.suggest('Upcoming event')] == ['events.title']
+    assert index.suggest('{n} events')[0]['key'] == 'count'
+    assert index.suggest('Completely unrelated text') == []
+
+
+def test_near_matches_agree_with_brute_force(index):
+    for query in ('Save change', 'No event', 'Failed to load', 'Upcoming', 'events'):
+        grams = ngrams(normalize(query))
+        expected = sorted(
+            (round(2 * len(grams & ngrams(v)) / (len(grams) + len(ngrams(v))), 3), key)
+            for v, keys in index.exact.items() if v != normalize(query)
+            for key in keys
+            if 2 * len(grams & ngrams(v)) / (len(grams) + len(ngrams(v))) >= 0.6 - 1e-9
+        )
+        found = sorted((round(score, 3), key) for score, key in index._near(normalize(query)))
+        assert found == expected, query
+
+
+def test_scanner_annotates_findings(scanner, index, tmp_path):
+    path = tmp_path / 'Thing.svelte'
+    path.write_text('<p>Save changes now</p>\n')
+    entry = scanner.result_entry(path, scanner.extract_hardcoded_strings(path), index)
+    assert entry['suggestions']['Save changes now'][0]['key'] == 'common.save'
@@ -0,0 +1,47 @@
+"""Contract for scripts/scan_cache.py, through hardcoded_strings.load_cache."""
+
+import os
+
+import pytest
+
+from conftest import write_tree
+
+
+def test_cache_reuses_findings_for_unchanged_files(scanner, tmp_path, monkeypatch):
+    paths = write_tree(tmp_path)
+    cache_file = tmp_path / 'cache.json'
+    cold = list(scanner.scan_files(paths, cache=scanner.load_cache(cache_file)))
+
+    scanned = []
+    real_scan_path = scanner.scan_path
+    monkeypatch.setattr(
+        scanner, 'scan_path', lambda p, d=None: scanned.append(p) or real_scan_path(p, d)
+    )
+    paths[2].write_text('<p>Please delete everything</p>\n')
+    warm = list(scanner.scan_files(paths, cache=scanner.load_cache(cache_file)))
+
+    assert scanned == [paths[2]]
+    assert [f[:2] for f in warm[2][1]] == [(1, 'Please delete'), (1, 'Please delete everything')]
+    assert [f for _, f in warm[:2]] == [f for _, f in cold[:2]]
+
+
+def test_cache_is_dropped_when_the_rules_change(scanner, tmp_path, monkeypatch):
+    paths = write_tree(tmp_path, count=2)
+    cache_file = tmp_path / 'cache.json'
+    list(scanner.scan_files(paths, cache=scanner.load_cache(cache_file)))
+    assert scanner.load_cache(cache_file).entries
+
+    monkeypatch.setattr(scanner, 'FALSE_POSITIVES', scanner.FALSE_POSITIVES | {'Extra'})
+    assert scanner.load_cache(cache_file).entries == {}
+
+
+def test_cache_rehashes_a_touched_file_without_rescanning(scanner, tmp_path, monkeypatch):
+    paths = write_tree(tmp_path, count=1)
+    cache_file = tmp_path / 'cache.json'
+    list(scanner.scan_files(paths, cache=scanner.load_cache(cache_file)))
+    paths[0].write_text(paths[0].read_text())  # same bytes, new mtime
+    os.utime(paths[0], ns=(1, 1))
+
+    monkeypatch.setattr(scanner, 'scan_findings', lambda content: pytest.fail('rescanned'))
+    (_, findings), = scanner.scan_files(paths, cache=scanner.load_cache(cache_file))
+    assert findings == [(1, 'Please save', 4, 'please')]
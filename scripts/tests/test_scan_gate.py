@@ -0,0 +1,53 @@
+"""Contract for scripts/scan_gate.py."""
+
+from pathlib import Path
+
+from conftest import write_tree
+from scan_gate import Baseline, gate_all_files, update_baseline
+from scan_history import fingerprint
+
+
+def test_gate_ignores_moved_lines_and_flags_new_strings(scanner, tmp_path, monkeypatch):
+    paths = write_tree(tmp_path, count=3)
+    monkeypatch.chdir(tmp_path)
+    baseline = Baseline(tmp_path / 'baseline.json')
+    assert update_baseline(baseline) == 3
+    assert gate_all_files(Baseline(baseline.path).load()) == []
+
+    paths[0].write_text('\n\n  <p>Please save item 0</p>\n')  # moved
+    paths[1].write_text('<p>Please save item 1</p>\n<p>Unable to connect</p>\n')
+    new = gate_all_files(Baseline(baseline.path).load())
+    assert [(key, finding[1]) for key, finding in new] == [
+        ('src/Comp1.svelte', 'Unable to connect'),
+    ]
+
+
+def test_gate_and_history_share_fingerprints(scanner, tmp_path, monkeypatch):
+    src = tmp_path / 'src' / 'lib'
+    src.mkdir(parents=True)
+    (src / 'client.ts').write_text("toast.error('Failed to save');\n")
+    monkeypatch.chdir(tmp_path)
+    history = scanner.HistoryStore(tmp_path / 'history.sqlite')
+    scanner.scan_all_files(history=history)
+    baseline = Baseline(tmp_path / 'baseline.json')
+    update_baseline(baseline)
+
+    recorded = {row[0] for row in history.db.execute('SELECT fingerprint FROM findings')}
+    history.close()
+    assert recorded == Baseline(baseline.path).load().fingerprints == {
+        fingerprint('lib/client.ts', 'quoted_single', 'Failed to save'),
+    }
+
+
+def test_gate_fail_fast_stops_scanning(scanner, tmp_path, monkeypatch):
+    paths = write_tree(tmp_path, count=4)
+    monkeypatch.chdir(tmp_path)
+    scanned = []
+    real_scan_path = scanner.scan_path
+    monkeypatch.setattr(
+        scanner, 'scan_path', lambda p, d=None: scanned.append(p) or real_scan_path(p, d)
+    )
+    monkeypatch.setattr(scanner, 'SCAN_WINDOW', 1)
+    new = gate_all_files(Baseline(tmp_path / 'missing.json').load(), fail_fast=True)
+    assert len(new) == 1 and new[0][0] == 'src/Comp0.svelte'
+    assert scanned == [Path('src/Comp0.svelte')]
@@ -0,0 +1,301 @@
+"""Contract for scripts/hardcoded_strings.py, behind scan-hardcoded-strings.py."""
+
+import json
+import re
+from pathlib import Path
+
+import pytest
+
+from conftest import REPO_ROOT, write_tree
+
+
+def legacy_should_exclude(scanner, line, match):
+    """The per-match exclusion the compiled matcher replaced, verbatim."""
+    for _, pattern in scanner.EXCLUDE_PATTERNS:
+        if re.search(pattern, line):
+            return True
+    if match.strip() in scanner.FALSE_POSITIVES:
+        return True
+    if '.' in match or '_' in match:
+        return True
+    if len(match.strip()) < 4:
+        return True
+    return False
+
+
+def legacy_line_findings(scanner, line):
+    """Every PATTERNS regex run on its own, as the scanner used to do it."""
+    found = []
+    for _, pattern in scanner.PATTERNS:
+        for match in re.finditer(pattern, line):
+            text = match.group(1) if match.groups() else match.group(0)
+            text = text.strip('"\'')
+            if not legacy_should_exclude(scanner, line, text):
+                found.append(text)
+    return found
+
+
+LINES = [
+    '<p>Please wait while we save</p>\n',
+    '<Button title="Failed to load events">Retry</Button>\n',
+    'toast.error("Unable to delete the event, sorry");\n',
+    "const msg = 'Are you sure you want to leave';\n",
+    '<span class="x">Do you want this</span>\n',
+    'Error: Something went wrong and Successfully saved\n',
+    "{m['common.save']()} 'Not translated here'\n",
+    '$state("Hello world")\n',
+    '<a href="https://example.com">Visit our site</a>\n',
+    '"Cancel" "Close" "Hello there" \'Back\'\n',
+    '"Hello world" "Another one"\n',
+    'plain line with nothing\n',
+    '1234\n',
+]
+
+
+@pytest.mark.parametrize('line', LINES)
+def test_matcher_parity_on_crafted_lines(scanner, line):
+    found = [text for *_, text in scanner.MATCHER.scan_line(line)]
+    assert found == legacy_line_findings(scanner, line)
+
+
+def test_matcher_parity_on_the_source_tree(scanner):
+    files = sorted((REPO_ROOT / 'src').rglob('*.svelte'))
+    if not files:
+        pytest.skip('no .svelte sources')
+    for path in files:
+        for line in path.read_text(encoding='utf-8').splitlines(keepends=True):
+            found = [text for *_, text in scanner.MATCHER.scan_line(line)]
+            assert found == legacy_line_findings(scanner, line), (path, line)
+
+
+def test_should_exclude_matches_legacy(scanner):
+    for line in LINES:
+        for text in ('Hello there', 'Save', 'a.b', 'abc'):
+            assert scanner.should_exclude(line, text) == legacy_should_exclude(scanner, line, text)
+
+
+def test_leading_literal_is_conservative(scanner):
+    assert scanner._leading_literal(r'(Failed to \w+)') == 'F'
+    assert scanner._leading_literal(r'\.svelte') == '.'
+    assert scanner._leading_literal(r'^\$') is None
+    assert scanner._leading_literal(r'a?b') is None
+    assert scanner._leading_literal(r'(a|b)') is None
+    assert scanner._leading_literal(r'[A-Z]x') is None
+
+
+def test_extract_dedupes_and_reports_first_line(scanner, tmp_path):
+    path = tmp_path / 'Thing.svelte'
+    path.write_text('<p>Please wait</p>\n<p>Please wait</p>\n<h1>Welcome aboard</h1>\n')
+    assert scanner.extract_hardcoded_strings(path) == [
+        (1, 'Please wait'),
+        (3, 'Welcome aboard'),
+    ]
+
+
+def test_parallel_scan_matches_serial_output(scanner, tmp_path, monkeypatch):
+    src = tmp_path / 'src'
+    for i in range(12):
+        (src / f'dir{i % 3}').mkdir(parents=True, exist_ok=True)
+        (src / f'dir{i % 3}' / f'Comp{i}.svelte').write_text(
+            f'<p>Please save item {i}</p>\n<h2>Welcome number {chr(65 + i)}</h2>\n'
+        )
+    monkeypatch.chdir(tmp_path)
+
+    scanner.scan_all_files(jobs=1)
+    serial = (tmp_path / 'i18n-scan-results.json').read_bytes()
+    scanner.scan_all_files(jobs=3)
+    assert (tmp_path / 'i18n-scan-results.json').read_bytes() == serial
+
+
+def test_scan_files_preserves_input_order(scanner, tmp_path):
+    paths = []
+    for i in range(9):
+        path = tmp_path / f'F{i}.svelte'
+        path.write_text(f'<p>Hello reader {i}</p>\n')
+        paths.append(path)
+    assert [p for p, _ in scanner.scan_files(paths, jobs=4)] == paths
+
+
+def test_line_index_matches_newline_counting(scanner):
+    content = 'one\n\ntwo\nthree\n'
+    index = scanner.LineIndex(scanner.split_lines(content))
+    for offset in range(len(content)):
+        assert index.line_of(offset) == content[:offset].count('\n') + 1
+
+
+def test_split_lines_matches_readlines(scanner, tmp_path):
+    path = tmp_path / 'x.svelte'
+    for text in ('a\nb\n', 'a\nb', '', '\n\n', 'a\r\nb\rc d\x0ce'):
+        path.write_bytes(text.encode())
+        with open(path, encoding='utf-8') as f:
+            assert scanner.split_lines(scanner.read_source(path.read_bytes())) == f.readlines()
+
+
+def test_html_pass_scales_to_very_long_files(scanner, monkeypatch):
+    indexes, lookups = [], []
+    real_init, real_bisect = scanner.LineIndex.__init__, scanner.bisect_right
+    monkeypatch.setattr(
+        scanner.LineIndex, '__init__', lambda self, lines: indexes.append(self) or real_init(self, lines)
+    )
+    monkeypatch.setattr(scanner, 'bisect_right', lambda a, x: lookups.append(x) or real_bisect(a, x))
+
+    block = '<div>\n  <p>Welcome to the party</p>\n</div>\n'
+    content = block * 10_000 + '<p>Goodbye for now</p>\n'
+    findings = scanner.scan_source(content)
+    assert findings == [(2, 'Welcome to the party'), (30_001, 'Goodbye for now')]
+    # One offset index per file and one binary search per text node (plus one
+    # per lexed region), never a scan of the text before each match.
+    regions = [r for r in scanner.lex(content) if r[0] in scanner.LINE_PASS_REGIONS]
+    assert len(indexes) == 1
+    assert len(lookups) == 10_001 + len(regions)
+
+
+def test_findings_carry_column_and_rule(scanner):
+    content = '<script>\n  toast("Please wait");\n</script>\n<p>Welcome back home</p>\n'
+    assert scanner.scan_findings(content) == [
+        (2, 'Please wait', 10, 'quoted_double'),
+        (4, 'Welcome back home', 4, 'html_text'),
+    ]
+
+
+def test_scan_files_streams_in_windows(scanner, tmp_path, monkeypatch):
+    paths = write_tree(tmp_path, count=7)
+    whole = list(scanner.scan_files(paths, jobs=2))
+    monkeypatch.setattr(scanner, 'SCAN_WINDOW', 3)
+    taken = []
+    windowed = scanner.scan_files((taken.append(p) or p for p in paths), jobs=2)
+    assert next(windowed) == whole[0]
+    assert len(taken) == 3  # only the first window has been read
+    assert [whole[0], *windowed] == whole
+
+
+def test_jsonl_output_is_untruncated_and_summarised(scanner, tmp_path, monkeypatch):
+    src = tmp_path / 'src'
+    src.mkdir()
+    (src / 'Big.svelte').write_text(
+        ''.join(f'<p>Please save item {chr(65 + i)}</p>\n' for i in range(12))
+    )
+    (src / 'Clean.svelte').write_text('<p>{m.hello()}</p>\n')
+    (src / 'Small.svelte').write_text('<p>Please wait for it</p>\n')
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(scanner.ScanSummary, 'TOP', 1)
+
+    summary = scanner.stream_all_files(tmp_path / 'findings.jsonl')
+
+    records = [json.loads(line) for line in (tmp_path / 'findings.jsonl').read_text().splitlines()]
+    big = [r for r in records if r['file'] == 'Big.svelte']
+    assert len(big) == 13  # 'Please save' plus every line's full text, none dropped
+    assert records[-2:] == [
+        {'file': 'Small.svelte', 'line': 1, 'column': 4, 'text': 'Please wait',
+         'priority': '🟡 MED', 'rule': 'please'},
+        {'file': 'Small.svelte', 'line': 1, 'column': 4, 'text': 'Please wait for it',
+         'priority': '🟡 MED', 'rule': 'html_text'},
+    ]
+    assert [r['file'] for r in records] == sorted(r['file'] for r in records)
+    assert (summary.files, summary.files_with_findings, summary.strings) == (3, 2, len(records))
+    assert [entry[2] for entry in summary._top] == ['Big.svelte']
+    assert not (tmp_path / 'i18n-scan-results.json').exists()
+
+
+def test_summary_top_ties_keep_scan_order(scanner):
+    summary = scanner.ScanSummary()
+    for name, count in [('a', 2), ('b', 3), ('c', 2), ('d', 1), ('e', 3)]:
+        summary.add(name, 'LOW', [(1, 'Text', 1, 'rule')] * count)
+    ranked = [entry[2] for entry in sorted(summary._top, reverse=True)]
+    assert ranked == ['b', 'e', 'a', 'c', 'd']
+
+
+def test_profiling_matcher_finds_exactly_what_the_matcher_finds(scanner):
+    profiler = scanner.ProfilingMatcher(scanner.PATTERNS, scanner.EXCLUDE_PATTERNS)
+    files = sorted((REPO_ROOT / 'src').rglob('*.svelte'))[::10]
+    for path in files:
+        content = path.read_text(encoding='utf-8')
+        assert scanner.scan_findings(content, profiler) == scanner.scan_findings(content), path
+
+
+def test_profile_counts_rules_and_false_positives(scanner, tmp_path, monkeypatch):
+    src = tmp_path / 'src'
+    src.mkdir()
+    (src / 'A.svelte').write_text(
+        "<script>\n"
+        "  toast('Please wait');\n"
+        "  const x = 'Delete';\n"
+        "</script>\n"
+        "<p>Cancel</p>\n"
+        '<div class="box" title="Please confirm"></div>\n'
+    )
+    monkeypatch.chdir(tmp_path)
+    profile = scanner.ScanProfile()
+    scanner.scan_all_files(profile=profile)
+
+    report = json.loads((tmp_path / scanner.PROFILE_FILE).read_text())
+    rules = report['rules']
+    assert report['files'] == 1
+    assert rules['exclude']['class_attr']['suppressions'] == 2  # quoted_double + please
+    assert rules['include']['please']['matches'] == 1
+    assert rules['screens']['exclude_any']['matches'] == 1
+    assert rules['include']['quoted_single']['suppressions'] == 1  # 'Delete'
+    assert rules['text_node']['html_text']['suppressions'] == 1  # Cancel
+    assert report['false_positives']['Delete'] == report['false_positives']['Cancel'] == 1
+    assert report['false_positives']['Back'] == 0
+    assert report['suppression_reasons'] == {'exclude_rule': 2, 'false_positive': 2}
+    assert [entry['file'] for entry in report['slowest_files']] == [str(Path('src', 'A.svelte'))]
+    assert json.loads((tmp_path / 'i18n-scan-results.json').read_text())['A.svelte']['count'] == 1
+
+
+def test_typescript_modules_get_the_line_rules_only(scanner, tmp_path):
+    module = tmp_path / 'state.svelte.ts'
+    module.write_text(
+        "import { toast } from 'svelte-sonner';\n"
+        "// Please ignore this comment\n"
+        "const markup = '<p>Welcome back home</p>';\n"
+        "toast.error('Failed to save');\n"
+    )
+    assert scanner.extract_hardcoded_strings(module) == [(4, 'Failed to save')]
+
+
+def test_scans_of_a_custom_file_set_are_not_recorded(scanner, tmp_path, monkeypatch):
+    write_tree(tmp_path, count=2)
+    monkeypatch.chdir(tmp_path)
+    history = tmp_path / 'history.sqlite'
+    common = ['--root', str(tmp_path), '--no-cache', '--history', str(history)]
+
+    scanner.main([*common, '--include', 'src/Comp0.svelte'])
+    scanner.main([*common, '--exclude', 'src/Comp1.svelte'])
+    assert not history.exists()
+    scanner.main(common)
+    store = scanner.HistoryStore(history)
+    assert [point.run.files for point in store.trend()] == [2]
+    store.close()
+
+
+def test_full_scans_are_recorded_in_the_history(scanner, tmp_path, monkeypatch):
+    src = tmp_path / 'src'
+    src.mkdir()
+    (src / 'A.svelte').write_text('<p>Please wait for it</p>\n')
+    (src / 'Clean.svelte').write_text('<p>{m.hello()}</p>\n')
+    monkeypatch.chdir(tmp_path)
+    history = scanner.HistoryStore(tmp_path / 'history.sqlite')
+
+    scanner.scan_all_files(history=history)
+    (src / 'A.svelte').write_text('<div></div>\n<p>Please wait for it</p>\n')
+    scanner.stream_all_files(tmp_path / 'findings.jsonl', history=history)
+
+    assert [(p.run.files, p.run.findings, p.new, p.fixed) for p in history.trend()] == [(2, 2, 2, 0), (2, 2, 0, 0)]
+    assert history.delta() == [('A.svelte', 0, 0, 2)]
+    assert history.db.execute('SELECT DISTINCT line FROM findings').fetchall() == [(2,)]
+    history.close()
+
+
+def test_columnar_output_holds_the_same_results(scanner, tmp_path, monkeypatch):
+    from columnar_results import COLUMNAR_RESULTS_FILE, ColumnarResults
+
+    src = tmp_path / 'src'
+    src.mkdir()
+    (src / 'A.svelte').write_text('<p>Please wait for it</p>\n<h2>Upcoming events list</h2>\n')
+    (src / 'Clean.svelte').write_text('<p>{m.hello()}</p>\n')
+    monkeypatch.chdir(tmp_path)
+    results = scanner.scan_all_files(columnar=True)
+    assert not (tmp_path / 'i18n-scan-results.json').exists()
+    with ColumnarResults(tmp_path / COLUMNAR_RESULTS_FILE) as columns:
+        assert dict(columns.items()) == json.loads(json.dumps(results))
@@ -0,0 +1,77 @@
+"""Contract for scripts/scan_history.py."""
+
+import pytest
+
+from scan_history import FileDelta, HistoryStore
+
+
+def _record(store, files, commit='abc1234'):
+    """Record a run from {path: [text, ...]}; fingerprints are path + text, lines count from 1."""
+    run = store.run(commit)
+    for path, texts in files.items():
+        run.add(path, [(f'{path}\0{text}', 'please', text, n, 1) for n, text in enumerate(texts, 1)])
+    return run.finish()
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = HistoryStore(tmp_path / 'history.sqlite')
+    yield store
+    store.close()
+
+
+def test_first_run_is_all_new(store):
+    run = _record(store, {'a/A.svelte': ['One', 'Two'], 'b/B.svelte': [], 'c/C.svelte': ['Three']})
+    assert store.get_run(run)[2:] == ('abc1234', 3, 3)
+    assert store.delta() == [FileDelta('a/A.svelte', 2, 0, 0), FileDelta('c/C.svelte', 1, 0, 0)]
+
+
+def test_delta_counts_new_fixed_and_unchanged(store):
+    _record(store, {'a/A.svelte': ['One', 'Two'], 'c/C.svelte': ['Three']})
+    # 'Two' moves a line down, 'One' is fixed, C is cleaned up, D is new.
+    _record(store, {'a/A.svelte': ['Padding', 'Two'], 'c/C.svelte': [], 'd/D.svelte': ['Four']})
+    assert store.delta() == [
+        FileDelta('a/A.svelte', new=1, fixed=1, unchanged=1),
+        FileDelta('c/C.svelte', new=0, fixed=1, unchanged=0),
+        FileDelta('d/D.svelte', new=1, fixed=0, unchanged=0),
+    ]
+    assert store.delta(1) == [FileDelta('a/A.svelte', 2, 0, 0), FileDelta('c/C.svelte', 1, 0, 0)]
+
+
+def test_reappearing_findings_are_new_again(store):
+    _record(store, {'A.svelte': ['One']})
+    _record(store, {'A.svelte': []})
+    _record(store, {'A.svelte': ['One']})
+    assert store.delta() == [FileDelta('A.svelte', 1, 0, 0)]
+    rows = store.db.execute('SELECT first_run, last_run FROM findings ORDER BY id').fetchall()
+    assert rows == [(1, 1), (3, 3)]
+
+
+def test_unchanged_findings_extend_one_row(store):
+    for _ in range(5):
+        _record(store, {'A.svelte': ['One', 'Two']})
+    assert store.db.execute('SELECT COUNT(*), MIN(first_run), MAX(last_run) FROM findings').fetchone() == (2, 1, 5)
+    assert store.delta() == [FileDelta('A.svelte', 0, 0, 2)]
+
+
+def test_trend_reports_new_and_fixed_per_run(store):
+    _record(store, {'A.svelte': ['One', 'Two', 'Three']})
+    _record(store, {'A.svelte': ['One', 'Four']})
+    _record(store, {'A.svelte': ['One']})
+    trend = store.trend()
+    assert [(point.run.id, point.run.findings, point.new, point.fixed) for point in trend] == [
+        (1, 3, 3, 0), (2, 2, 1, 2), (3, 1, 0, 1),
+    ]
+    assert [point.run.id for point in store.trend(limit=2)] == [2, 3]
+    assert [(point.new, point.fixed) for point in store.trend(limit=2)] == [(1, 2), (0, 1)]
+
+
+def test_history_persists_across_connections(tmp_path):
+    path = tmp_path / 'history.sqlite'
+    first = HistoryStore(path)
+    _record(first, {'A.svelte': ['One']})
+    first.close()
+    second = HistoryStore(path)
+    _record(second, {'A.svelte': ['One']})
+    assert second.delta() == [FileDelta('A.svelte', 0, 0, 1)]
+    second.close()
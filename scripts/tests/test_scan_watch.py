@@ -0,0 +1,62 @@
+"""Contract for scripts/scan_watch.py."""
+
+import json
+import os
+from pathlib import Path
+
+from conftest import write_tree
+from scan_watch import Watcher
+
+
+def test_watcher_rescans_only_changed_files(scanner, tmp_path, monkeypatch):
+    paths = write_tree(tmp_path, count=3)
+    monkeypatch.chdir(tmp_path)
+    watcher = Watcher(src_dir=Path('src'))
+    watcher.start()
+    assert watcher.poll() == []
+
+    scanned = []
+    real_scan_path = scanner.scan_path
+    monkeypatch.setattr(
+        scanner, 'scan_path', lambda p, d=None: scanned.append(p) or real_scan_path(p, d)
+    )
+    paths[1].write_text('<div>{count}</div>\n')
+    paths[2].write_text('<p>Please review this</p>\n<p>Unable to send</p>\n')
+    (tmp_path / 'src' / 'New.svelte').write_text('<p>Please add more</p>\n')
+    paths[0].unlink()
+
+    assert watcher.poll() == ['Comp0.svelte', 'Comp1.svelte', 'Comp2.svelte', 'New.svelte']
+    assert sorted(p.name for p in scanned) == ['Comp1.svelte', 'Comp2.svelte', 'New.svelte']
+    results = json.loads((tmp_path / 'i18n-scan-results.json').read_text())
+    assert list(results) == ['Comp2.svelte', 'New.svelte']
+    assert watcher.total_strings == sum(d['count'] for d in results.values())
+
+
+def test_watcher_keeps_the_duplicate_index_current(scanner, tmp_path, monkeypatch):
+    paths = write_tree(tmp_path, count=3)
+    monkeypatch.chdir(tmp_path)
+    watcher = Watcher(src_dir=Path('src'))
+    watcher.start()
+
+    paths[0].write_text('<p>Please save item 1</p>\n')
+    paths[2].unlink()
+    watcher.poll()
+    duplicates = json.loads((tmp_path / 'i18n-scan-duplicates.json').read_text())
+    assert duplicates == {'Please save': [['Comp1.svelte', 1], ['Comp0.svelte', 1]]}
+
+
+def test_watcher_saves_the_cache_on_its_own_schedule(scanner, tmp_path, monkeypatch):
+    paths = write_tree(tmp_path, count=2)
+    monkeypatch.chdir(tmp_path)
+    cache = scanner.load_cache(tmp_path / 'cache.json')
+    watcher = Watcher(src_dir=Path('src'), cache=cache)
+    watcher.start()
+    cache_stamp = os.stat(cache.path).st_mtime_ns
+
+    paths[0].write_text('<p>Unable to connect</p>\n')
+    watcher.poll()
+    assert os.stat(cache.path).st_mtime_ns == cache_stamp and cache.dirty
+
+    watcher.save_cache()
+    saved = json.loads(cache.path.read_text())['files']['src/Comp0.svelte']
+    assert not cache.dirty and saved[3][0][1] == 'Unable to connect'
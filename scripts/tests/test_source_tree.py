@@ -0,0 +1,110 @@
+"""Contract for scripts/source_tree.py."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+import source_tree
+from source_tree import IgnoreRules, SourceWalker, glob_regex
+
+from conftest import REPO_ROOT
+
+
+def _touch(root, *paths):
+    for path in paths:
+        (root / path).parent.mkdir(parents=True, exist_ok=True)
+        (root / path).write_text('')
+
+
+@pytest.fixture
+def tree(tmp_path):
+    _touch(
+        tmp_path,
+        'src/App.svelte',
+        'src/routes/+page.svelte',
+        'src/routes/a.svelte',
+        'src/routes/a/b.svelte',
+        'src/routes/a-b/c.svelte',
+        'src/lib/util.ts',
+        'src/lib/state.svelte.ts',
+        'src/lib/util.test.ts',
+        'src/lib/types.d.ts',
+        'src/lib/test-utils/Wrapper.svelte',
+        'src/lib/paraglide/messages.js',
+        'src/lib/api/generated/client.gen.ts',
+        'src/routes/helper.ts',
+        'src/node_modules/pkg/Thing.svelte',
+        'src/.svelte-kit/Gen.svelte',
+        'src/vendor/Vendored.svelte',
+        'node_modules/pkg/index.ts',
+        'other/Outside.svelte',
+    )
+    (tmp_path / '.gitignore').write_text('# vendored\n/src/vendor/\n')
+    return tmp_path
+
+
+def test_walk_selects_sources_in_sorted_path_order(tree):
+    found = list(SourceWalker(tree))
+    assert found == [
+        Path('src/App.svelte'),
+        Path('src/lib/state.svelte.ts'),
+        Path('src/lib/util.ts'),
+        Path('src/routes/+page.svelte'),
+        Path('src/routes/a/b.svelte'),
+        Path('src/routes/a-b/c.svelte'),
+        Path('src/routes/a.svelte'),
+    ]
+    assert [tree / path for path in found] == sorted(
+        tree / path for path in found
+    )
+
+
+def test_walk_never_opens_pruned_directories(tree, monkeypatch):
+    opened = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(source_tree.os, 'scandir', lambda path: opened.append(Path(path)) or real_scandir(path))
+    list(SourceWalker(tree))
+    visited = {path.relative_to(tree).as_posix() for path in opened}
+    for pruned in [
+        'node_modules', 'other', 'src/node_modules', 'src/.svelte-kit', 'src/vendor',
+        'src/lib/paraglide', 'src/lib/api/generated', 'src/lib/test-utils',
+    ]:
+        assert pruned not in visited
+
+
+def test_include_and_exclude_globs(tree):
+    walker = SourceWalker(tree, include=['src/routes/**/*.svelte'], exclude=['**/a/**'])
+    assert list(walker) == [
+        Path('src/routes/+page.svelte'), Path('src/routes/a-b/c.svelte'), Path('src/routes/a.svelte'),
+    ]
+    assert walker.selects('src/routes/a.svelte')
+    assert not walker.selects('src/routes/a/b.svelte')
+    assert not walker.selects('src/lib/util.ts')
+
+
+def test_selects_agrees_with_the_walk_on_the_repo():
+    walker = SourceWalker(REPO_ROOT)
+    found = {path.as_posix() for path in walker}
+    assert found
+    for path in (REPO_ROOT / 'src').rglob('*'):
+        rel = path.relative_to(REPO_ROOT).as_posix()
+        if path.is_file():
+            assert walker.selects(rel) == (rel in found), rel
+
+
+def test_glob_regex():
+    assert glob_regex('src/**/*.svelte').match('src/App.svelte')
+    assert glob_regex('src/**/*.svelte').match('src/a/b/App.svelte')
+    assert not glob_regex('src/*.svelte').match('src/a/App.svelte')
+    assert glob_regex('**/*.d.ts').match('types.d.ts')
+
+
+def test_ignore_rules_follow_gitignore():
+    rules = IgnoreRules(['*.log', 'build/', '/src/gen', '!keep.log', '# comment'])
+    assert rules.ignores('a/b.log', 'b.log', False)
+    assert not rules.ignores('keep.log', 'keep.log', False)
+    assert rules.ignores('x/build', 'build', True)
+    assert not rules.ignores('x/build', 'build', False)
+    assert rules.ignores('src/gen', 'gen', True)
+    assert not rules.ignores('lib/src/gen', 'gen', True)
@@ -0,0 +1,78 @@
+"""Contract for scripts/svelte_corpus.py."""
+
+import hashlib
+from itertools import islice
+
+import pytest
+
+from svelte_corpus import BASE_FILES, CorpusSpec, generate, iter_corpus
+
+
+def _digest(spec):
+    digest = hashlib.sha256()
+    for path, content in iter_corpus(spec):
+        digest.update(str(path).encode() + b'\0' + content.encode())
+    return digest.hexdigest()
+
+
+def test_corpus_is_deterministic_per_spec():
+    spec = CorpusSpec(scale=0.05)
+    assert _digest(spec) == _digest(CorpusSpec(scale=0.05))
+    assert _digest(spec) != _digest(CorpusSpec(scale=0.05, seed=1))
+
+
+def test_scale_sets_the_file_count():
+    assert CorpusSpec().files == BASE_FILES
+    assert CorpusSpec(scale=10).files == 10 * BASE_FILES
+    paths = [path for path, _ in iter_corpus(CorpusSpec(scale=0.5))]
+    assert len(paths) == len(set(paths)) == BASE_FILES // 2
+    assert all(path.suffix == '.svelte' and path.parts[0] == 'src' for path in paths)
+
+
+def test_density_controls_findings(scanner):
+    def findings(density):
+        spec = CorpusSpec(scale=0.05, density=density)
+        return sum(len(scanner.scan_source(content)) for _, content in iter_corpus(spec))
+
+    assert findings(0.0) < findings(0.05) < findings(0.3)
+
+
+def test_outliers_are_long_files():
+    def longest(rate):
+        return max(content.count('\n') for _, content in iter_corpus(CorpusSpec(scale=0.2, outlier_rate=rate)))
+
+    assert longest(0.5) > 2 * longest(0.0)
+
+
+def test_generate_reuses_a_matching_corpus(tmp_path):
+    spec = CorpusSpec(scale=0.01)
+    generate(spec, tmp_path)
+    files = sorted(tmp_path.rglob('*.svelte'))
+    assert len(files) == spec.files
+    mtimes = [path.stat().st_mtime_ns for path in files]
+
+    generate(spec, tmp_path)
+    assert [path.stat().st_mtime_ns for path in files] == mtimes
+    with pytest.raises(FileExistsError):
+        generate(CorpusSpec(scale=0.01, seed=2), tmp_path)
+
+
+def test_an_interrupted_generate_leaves_no_partial_corpus(tmp_path, monkeypatch):
+    import svelte_corpus
+
+    spec = CorpusSpec(scale=0.01)
+    root = tmp_path / 'corpus'
+
+    def interrupted(spec):
+        yield from islice(iter_corpus(spec), 3)
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(svelte_corpus, 'iter_corpus', interrupted)
+    with pytest.raises(KeyboardInterrupt):
+        generate(spec, root)
+    assert list(tmp_path.iterdir()) == []
+
+    monkeypatch.undo()
+    generate(spec, root)
+    assert len(list(root.rglob('*.svelte'))) == spec.files
+    assert list(tmp_path.iterdir()) == [root]
@@ -0,0 +1,49 @@
+"""Contract for scripts/svelte_sections.py and the scanner's use of it."""
+
+from svelte_sections import COMMENT, IMPORT, MARKUP, SCRIPT, STYLE, lex
+
+SOURCE = '''<script lang="ts">
+  import { a,
+    b } from '$lib/x';
+  // don't "Hello world"
+  const s = 'Please wait // not a comment';
+  /* block "Are you sure" */
+  const f = (a) => a > Some.value;
+</script>
+
+<!-- "Hello comment" -->
+<p>Welcome home</p>
+<style>
+  .a::before { content: "Hello style"; }
+</style>
+'''
+
+
+def regions(source):
+    return [(kind, source[start:end]) for kind, start, end in lex(source)]
+
+
+def test_regions_cover_the_source_in_order():
+    spans = list(lex(SOURCE))
+    assert spans[0][1] == 0 and spans[-1][2] == len(SOURCE)
+    assert all(a[2] == b[1] for a, b in zip(spans, spans[1:]))
+
+
+def test_lexer_classifies_each_region():
+    found = regions(SOURCE)
+    assert (IMPORT, "  import { a,\n    b } from '$lib/x';") in found
+    assert (COMMENT, '// don\'t "Hello world"') in found
+    assert (COMMENT, '/* block "Are you sure" */') in found
+    assert (COMMENT, '<!-- "Hello comment" -->') in found
+    assert (STYLE, '<style>\n  .a::before { content: "Hello style"; }\n</style>') in found
+    assert (MARKUP, '\n<p>Welcome home</p>\n') in found
+    script = ''.join(text for kind, text in found if kind == SCRIPT)
+    assert "'Please wait // not a comment'" in script
+
+
+def test_capitalised_components_are_markup():
+    assert [kind for kind, _ in regions('<Style>Hi</Style>\n')] == [MARKUP]
+
+
+def test_scanner_skips_style_comments_imports_and_script_text_nodes(scanner):
+    assert scanner.scan_source(SOURCE) == [(5, 'Please wait'), (11, 'Welcome home')]
@@ -0,0 +1,28 @@
+"""Contract for scripts/sweep_model.py."""
+
+import pytest
+
+from sweep_model import MAX_STRINGS, FileResult
+
+
+def test_entries_round_trip():
+    entry = {'priority': '🔴 HIGH', 'count': 3, 'strings': [[4, 'Save now'], [9, 'Go back']]}
+    result = FileResult.from_entry('lib/components/events/A.svelte', entry)
+    assert result.strings == ((4, 'Save now'), (9, 'Go back'))
+    assert result.to_entry() == entry
+
+
+def test_results_are_slotted_and_share_strings():
+    first = FileResult.build(''.join(['lib/', 'A.svelte']), ''.join(['🟢 ', 'LOW']), 1, [(1, ''.join(['Can', 'cel']))])
+    second = FileResult.build('lib/B.svelte', '🟢 LOW', 1, [(7, 'Cancel')])
+    assert first.priority is second.priority
+    assert first.strings[0][1] is second.strings[0][1]
+    with pytest.raises(AttributeError):
+        first.extra = True
+
+
+def test_build_keeps_the_first_samples_and_trimmed_shares_unchanged_results():
+    result = FileResult.build('A.svelte', '🔴 HIGH', 30, ((n, f'Text {n}') for n in range(30)))
+    assert len(result.strings) == MAX_STRINGS and result.count == 30
+    assert result.trimmed(5).strings == result.strings[:5]
+    assert result.trimmed(MAX_STRINGS) is result
@@ -0,0 +1,77 @@
+"""Contract for scripts/theme_fixes.py (audit-brand-themes.py --suggest-fixes)."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from brand_themes import audit, parse_themes
+from theme_fixes import ConstraintIndex, FixSolver, apply_fixes, css_diff
+
+SCRIPTS = Path(__file__).resolve().parent.parent
+APP_CSS = (SCRIPTS.parent / 'src' / 'app.css').read_text()
+
+
+def _red_css():
+    css = APP_CSS.replace('--muted-foreground: 268 18% 32%', '--muted-foreground: 268 18% 50%', 1)
+    return css.replace('--poster-ink: 173 40% 8%', '--poster-ink: 173 40% 30%', 1)
+
+
+def test_index_maps_tokens_to_the_rows_that_read_them():
+    index = ConstraintIndex()
+    kinds = {constraint.kind for constraint in index.involving('poster-ink')}
+    assert kinds == {'pair', 'recipe'}
+    separation = [c.row for c in index.involving('destructive') if c.kind == 'separation']
+    assert ('destructive', 'destructive-text') not in separation and ('primary', 'destructive') in separation
+    assert index.involving('no-such-token') == []
+
+
+def test_fixes_clear_the_audit_and_reach_the_dark_theme_that_inherits():
+    css = _red_css()
+    themes = parse_themes(css)
+    assert not audit(themes).ok
+    solver = FixSolver(themes)
+    assert solver._reached('default', 'light', 'poster-ink') == [('default', 'light'), ('default', 'dark')]
+    assert solver._reached('default', 'light', 'muted-foreground') == [('default', 'light')]
+
+    fixes = solver.solve()
+    assert [(fix.token, fix.mode, fix.new) for fix in fixes] == [
+        ('poster-ink', 'light', (173.0, 40.0, 13.0)),
+        ('muted-foreground', 'light', (268.0, 18.0, 42.0)),
+    ]
+    assert 'muted-foreground on muted [muted text on muted bg]' in fixes[1].clears
+    assert solver.unfixed == []
+    assert audit(parse_themes(apply_fixes(css, fixes))).ok
+
+    diff = css_diff(css, fixes)
+    assert diff.startswith('--- a/src/app.css\n+++ b/src/app.css\n')
+    assert '-\t\t--poster-ink: 173 40% 30%; /* Ink #0D1E1C */\n+\t\t--poster-ink: 173 40% 13%; /* Ink #0D1E1C */\n' in diff
+
+
+def test_confusable_semantic_colors_are_separated_by_lightness():
+    css = APP_CSS.replace('--info: 226 70% 32%', '--info: 150 65% 30%', 1)
+    themes = parse_themes(css)
+    assert audit(themes).confusables
+    solver = FixSolver(themes)
+    (fix,) = solver.solve()
+    assert fix.token in ('success', 'info') and fix.new[:2] == fix.old[:2]
+    assert audit(parse_themes(apply_fixes(css, [fix]))).ok
+
+
+def test_unknown_tokens_are_reported_not_fixed():
+    css = APP_CSS.replace('--destructive-text: 350 78% 30%', '--destructive-txt: 350 78% 30%', 1)
+    solver = FixSolver(parse_themes(css))
+    solver.solve()
+    assert solver.fixes == []
+    assert solver.unfixed[0] == '--destructive-text is not defined (default / light) [text-destructive on page]'
+
+
+def test_cli_prints_the_fixes_as_a_diff(tmp_path):
+    path = tmp_path / 'app.css'
+    path.write_text(_red_css())
+    cli = subprocess.run(
+        [sys.executable, str(SCRIPTS / 'audit-brand-themes.py'), 'app.css', '--suggest-fixes'],
+        capture_output=True, text=True, cwd=tmp_path,
+    )
+    assert cli.returncode == 1
+    assert '  --poster-ink (default / light): 173 40% 30% -> 173 40% 13%' in cli.stdout
+    assert '+++ b/app.css' in cli.stdout
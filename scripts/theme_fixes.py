@@ -0,0 +1,292 @@
+"""Suggest the smallest token edits that turn a red brand theme audit green.
+
+When the audit fails, the fix is almost always to nudge one token's lightness
+in app.css until the pair passes, without pushing any other pair that token
+takes part in below its floor, in either mode. FixSolver does that search.
+
+A ConstraintIndex maps every token to the rows that read it: the TEXT_PAIRS
+and COMPOSITED_PAIRS rows naming it and its colorblind-separation pairs. For
+each failing row the solver tries the row's tokens one at a time. It moves a
+token's lightness (and, with `saturation`, its saturation) one whole percent
+at a time, smallest total change first. A step is kept once every row that
+token takes part in passes in every theme the edit reaches. That is the mode
+whose block declares the token, plus dark when it inherits the value from
+:root. Each trial re-measures only those rows, on themes derived from the
+current ones, so the colors of every other token are reused.
+
+Fixes are applied as they are found, so later failures are solved against
+the palette as already fixed. The result can be printed as a unified diff of
+app.css, ready for `git apply`.
+"""
+
+import difflib
+from collections import defaultdict
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from brand_themes import (
+    COMPOSITED_PAIRS, CONFUSABLE_DELTA_E, CVD, FULL_SEVERITY, SEMANTIC, SEMANTIC_EXEMPT, TEXT_PAIRS, TOKEN_RE,
+    PairCheck, RecipeCheck, Separation, Theme, UnknownToken, audit, deltaE, iter_blocks, recipe_ratio,
+)
+
+HSL = Tuple[float, float, float]
+# app.css writes whole percentages; so do the suggestions.
+STEP = 1
+MAX_CHANGE = 100
+
+
+class Constraint(NamedTuple):
+    """One row of the contract: a text pair, a composited recipe or a separation pair."""
+
+    kind: str  # "pair", "recipe" or "separation"
+    row: tuple
+    tokens: Tuple[str, ...]
+
+    @property
+    def need(self) -> float:
+        if self.kind == "pair":
+            return self.row[2]
+        if self.kind == "recipe":
+            return self.row[5]
+        return CONFUSABLE_DELTA_E
+
+    def measure(self, theme: Theme, severities: Sequence[float] = (FULL_SEVERITY,)) -> Optional[float]:
+        """The row's contrast ratio (or worst simulated dE) in `theme`; None where it does not apply."""
+        if any(token not in theme for token in self.tokens):
+            return None
+        if self.kind == "pair":
+            fg, bg, _, _ = self.row
+            return theme.contrast(fg, bg)
+        if self.kind == "recipe":
+            fg, fg_a, wash, wash_a, base, _, modes, _ = self.row
+            if theme.mode not in modes:
+                return None
+            return recipe_ratio(theme, fg, fg_a, wash, wash_a, base)
+        a, b = self.row
+        return min(
+            deltaE(theme.simulated(a, kind, severity), theme.simulated(b, kind, severity))
+            for kind in CVD for severity in severities
+        )
+
+    def margin(self, theme: Theme, severities: Sequence[float] = (FULL_SEVERITY,)) -> Optional[float]:
+        """How far the row clears its floor in `theme` (>= 1 passes); None where it does not apply."""
+        value = self.measure(theme, severities)
+        return None if value is None else value / self.need
+
+    def describe(self) -> str:
+        if self.kind == "pair":
+            return f"{self.row[0]} on {self.row[1]} [{self.row[3]}]"
+        if self.kind == "recipe":
+            fg, fg_a, wash, wash_a, base, _, _, note = self.row
+            recipe = RecipeCheck(fg, fg_a, wash, wash_a, base, 0, note, 0).subject
+            return f"{recipe} [{note}]"
+        return f"{self.row[0]} vs {self.row[1]} [colorblind separation]"
+
+
+class ConstraintIndex:
+    """Token -> the constraints that read it."""
+
+    def __init__(self, pairs=TEXT_PAIRS, recipes=COMPOSITED_PAIRS, semantic=SEMANTIC):
+        self.constraints: List[Constraint] = []
+        for row in pairs:
+            self.constraints.append(Constraint("pair", row, (row[0], row[1])))
+        for row in recipes:
+            fg, _, wash, _, base = row[:5]
+            self.constraints.append(Constraint("recipe", row, tuple(t for t in (fg, wash, base) if t is not None)))
+        for i, a in enumerate(semantic):
+            for b in semantic[i + 1:]:
+                if frozenset((a, b)) not in SEMANTIC_EXEMPT:
+                    self.constraints.append(Constraint("separation", (a, b), (a, b)))
+        self.by_token: Dict[str, List[Constraint]] = defaultdict(list)
+        for constraint in self.constraints:
+            for token in dict.fromkeys(constraint.tokens):
+                self.by_token[token].append(constraint)
+        self._pairs = {(c.row[0], c.row[1], c.row[3]): c for c in self.constraints if c.kind == "pair"}
+        self._recipes = {c.row[:5] + (c.row[7],): c for c in self.constraints if c.kind == "recipe"}
+        self._separation = {c.row: c for c in self.constraints if c.kind == "separation"}
+
+    def involving(self, token: str) -> List[Constraint]:
+        return self.by_token.get(token, [])
+
+    def for_check(self, check) -> Optional[Constraint]:
+        """The constraint behind an audit result row."""
+        if isinstance(check, PairCheck):
+            return self._pairs.get((check.fg, check.bg, check.note))
+        if isinstance(check, RecipeCheck):
+            return self._recipes.get((check.fg, check.fg_alpha, check.wash, check.wash_alpha, check.base, check.note))
+        if isinstance(check, Separation):
+            return self._separation.get((check.a, check.b))
+        return None
+
+
+class TokenFix(NamedTuple):
+    """Set `token` in the (brand, mode) block that declares it from `old` to `new`."""
+
+    brand: str
+    mode: str
+    token: str
+    old: HSL
+    new: HSL
+    clears: List[str]
+
+    @property
+    def change(self) -> float:
+        return abs(self.new[2] - self.old[2]) + abs(self.new[1] - self.old[1])
+
+
+def format_hsl(hsl: HSL) -> str:
+    h, s, ll = hsl
+    return f"{h:g} {s:g}% {ll:g}%"
+
+
+def _steps(hsl: HSL, saturation: bool) -> Iterator[List[HSL]]:
+    """Candidate values, one group per total change, smallest first."""
+    h, s, ll = hsl
+    for change in range(STEP, MAX_CHANGE + 1, STEP):
+        group = []
+        for ds in range(0, change + 1, STEP) if saturation else (0,):
+            dl = change - ds
+            for sign_l in ((1, -1) if dl else (1,)):
+                for sign_s in ((1, -1) if ds else (1,)):
+                    new_s, new_l = s + sign_s * ds, ll + sign_l * dl
+                    if 0 <= new_s <= 100 and 0 <= new_l <= 100:
+                        group.append((h, new_s, new_l))
+        if not group:
+            return
+        yield group
+
+
+class FixSolver:
+    """Search for token edits that clear the audit's failures; see the module docstring."""
+
+    def __init__(
+        self, themes: Dict[Tuple[str, str], Theme], index: Optional[ConstraintIndex] = None,
+        saturation: bool = False, severities: Sequence[float] = (FULL_SEVERITY,),
+    ):
+        self.themes = dict(themes)
+        self.index = index or ConstraintIndex()
+        self.saturation = saturation
+        self.severities = severities
+        self.fixes: List[TokenFix] = []
+        self.unfixed: List[str] = []
+
+    def _block(self, brand: str, mode: str, token: str) -> Optional[str]:
+        """The mode of the block whose value of `token` the (brand, mode) theme uses."""
+        theme = self.themes[(brand, mode)]
+        if token in theme.declared:
+            return mode
+        light = self.themes.get((brand, "light"))
+        return "light" if light is not None and token in light.declared else None
+
+    def _reached(self, brand: str, block: str, token: str) -> List[Tuple[str, str]]:
+        """Every theme an edit to `token` in the (brand, block) block changes."""
+        keys = [(brand, block)]
+        dark = self.themes.get((brand, "dark"))
+        if block == "light" and dark is not None and token not in dark.declared:
+            keys.append((brand, "dark"))
+        return keys
+
+    def _margin(self, themes: Sequence[Theme], token: str) -> Optional[float]:
+        """The tightest margin among the rows that read `token`; None if there are none."""
+        margins = [
+            margin for theme in themes for constraint in self.index.involving(token)
+            if (margin := constraint.margin(theme, self.severities)) is not None
+        ]
+        return min(margins) if margins else None
+
+    def solve_token(self, brand: str, block: str, token: str) -> Optional[TokenFix]:
+        keys = self._reached(brand, block, token)
+        old = self.themes[(brand, block)].tokens[token]
+        failing = [
+            constraint.describe() for constraint in self.index.involving(token)
+            if any((m := constraint.margin(self.themes[key], self.severities)) is not None and m < 1 for key in keys)
+        ]
+        for group in _steps(old, self.saturation):
+            best, best_margin = None, 1.0
+            for new in group:
+                trial = [self.themes[key].derive({token: new}) for key in keys]
+                margin = self._margin(trial, token)
+                if margin is not None and margin >= best_margin:
+                    best, best_margin = new, margin
+            if best is not None:
+                return TokenFix(brand, block, token, old, best, failing)
+        return None
+
+    def apply(self, fix: TokenFix) -> None:
+        for key in self._reached(fix.brand, fix.mode, fix.token):
+            self.themes[key] = self.themes[key].derive({fix.token: fix.new})
+        self.fixes.append(fix)
+
+    def _still_failing(self, brand: str, mode: str, constraint: Constraint) -> bool:
+        margin = constraint.margin(self.themes[(brand, mode)], self.severities)
+        return margin is not None and margin < 1
+
+    def solve(self) -> List[TokenFix]:
+        """Fix every failure the audit reports that one token edit can clear."""
+        result = audit(self.themes, severities=self.severities)
+        for theme in result.themes:
+            failures = [check for check in theme.pairs + theme.composited if not check.ok]
+            failures += [pair for pair in theme.separation if pair.confusable]
+            for check in failures:
+                where = f"{theme.brand} / {theme.mode}"
+                if isinstance(check, UnknownToken):
+                    self.unfixed.append(f"--{check.token} is not defined ({where}) [{check.note}]")
+                    continue
+                constraint = self.index.for_check(check)
+                if constraint is None or not self._still_failing(theme.brand, theme.mode, constraint):
+                    continue
+                candidates = []
+                for token in dict.fromkeys(constraint.tokens):
+                    block = self._block(theme.brand, theme.mode, token)
+                    if block is not None:
+                        fix = self.solve_token(theme.brand, block, token)
+                        if fix is not None:
+                            candidates.append(fix)
+                if candidates:
+                    # The edit that clears the most failing rows per percent
+                    # changed, so one token fixing three rows beats another
+                    # that fixes only this one for a little less.
+                    self.apply(min(candidates, key=lambda fix: (fix.change / len(fix.clears), fix.change)))
+                else:
+                    self.unfixed.append(f"{constraint.describe()} ({where}): no single-token fix")
+        return self.fixes
+
+
+def declaration_spans(css: str) -> Dict[Tuple[str, str, str], Tuple[int, int]]:
+    """(brand, mode, token) -> the span of the `H S% L%` value its theme uses (the last declaration)."""
+    spans = {}
+    for brand, mode, offset, body in iter_blocks(css):
+        for m in TOKEN_RE.finditer(body):
+            spans[(brand, mode, m.group(1))] = (offset + m.start(2), offset + m.end(4) + 1)
+    return spans
+
+
+def apply_fixes(css: str, fixes: Sequence[TokenFix]) -> str:
+    spans = declaration_spans(css)
+    edits = sorted(
+        (spans[(fix.brand, fix.mode, fix.token)], format_hsl(fix.new)) for fix in fixes
+    )
+    for (start, end), value in reversed(edits):
+        css = css[:start] + value + css[end:]
+    return css
+
+
+def css_diff(css: str, fixes: Sequence[TokenFix], path: str = "src/app.css") -> str:
+    """The fixes as a unified diff of the stylesheet, for `git apply`."""
+    fixed = apply_fixes(css, fixes)
+    return "".join(difflib.unified_diff(
+        css.splitlines(keepends=True), fixed.splitlines(keepends=True), f"a/{path}", f"b/{path}",
+    ))
+
+
+def fix_lines(solver: FixSolver) -> Iterator[str]:
+    """The solver's suggestions as the command line prints them."""
+    yield ""
+    yield "=== suggested fixes ==="
+    for fix in solver.fixes:
+        yield f"  --{fix.token} ({fix.brand} / {fix.mode}): {format_hsl(fix.old)} -> {format_hsl(fix.new)}"
+        for row in fix.clears:
+            yield f"      clears {row}"
+    for row in solver.unfixed:
+        yield f"  UNFIXED {row}"
+    if not solver.fixes and not solver.unfixed:
+        yield "  nothing to fix"